@@ -3,16 +3,17 @@ Provides Dimension objects for tracking the properties of a value,
 axis or map dimension. Also supplies the Dimensioned abstract
 baseclass for classes that accept Dimension values.
 """
-from operator import itemgetter
 
 try:
     from cyordereddict import OrderedDict
 except:
     from collections import OrderedDict
 
+import weakref
+
 import param
 
-from ..core.util import sanitize_identifier, max_range, find_range
+from ..core.util import sanitize_identifier, max_range, find_range, compile_spec
 from .options import Store, StoreOptions
 from .pprint import PrettyPrinter
 
@@ -29,6 +30,13 @@ class Dimension(param.Parameterized):
     In addition, Dimensions can be declared as cyclic, support
     categorical data using a finite set of allowed, ordered values and
     support a custom, pretty-printed representation.
+
+    Dimensions are immutable and interned, so that Dimensions
+    declared with the same parameters are the same object. Assigning
+    to a parameter of an existing Dimension raises an AttributeError,
+    a modified Dimension is derived by calling it with the new
+    parameters instead. For the same reason the declared values are
+    stored as a tuple.
     """
 
     name = param.String(doc="""
@@ -61,10 +69,11 @@ class Dimension(param.Parameterized):
         instance, the string 'm' may be used represent units of meters
         and 's' to represent units of seconds.""")
 
-    values = param.ClassSelector(class_=(str, list), default=[], doc="""
+    values = param.ClassSelector(class_=(str, list, tuple), default=(), doc="""
         Optional set of allowed values for the dimension that can also
-        be used to retain a categorical ordering. Setting values to
-        'initial' indicates that the values will be added during construction.""")
+        be used to retain a categorical ordering, stored as a tuple.
+        Setting values to 'initial' indicates that the values will be
+        added during construction.""")
 
     format_string = param.String(default="{name}: {val}{unit}", doc="""
         Format string to specify how pprint_value_string is generated. Valid
@@ -75,15 +84,84 @@ class Dimension(param.Parameterized):
     # Defines default formatting by type
     type_formatters = {}
 
+    # Interned Dimensions keyed by their class and parameters
+    _interned = weakref.WeakValueDictionary()
+
+    def __new__(cls, name=None, **params):
+        """
+        Dimensions are immutable and interned, returning an existing
+        Dimension if one with the same parameters is still alive.
+        """
+        if isinstance(name, Dimension):
+            if not params and type(name) is cls:
+                return name
+            params = dict(name.get_param_values(), **params)
+        elif name is not None:
+            params = dict(params, name=name)
+        key = cls._spec_key(params) if 'name' in params else None
+        dimension = cls._interned.get(key) if key is not None else None
+        if dimension is None:
+            dimension = super(Dimension, cls).__new__(cls)
+            if key is not None:
+                cls._interned[key] = dimension
+        return dimension
+
+
+    @classmethod
+    def _spec_key(cls, params):
+        """
+        Returns a hashable key for the parameters, omitting any that
+        match their defaults, or None if the parameters are unhashable.
+        """
+        defaults = cls.__dict__.get('_spec_defaults')
+        if defaults is None:
+            defaults = {k: p.default for k, p in cls.params().items()}
+            type.__setattr__(cls, '_spec_defaults', defaults)
+        try:
+            key = (cls,) + tuple(sorted((k, tuple(v) if isinstance(v, list) else v)
+                                        for k, v in params.items()
+                                        if k not in defaults or v != defaults[k]))
+            hash(key)
+        except (TypeError, ValueError):
+            return None
+        return key
+
+
     def __init__(self, name, **params):
         """
         Initializes the Dimension object with the given name.
         """
+        if self.__dict__.get('initialized'):
+            return  # An interned Dimension that is already initialized
         if isinstance(name, Dimension):
             existing_params = dict(name.get_param_values())
         else:
             existing_params = {'name': name}
-        super(Dimension, self).__init__(**dict(existing_params, **params))
+        params = dict(existing_params, **params)
+        if isinstance(params.get('values'), list):
+            params['values'] = tuple(params['values'])
+        super(Dimension, self).__init__(**params)
+
+
+    def __setattr__(self, attr, value):
+        if self.__dict__.get('initialized') and attr in type(self).params():
+            raise AttributeError("Dimension objects are immutable, derive a new "
+                                 "Dimension by calling it with the new parameters.")
+        super(Dimension, self).__setattr__(attr, value)
+
+
+    def __reduce__(self):
+        # Unpickles to the interned instance with the same parameters
+        return (_build_dimension, (type(self), dict(self.get_param_values())))
+
+
+    def __copy__(self):
+        # Dimensions are immutable so copies may share the instance
+        return self
+
+
+    def __deepcopy__(self, memo):
+        return self
 
 
     def __call__(self, name=None, **overrides):
@@ -133,12 +211,11 @@ class Dimension(param.Parameterized):
 
     def __hash__(self):
         """
-        The hash allows two Dimension objects to be compared; if the
-        hashes are equal, all the parameters of the Dimensions are
-        also equal.
+        Dimensions are hashed by name, consistent with equality, so
+        that a Dimension may be used to look up entries keyed by the
+        Dimension name.
         """
-        return sum([hash(value) for name, value in self.get_param_values()
-                    if not isinstance(value, list)])
+        return hash(self.name)
 
 
     def __str__(self):
@@ -147,6 +224,8 @@ class Dimension(param.Parameterized):
 
     def __eq__(self, other):
         "Dimensions are sorted alphanumerically by name"
+        if self is other:
+            return True
         return self.name == other.name if isinstance(other, Dimension) else self.name == other
 
 
@@ -156,6 +235,12 @@ class Dimension(param.Parameterized):
 
 
 
+def _build_dimension(cls, params):
+    "Reconstructs a pickled Dimension from its parameters."
+    return cls(**params)
+
+
+
 class LabelledData(param.Parameterized):
     """
     LabelledData is a mix-in class designed to introduce the group and
@@ -217,6 +302,18 @@ class LabelledData(param.Parameterized):
                              self.label)
 
 
+    @property
+    def id(self):
+        "The id of the custom options tree associated with the object."
+        return self.__dict__.get('id', None)
+
+
+    @id.setter
+    def id(self, id):
+        Store.register_id(self, self.__dict__.get('id', None), id)
+        self.__dict__['id'] = id
+
+
     def clone(self, data=None, shared_data=True, *args, **overrides):
         """
         Returns a clone of the object with matching parameter values
@@ -240,8 +337,8 @@ class LabelledData(param.Parameterized):
         obj = self.clone(self.data,
                          **{k:v for k,v in keywords if v is not None})
         if (depth > 0) and hasattr(obj, '_deep_indexable'):
-            for k, v in obj.items():
-                obj[k] =  v.relabel(group=group, label=label, depth=depth-1)
+            obj = obj.clone([(k, v.relabel(group=group, label=label, depth=depth-1))
+                             for k, v in obj.items()])
         return obj
 
 
@@ -257,20 +354,7 @@ class LabelledData(param.Parameterized):
         the match, and so the sanitized versions of those values will
         need to be provided if the match is to succeed.
         """
-        if callable(spec) and not isinstance(spec, type): return spec(self)
-        elif isinstance(spec, type): return isinstance(self, spec)
-        specification = (self.__class__.__name__, self.group, self.label)
-        identifier_specification = tuple(sanitize_identifier(ident, escape=False)
-                                         for ident in specification)
-        split_spec = tuple(spec.split('.')) if not isinstance(spec, tuple) else spec
-        split_spec, nocompare = zip(*((None, True) if s == '*' or s is None else (s, False)
-                                    for s in split_spec))
-        if all(nocompare): return True
-        match_fn = itemgetter(*(idx for idx, nc in enumerate(nocompare) if not nc))
-        self_spec = match_fn(split_spec)
-        identifier_match = match_fn(identifier_specification[:len(split_spec)]) == self_spec
-        unescaped_match = specification[:len(split_spec)] == self_spec
-        return identifier_match or unescaped_match
+        return compile_spec(spec)(self)
 
 
     def traverse(self, fn, specs=None, full_breadth=True):
@@ -288,8 +372,9 @@ class LabelledData(param.Parameterized):
         accumulator = []
         matches = specs is None
         if not matches:
+            specs = [compile_spec(spec) for spec in specs]
             for spec in specs:
-                matches = self.matches(spec)
+                matches = spec(self)
                 if matches: break
         if matches:
             accumulator.append(fn(self))
@@ -307,7 +392,9 @@ class LabelledData(param.Parameterized):
         Recursively replaces elements using a map function when the
         specification applies.
         """
-        applies = specs is None or any(self.matches(spec) for spec in specs)
+        if specs is not None:
+            specs = [compile_spec(spec) for spec in specs]
+        applies = specs is None or any(spec(self) for spec in specs)
         mapped = map_fn(self) if applies else self
         if self._deep_indexable:
             deep_mapped = mapped.clone(shared_data=False) if clone else mapped
@@ -356,6 +443,7 @@ class LabelledData(param.Parameterized):
         except:
             self.warning("Could not unpickle custom style information.")
         self.__dict__.update(d)
+        Store.register_id(self, None, self.__dict__.get('id', None))
 
 
 
@@ -445,9 +533,29 @@ class Dimensioned(LabelledData):
         self.ndims = len(self.key_dimensions)
         constant_dimensions = [(d.name, val) for d, val in self.constant_dimensions.items()]
         self._cached_constants = OrderedDict(constant_dimensions)
+        self._cache_dimensions()
+        self._settings = None
+
+
+    def __setattr__(self, attr, value):
+        super(Dimensioned, self).__setattr__(attr, value)
+        if attr in self._dim_groups[:2] and '_cached_dimensions' in self.__dict__:
+            self._cache_dimensions()
+
+
+    def _cache_dimensions(self):
+        """
+        Caches the names of the key and value dimensions along with
+        lookup tables mapping each name to its Dimension and to its
+        index in the list of all dimensions.
+        """
+        dimensions = self.key_dimensions + self.value_dimensions
         self._cached_index_names = [d.name for d in self.key_dimensions]
         self._cached_value_names = [d.name for d in self.value_dimensions]
-        self._settings = None
+        self._cached_dimensions = dimensions
+        self._cached_dimension_names = [d.name for d in dimensions]
+        self._cached_dimension_lookup = {d.name: d for d in dimensions}
+        self._cached_dimension_index = {d.name: i for i, d in enumerate(dimensions)}
 
 
     def _valid_dimensions(self, dimensions):
@@ -478,6 +586,15 @@ class Dimensioned(LabelledData):
         by their type, i.e. 'key' or 'value' dimensions.
         By default 'all' dimensions are returned.
         """
+        if not self._deep_indexable and selection in ['all', 'key', 'value']:
+            if selection == 'all':
+                dims = self._cached_dimension_names if label else self._cached_dimensions
+            elif selection == 'key':
+                dims = self._cached_index_names if label else self.key_dimensions
+            else:
+                dims = self._cached_value_names if label else self.value_dimensions
+            return list(dims)
+
         lambdas = {'key': (lambda x: x.key_dimensions, {'full_breadth': False}),
                    'value': (lambda x: x.value_dimensions, {}),
                    'constant': (lambda x: x.constant_dimensions, {})}
@@ -499,11 +616,16 @@ class Dimensioned(LabelledData):
 
     def get_dimension(self, dimension, default=None):
         "Access a Dimension object by name or index."
-        all_dims = self.dimensions()
         if isinstance(dimension, int):
-            return all_dims[dimension]
-        else:
-            return {dim.name: dim for dim in all_dims}.get(dimension, default)
+            if 0 <= dimension < len(self._cached_dimensions):
+                return self._cached_dimensions[dimension]
+            return self.dimensions()[dimension]
+        dim = self._cached_dimension_lookup.get(dimension)
+        if dim is not None:
+            return dim
+        elif self._deep_indexable:
+            return {d.name: d for d in self.deep_dimensions}.get(dimension, default)
+        return default
 
 
     def get_dimension_index(self, dim):
@@ -515,7 +637,11 @@ class Dimensioned(LabelledData):
                 return dim
             else:
                 return IndexError('Dimension index out of bounds')
+        index = self._cached_dimension_index.get(dim)
+        if index is not None:
+            return index
         try:
+            if not self._deep_indexable: raise ValueError
             return [d.name for d in self.dimensions()].index(dim)
         except ValueError:
             raise Exception("Dimension %s not found in %s." %
@@ -603,15 +729,21 @@ class Dimensioned(LabelledData):
                 selection = selection.select(selection_specs, **kwargs)
         elif selection._deep_indexable:
             # Apply the deep selection on each item in local selection
-            items = []
+            items, changed = [], False
             for k, v in selection.items():
                 val_dim = ['value'] if v.value_dimensions else []
                 key_dims = v.dimensions('key', label=True) + val_dim
                 if any(kw in key_dims for kw in kwargs):
-                    items.append((k, v.select(selection_specs, **kwargs)))
+                    selected = v.select(selection_specs, **kwargs)
+                    changed = changed or selected is not v
+                    items.append((k, selected))
                 else:
                     items.append((k, v))
-            selection = selection.clone(items)
+            if changed:
+                selection = selection.clone(items)
+            elif selection is self:
+                # Nothing was selected, share the data with a clone
+                selection = selection.clone()
         return selection
 
 
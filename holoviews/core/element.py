@@ -1,4 +1,5 @@
-from itertools import groupby
+import sys
+from itertools import groupby, product
 from numbers import Number
 import numpy as np
 
@@ -6,10 +7,12 @@ import param
 
 from .dimension import Dimension, Dimensioned, ViewableElement
 from .layout import Composable, Layout, AdjointLayout, NdLayout
-from .ndmapping import OrderedDict, UniformNdMapping, NdMapping, item_check
+from .ndmapping import (OrderedDict, UniformNdMapping, NdMapping, ColumnarData,
+                        item_check)
 from .overlay import Overlayable, NdOverlay, Overlay, CompositeOverlay
 from .tree import AttrTree
-from .util import sanitize_identifier
+from . import util
+from .util import sanitize_identifier, factorize, group_reduce
 
 
 class Element(ViewableElement, Composable, Overlayable):
@@ -22,6 +25,22 @@ class Element(ViewableElement, Composable, Overlayable):
 
     group = param.String(default='Element', constant=True)
 
+    # Attributes which invalidate the cached dimension ranges when set
+    _range_attrs = ['data', 'key_dimensions', 'value_dimensions', 'bounds']
+
+    def __setattr__(self, attr, value):
+        if attr in self._range_attrs:
+            self._range_cache = {}
+        super(Element, self).__setattr__(attr, value)
+
+
+    def __getstate__(self):
+        "The cached dimension ranges are recomputed after unpickling."
+        state = super(Element, self).__getstate__()
+        state.pop('_range_cache', None)
+        return state
+
+
     def hist(self, dimension=None, num_bins=20, bin_range=None,
              adjoin=True, individually=True, **kwargs):
         """
@@ -68,6 +87,24 @@ class Element(ViewableElement, Composable, Overlayable):
         raise NotImplementedError("Collapsing not implemented for %s." % cls.__name__)
 
 
+    @util.cached_range
+    def range(self, dim, data_range=True):
+        return super(Element, self).range(dim, data_range)
+
+
+    def _column_ranges(self, data):
+        """
+        Returns the minima and maxima of all columns of the supplied
+        two-dimensional data array, computed in a single pass over
+        the data and cached until the data is reassigned.
+        """
+        if not hasattr(self, '_range_cache'):
+            self._range_cache = {}
+        if None not in self._range_cache:
+            self._range_cache[None] = util.nanminmax(data)
+        return self._range_cache[None]
+
+
     def closest(self, coords):
         """
         Class method that returns the exact keys for a given list of
@@ -105,8 +142,8 @@ class Element(ViewableElement, Composable, Overlayable):
         as long as it implements a dimension_values method.
         """
         from ..element import Table
-        keys = zip(*[self.dimension_values(dim.name)
-                 for dim in self.key_dimensions])
+        keys = list(zip(*[self.dimension_values(dim.name)
+                      for dim in self.key_dimensions]))
         if not keys: keys = [()]
         values = zip(*[self.dimension_values(dim.name)
                        for dim in self.value_dimensions])
@@ -125,8 +162,8 @@ class Element(ViewableElement, Composable, Overlayable):
     def dframe(self):
         import pandas
         column_names = self.dimensions(label=True)
-        dim_vals = np.vstack([self.dimension_values(dim) for dim in column_names]).T
-        return pandas.DataFrame(dim_vals, columns=column_names)
+        columns = OrderedDict((dim, self.dimension_values(dim)) for dim in column_names)
+        return pandas.DataFrame(columns, columns=column_names, copy=False)
 
 
 
@@ -154,6 +191,10 @@ class NdElement(Element, NdMapping):
     One feature of NdElements is that they support an additional level of
     index over NdMappings: the last index may be a column name or a
     slice over the column names (using alphanumeric ordering).
+
+    The data is stored as ColumnarData, holding a NumPy array per key
+    and value dimension, so that the values along a dimension may be
+    accessed without iterating over the rows.
     """
 
     group = param.String(default='NdElement', constant=True, doc="""
@@ -168,15 +209,32 @@ class NdElement(Element, NdMapping):
 
     _deep_indexable = False
 
+    _columnar = True
+
     def __init__(self, data=None, **params):
         NdMapping.__init__(self, data, **dict(params, group=params.get('group',self.group)))
 
 
     def _add_item(self, key, value, sort=True):
         value = (value,) if np.isscalar(value) else tuple(value)
+        self._range_cache = {}
         super(NdElement, self)._add_item(key, value, sort)
 
 
+    def pop(self, key, default=None):
+        self._range_cache = {}
+        return super(NdElement, self).pop(key, default)
+
+
+    def extend(self, items, validate='once'):
+        self._range_cache = {}
+        if not isinstance(items, (NdMapping, ColumnarData)):
+            items = items.items() if isinstance(items, dict) else items
+            items = [(k, v if type(v) is tuple else (v,) if np.isscalar(v) else tuple(v))
+                     for k, v in items]
+        super(NdElement, self).extend(items, validate)
+
+
     def _filter_columns(self, index, col_names):
         "Returns the column names specified by index (which may be a slice)"
         if isinstance(index, slice):
@@ -209,6 +267,9 @@ class NdElement(Element, NdMapping):
         cols = self._filter_columns(value_dimensions, col_names)
         indices = [col_names.index(col) for col in cols]
         value_dimensions = [self.value_dimensions[i] for i in indices]
+        if len(subtable) != 1 and isinstance(subtable.data, ColumnarData):
+            return subtable.clone(subtable.data.select_values(indices),
+                                  value_dimensions=value_dimensions)
         items = [(k, tuple(v[i] for i in indices))
                  for (k,v) in subtable.items()]
         if len(items) == 1:
@@ -273,33 +334,40 @@ class NdElement(Element, NdMapping):
                             "or as part of the kwargs not both.")
         elif dimensions:
             reduce_map = {d: function for d in dimensions}
-        dim_labels = self._cached_index_names
         reduced_table = self
         for reduce_fn, group in groupby(reduce_map.items(), lambda x: x[1]):
             dims = [dim for dim, _ in group]
-            split_dims = [self.get_dimension(d) for d in dim_labels if d not in dims]
+            split_dims = [d for d in reduced_table.key_dimensions if d.name not in dims]
             if len(split_dims) and reduced_table.ndims > 1:
-                split_map = reduced_table.groupby([d.name for d in split_dims], container_type=HoloMap,
-                                                  group_type=self.__class__)
-                reduced_table = self.clone(shared_data=False, key_dimensions=split_dims)
-                for k, table in split_map.items():
-                    reduced = []
-                    for vdim in self.value_dimensions:
-                        valtable = table.select(value=vdim.name) if len(self.value_dimensions) > 1 else table
-                        reduced.append(reduce_fn(valtable.data.values()))
-                    reduced_table[k] = reduced
+                reduced_table = reduced_table._group_reduce(split_dims, reduce_fn)
             else:
-                reduced = tuple(reduce_fn(self.dimension_values(vdim.name))
+                reduced = tuple(reduce_fn(reduced_table.dimension_values(vdim.name))
                                 for vdim in self.value_dimensions)
-                reduced_dims = [d for d in self.key_dimensions if d.name not in reduce_map]
+                reduced_dims = [d for d in reduced_table.key_dimensions
+                                if d.name not in reduce_map]
                 params = dict(group=self.group) if self.group != type(self).__name__ else {}
                 reduced_table = self.__class__([((), reduced)], label=self.label, key_dimensions=reduced_dims,
                                                value_dimensions=self.value_dimensions, **params)
         return reduced_table
 
 
+    def _group_reduce(self, split_dims, function):
+        """
+        Reduces the values within each group of rows sharing the same
+        values along the split dimensions, returning a clone indexed
+        by the split dimensions.
+        """
+        data = self.data if isinstance(self.data, ColumnarData) else ColumnarData(self.data)
+        indices = [self.get_dimension_index(d.name) for d in split_dims]
+        groups, first = factorize([data.key_column(i) for i in indices])
+        values = [data.value_column(i) for i in range(len(self.value_dimensions))]
+        keys = [data.key_column(i)[first] for i in indices]
+        reduced = ColumnarData.from_columns(keys, group_reduce(values, groups, function))
+        return self.clone(reduced, key_dimensions=split_dims)
+
+
     def _item_check(self, dim_vals, data):
-        if isinstance(data, tuple):
+        if isinstance(data, tuple) and self.data_type is not None:
             for el in data:
                 self._item_check(dim_vals, el)
             return
@@ -318,10 +386,17 @@ class NdElement(Element, NdMapping):
     def dimension_values(self, dim):
         if isinstance(dim, Dimension):
             raise Exception('Dimension to be specified by name')
+        elif isinstance(dim, int):
+            dim = self.dimensions(label=True)[dim]
         value_dims = self.dimensions('value', label=True)
+        columnar = isinstance(self.data, ColumnarData)
         if dim in value_dims:
             index = value_dims.index(dim)
+            if columnar:
+                return self.data.value_column(index)
             return [v[index] for v in self.values()]
+        elif columnar and dim in self._cached_index_names:
+            return self.data.key_column(self.get_dimension_index(dim))
         else:
             return NdMapping.dimension_values(self, dim)
 
@@ -332,9 +407,9 @@ class NdElement(Element, NdMapping):
         except ImportError:
             raise Exception("Cannot build a DataFrame without the pandas library.")
         labels = [d.name for d in self.dimensions()]
-        return pandas.DataFrame(
-            [dict(zip(labels, np.concatenate([np.array(k),v])))
-             for (k, v) in self.data.items()])
+        columns = OrderedDict((label, self.dimension_values(i))
+                              for i, label in enumerate(labels))
+        return pandas.DataFrame(columns, columns=labels)
 
 
 
@@ -580,6 +655,9 @@ class HoloMap(UniformNdMapping):
 
             samples = set(self.last.closest(linsamples))
 
+        stack = self._stacked()
+        if stack is not None:
+            return stack.sample(samples, **sample_values)
         sampled = self.clone([(k, view.sample(samples, **sample_values))
                               for k, view in self.data.items()])
         return sampled.table()
@@ -591,10 +669,31 @@ class HoloMap(UniformNdMapping):
         via the kwargs, where the keyword has to match a particular
         dimension in the Elements.
         """
+        stack = self._stacked()
+        if stack is not None:
+            return stack.reduce(dimensions, function, **reduce_map)
         reduced_items = [(k, v.reduce(dimensions, function, **reduce_map))
                          for k, v in self.items()]
         return self.clone(reduced_items).table()
 
+
+    def _stacked(self):
+        """
+        Stacks multiple homogeneous Chart or Raster frames into a
+        ChartStack or RasterStack, which sample and reduce all frames
+        at once. Returns None if the frames cannot be stacked.
+        """
+        from ..element import ChartStack, RasterStack
+        if len(self) < 2:
+            return None
+        for stack_type in [ChartStack, RasterStack]:
+            if issubclass(self.type, stack_type.params('template').class_):
+                try:
+                    return stack_type.from_holomap(self)
+                except ValueError:
+                    return None
+        return None
+
     def relabel(self, label=None, group=None, depth=1):
         # Identical to standard relabel method except for default depth of 1
         return super(HoloMap, self).relabel(label=label, group=group, depth=depth)
@@ -615,7 +714,7 @@ class HoloMap(UniformNdMapping):
                 raise Exception("Please supply the dimension to compute a histogram for.")
             map_range = self.range(kwargs['dimension'])
         bin_range = map_range if bin_range is None else bin_range
-        style_prefix = 'Custom[<' + self.name + '>]_'
+        style_prefix = kwargs.pop('style_prefix', 'Custom[<' + self.name + '>]_')
         if issubclass(self.type, (NdOverlay, Overlay)) and 'index' not in kwargs:
             kwargs['index'] = 0
         for k, v in self.data.items():
@@ -631,6 +730,567 @@ class HoloMap(UniformNdMapping):
         return (self << histmap) if adjoin else histmap
 
 
+
+class LazyHoloMap(HoloMap):
+    """
+    A LazyHoloMap is a HoloMap whose frames are generated on demand
+    by a callback. Rather than holding every frame in memory it is
+    declared with a key space, listing all the keys the callback may
+    be evaluated on, and computes each frame the first time it is
+    accessed via indexing or select.
+
+    Only the most recently accessed frames are held in the data,
+    which acts as an LRU cache bounded by the cache_size and
+    cache_bytes parameters. The keys and length of the map cover the
+    whole key space, while values and items only return the cached
+    frames, evaluating the first frame if none are cached. Slicing, selecting, relabelling and
+    grouping return new LazyHoloMaps over the corresponding part of
+    the key space. Operations that need every frame, such as
+    collapse, sample, reduce, hist or table, explicitly evaluate the
+    whole key space and return a plain HoloMap or the corresponding
+    result.
+    """
+
+    callback = param.Callable(default=None, doc="""
+        Callable returning the element for a given key, called with
+        one positional argument per key dimension.""")
+
+    key_space = param.List(default=None, doc="""
+        The list of keys the callback may be evaluated on. If None,
+        the key space is the cartesian product of the declared values
+        of the key dimensions.""")
+
+    cache_size = param.Integer(default=100, allow_None=True, doc="""
+        The maximum number of frames held in the cache. If None the
+        number of cached frames is unbounded.""")
+
+    cache_bytes = param.Integer(default=None, allow_None=True, doc="""
+        The maximum estimated number of bytes of frame data held in
+        the cache. If None the cache size in bytes is unbounded.""")
+
+    # The set of keys in the key space, built on the first lookup
+    _key_set = None
+
+    # Frames are only evaluated implicitly once construction completed
+    _initialized = False
+
+    def __init__(self, initial_items=None, **params):
+        self._lru = OrderedDict()
+        self._cache_nbytes = 0
+        super(LazyHoloMap, self).__init__(initial_items, **params)
+        if self.key_space is None:
+            values = [d.values for d in self.key_dimensions]
+            if not all(values) or 'initial' in values:
+                raise ValueError("LazyHoloMap requires either a key_space "
+                                 "or declared values for all key dimensions.")
+            self.key_space = list(product(*values))
+        else:
+            keys = [k if isinstance(k, tuple) else (k,) for k in self.key_space]
+            if self._sorted:
+                try:
+                    keys = sorted(keys, key=self._sort_key)
+                except TypeError:
+                    pass
+            self.key_space = keys
+        self._key_set = None
+        for k, v in self.data.items():
+            self._cache(k, v)
+        self._initialized = True
+
+
+    def _cache(self, key, element):
+        "Records a cache access, evicting the least recently used frames."
+        if key in self._lru:
+            self._lru[key] = self._lru.pop(key)
+            return
+        nbytes = self._nbytes(element)
+        self._lru[key] = nbytes
+        self._cache_nbytes += nbytes
+        while len(self._lru) > 1 and (
+                (self.cache_size is not None and len(self._lru) > self.cache_size) or
+                (self.cache_bytes is not None and self._cache_nbytes > self.cache_bytes)):
+            evicted, evicted_bytes = self._lru.popitem(last=False)
+            self._cache_nbytes -= evicted_bytes
+            self.pop(evicted)
+
+
+    def _share_data(self, other):
+        super(LazyHoloMap, self)._share_data(other)
+        self._lru = OrderedDict(other._lru)
+        self._cache_nbytes = other._cache_nbytes
+
+
+    def _nbytes(self, element):
+        "Estimates the memory held by the data of the supplied element."
+        return sum(el.data.nbytes if hasattr(el.data, 'nbytes') else sys.getsizeof(el.data)
+                   for el in element.traverse(lambda x: x, [Element]))
+
+
+    def _item_check(self, dim_vals, data):
+        if self._check_items:
+            super(LazyHoloMap, self)._item_check(dim_vals, data)
+
+
+    def _evaluate(self, key):
+        """
+        Returns the frame for the supplied key, calling the callback
+        if it is not already cached.
+        """
+        if key in self._lru:
+            element = self.data[key]
+        else:
+            if self._key_set is None:
+                self._key_set = set(self.key_space)
+            if key not in self._key_set:
+                raise KeyError('%s not in key space of %s.' %
+                               (key, self.__class__.__name__))
+            element = self.callback(*key)
+            if self._type is None:
+                self._type = type(element)
+            self._add_item(key, element)
+        self._cache(key, element)
+        return element
+
+
+    def __getitem__(self, indexslice):
+        """
+        Indexing with a full key returns the corresponding frame,
+        evaluating it if necessary. Slicing selects the matching keys
+        from the key space, returning a new LazyHoloMap.
+        """
+        if indexslice in [Ellipsis, ()]:
+            return self
+
+        map_slice, data_slice = self._split_index(indexslice)
+        map_slice = self._transform_indices(map_slice)
+        if len(map_slice) == self.ndims and all(not isinstance(el, (slice, set, list, tuple))
+                                                for el in map_slice):
+            return self._dataslice(self._evaluate(map_slice), data_slice)
+
+        conditions = self._generate_conditions(map_slice)
+        ranks = [self._cached_index_ranks.get(d.name) for d in self.key_dimensions]
+        keys = [k for k in self.key_space
+                if all(condition(ranks[i][k[i]] if ranks[i] else k[i])
+                       for i, condition in enumerate(conditions))]
+        if len(keys) == 0:
+            raise KeyError('No items within specified slice.')
+
+        selection = self._subset(keys)
+        if data_slice:
+            selection = selection._map_frames(lambda x: self._dataslice(x, data_slice))
+        return selection
+
+
+    def _subset(self, keys):
+        "Returns a new LazyHoloMap over the supplied part of the key space."
+        items = [(k, self.data[k]) for k in keys if k in self._lru]
+        return self.clone(items, shared_data=False, key_space=keys)
+
+
+    def _map_frames(self, fn):
+        """
+        Returns a new LazyHoloMap applying the supplied function to
+        each frame as it is evaluated.
+        """
+        callback = self.callback
+        items = [(k, fn(v)) for k, v in self.data.items()]
+        return self._clone_as(LazyHoloMap, items, key_space=self.key_space,
+                              callback=lambda *key: fn(callback(*key)))
+
+
+    def _clone_as(self, cls, data, **overrides):
+        """
+        Returns a map of the supplied class holding the data, passing
+        on the parameters it has in common with this map.
+        """
+        params = cls.params()
+        settings = {name: getattr(self, name) for name in self.params()
+                    if name in params and name not in ['group', 'label']}
+        if self._group:
+            settings['group'] = self._group
+        if self._label:
+            settings['label'] = self._label
+        settings.update(overrides)
+        return cls(data, **settings)
+
+
+    def _materialize(self):
+        "Returns a HoloMap holding the frames for the whole key space."
+        return self._clone_as(HoloMap, [(k, self._evaluate(k)) for k in self.key_space])
+
+
+    def clone(self, data=None, shared_data=True, *args, **overrides):
+        """
+        Returns a clone of the LazyHoloMap. If new data is supplied
+        without a new callback or key space it no longer corresponds
+        to the callback, so a plain HoloMap holding the data is
+        returned instead.
+        """
+        if (data is not None and data is not self.data and
+            not any(p in overrides for p in ['callback', 'key_space'])):
+            return self._clone_as(HoloMap, data, **overrides)
+        return super(LazyHoloMap, self).clone(data, shared_data, *args, **overrides)
+
+
+    def select(self, selection_specs=None, **kwargs):
+        """
+        Applies the selection on the key dimensions to the key space,
+        deferring any selection on the frames until they are
+        evaluated.
+        """
+        local_kwargs = {k: v for k, v in kwargs.items()
+                        if k in self._cached_index_names}
+        deep_kwargs = {k: v for k, v in kwargs.items()
+                       if k not in local_kwargs}
+        if selection_specs is not None:
+            matches = any(self.matches(spec) for spec in selection_specs)
+        else:
+            matches = True
+
+        selection = self
+        if local_kwargs and matches:
+            select = [slice(None) for i in range(self.ndims)]
+            for dim, val in local_kwargs.items():
+                if isinstance(val, tuple): val = slice(*val)
+                select[self.get_dimension_index(dim)] = val
+            selection = self[tuple(select)]
+
+        if not deep_kwargs:
+            return selection
+        elif not isinstance(selection, LazyHoloMap):
+            return selection.select(selection_specs, **deep_kwargs)
+        return selection._map_frames(lambda x: x.select(selection_specs, **deep_kwargs))
+
+
+    def relabel(self, label=None, group=None, depth=1):
+        """
+        Returns a LazyHoloMap with the new label and/or group, which
+        relabels the frames as they are evaluated if depth > 0.
+        """
+        keywords = {k: v for k, v in [('label', label), ('group', group)]
+                    if v is not None}
+        relabelled = self.clone(**keywords)
+        if depth > 0:
+            relabelled = relabelled._map_frames(lambda x: x.relabel(label, group, depth-1))
+        return relabelled
+
+
+    def groupby(self, dimensions, container_type=None, group_type=None, **kwargs):
+        """
+        Splits the key space into groups by key dimension. Groups of
+        type LazyHoloMap (the default) evaluate their frames through
+        this map, other group types are built by evaluating all frames
+        in the group. The groups are returned in a mapping of class
+        container_type, which defaults to a LazyHoloMap building each
+        group when it is accessed.
+        """
+        if self.ndims == 1:
+            self.warning('Cannot split Map with only one dimension.')
+            return self
+
+        container_type = container_type if container_type else LazyHoloMap
+        group_type = group_type if group_type else LazyHoloMap
+        dims, inds = zip(*((self.get_dimension(dim), self.get_dimension_index(dim))
+                         for dim in dimensions))
+        inames, idims = zip(*((dim.name, dim) for dim in self.key_dimensions
+                              if not dim.name in dimensions))
+        iinds = [self.get_dimension_index(name) for name in inames]
+
+        grouped = OrderedDict()
+        for key in self.key_space:
+            group_key = tuple(key[i] for i in inds)
+            if group_key not in grouped:
+                grouped[group_key] = []
+            grouped[group_key].append(tuple(key[i] for i in iinds))
+
+        def full_key(group_key, inner_key):
+            key = [None] * self.ndims
+            for i, k in zip(inds, group_key): key[i] = k
+            for i, k in zip(iinds, inner_key): key[i] = k
+            return tuple(key)
+
+        def build_group(*group_key):
+            # As in NdMapping.groupby the groups carry no constant dimensions
+            if issubclass(group_type, LazyHoloMap):
+                callback = lambda *key: self._evaluate(full_key(group_key, key))
+                settings = dict(key_dimensions=list(idims), key_space=grouped[group_key],
+                                callback=callback, constant_dimensions=OrderedDict())
+                settings.update(kwargs)
+                return self._clone_as(group_type, [], **settings)
+            items = [(key, self._evaluate(full_key(group_key, key)))
+                     for key in grouped[group_key]]
+            group = self._clone_as(HoloMap, items, key_dimensions=list(idims),
+                                   constant_dimensions=OrderedDict())
+            return group_type(group, **kwargs)
+
+        if issubclass(container_type, LazyHoloMap):
+            container = container_type(key_dimensions=list(dims), key_space=list(grouped),
+                                       callback=build_group)
+            # Like the groups built by NdMapping.groupby the groups
+            # do not share the key dimensions of the container
+            container._check_items = False
+            return container
+        return container_type([(k, build_group(*k)) for k in grouped],
+                              key_dimensions=list(dims))
+
+
+    def overlay(self, dimensions, **kwargs):
+        if len(self._valid_dimensions(dimensions)) == self.ndims:
+            return self._materialize().overlay(dimensions, **kwargs)
+        return super(LazyHoloMap, self).overlay(dimensions, **kwargs)
+
+
+    def grid(self, dimensions, **kwargs):
+        if len(self._valid_dimensions(dimensions)) == self.ndims:
+            return self._materialize().grid(dimensions, **kwargs)
+        return super(LazyHoloMap, self).grid(dimensions, **kwargs)
+
+
+    def layout(self, dimensions, **kwargs):
+        if len(self._valid_dimensions(dimensions)) == self.ndims:
+            return self._materialize().layout(dimensions, **kwargs)
+        return super(LazyHoloMap, self).layout(dimensions, **kwargs)
+
+
+    def dimension_values(self, dimension):
+        """
+        Returns the values along the specified dimension, taking key
+        dimension values from the key space and evaluating all the
+        frames for other dimensions.
+        """
+        if isinstance(dimension, int):
+            dimension = self.dimensions('all', True)[dimension]
+        if dimension in self._cached_index_names:
+            index = self.get_dimension_index(dimension)
+            return [k[index] for k in self.key_space]
+        return self._materialize().dimension_values(dimension)
+
+
+    def range(self, dimension, data_range=True):
+        dimension = self.get_dimension(dimension)
+        if dimension is None or dimension in self.key_dimensions:
+            return super(LazyHoloMap, self).range(dimension, data_range)
+        return self._materialize().range(dimension, data_range)
+
+
+    def collapse(self, dimensions=None, function=None, **kwargs):
+        return self._materialize().collapse(dimensions, function, **kwargs)
+
+
+    def sample(self, samples=[], bounds=None, **sample_values):
+        return self._materialize().sample(samples, bounds, **sample_values)
+
+
+    def reduce(self, dimensions=None, function=None, **reduce_map):
+        return self._materialize().reduce(dimensions, function, **reduce_map)
+
+
+    def hist(self, num_bins=20, bin_range=None, adjoin=True, individually=True, **kwargs):
+        return self._materialize().hist(num_bins, bin_range, adjoin, individually, **kwargs)
+
+
+    def split_overlays(self):
+        return self._materialize().split_overlays()
+
+
+    def table(self, **kwargs):
+        return self._materialize().table(**kwargs)
+
+
+    def dframe(self):
+        return self._materialize().dframe()
+
+
+    @property
+    def type(self):
+        "The type of the frames, evaluating the first frame if necessary."
+        if self._type is None and self._initialized and self.key_space:
+            self._evaluate(self.key_space[0])
+        return self._type
+
+
+    def keys(self):
+        "Returns the keys of the whole key space."
+        if self.ndims == 1:
+            return [k[0] for k in self.key_space]
+        return list(self.key_space)
+
+
+    def values(self):
+        "Returns the cached frames, evaluating the first frame if none was yet."
+        self.type
+        return list(self.data.values())
+
+
+    def items(self):
+        "Returns the cached (key, frame) pairs."
+        values = self.values()
+        keys = [k[0] if self.ndims == 1 else k for k in self.data.keys()]
+        return list(zip(keys, values))
+
+
+    def __iter__(self):
+        "Iterates over the cached frames without evaluating any frame."
+        return iter(list(self.data.values()))
+
+
+    def __contains__(self, key):
+        if self._key_set is None:
+            self._key_set = set(self.key_space)
+        return (key if isinstance(key, tuple) else (key,)) in self._key_set
+
+
+    def __len__(self):
+        return len(self._data) if self.key_space is None else len(self.key_space)
+
+
+    @property
+    def deep_dimensions(self):
+        values = self.values()
+        return values[0].dimensions() if values else []
+
+
+    @property
+    def last(self):
+        "Returns the frame for the last key in the key space."
+        return self._evaluate(self.key_space[-1]) if self.key_space else None
+
+
+    @property
+    def last_key(self):
+        "Returns the last key in the key space."
+        if not self.key_space:
+            return None
+        key = self.key_space[-1]
+        return key[0] if self.ndims == 1 else key
+
+
+
+class FrameStack(LazyHoloMap):
+    """
+    A FrameStack is a LazyHoloMap of homogeneous elements, holding
+    the data of all frames in a single contiguous array, stacked
+    along the first axis in the order of the key space. Frames are
+    cloned from the template element on access, wrapping a view onto
+    the stack, and are held in the same LRU cache as in a
+    LazyHoloMap. Subclasses implement operations across all frames
+    as NumPy operations over the stacked axis.
+    """
+
+    stack = param.Parameter(default=None, doc="""
+        Array holding the data of the frames stacked along the first
+        axis, ordered like the supplied key_space.""")
+
+    template = param.ClassSelector(class_=Element, doc="""
+        Element supplying the type and parameters of the frames,
+        which are clones of the template holding the corresponding
+        slice of the stack.""")
+
+    def __init__(self, initial_items=None, **params):
+        keys = params.get('key_space')
+        if keys is not None:
+            keys = [k if isinstance(k, tuple) else (k,) for k in keys]
+        params['callback'] = None
+        super(FrameStack, self).__init__(initial_items, **params)
+        self.callback = self._frame
+        if self.stack is None or self.template is None:
+            raise ValueError("%s requires a stack array and a template element."
+                             % type(self).__name__)
+        self.stack = np.asarray(self.stack)
+        if self.stack.shape[1:] != self.template.data.shape:
+            raise ValueError("%s stack of shape %s does not match template of shape %s."
+                             % (type(self).__name__, self.stack.shape,
+                                self.template.data.shape))
+        if len(self.stack) != len(self.key_space):
+            raise ValueError("%s stack holds %d frames but the key space has %d keys."
+                             % (type(self).__name__, len(self.stack), len(self.key_space)))
+        if keys is not None and keys != self.key_space:
+            rows = dict(zip(keys, range(len(keys))))
+            self.stack = self.stack[[rows[k] for k in self.key_space]]
+        self._rows = None
+
+
+    @classmethod
+    def from_holomap(cls, hmap, **params):
+        """
+        Stacks the frames of a HoloMap into a new stack, raising a
+        ValueError if the frames are not homogeneous.
+        """
+        frames = list(hmap.data.values())
+        if not frames:
+            raise ValueError("Cannot stack an empty %s." % type(hmap).__name__)
+        template = hmap.last
+        cls._validate_frames(frames, template)
+        settings = dict(key_dimensions=hmap.key_dimensions,
+                        key_space=list(hmap.data.keys()))
+        if hmap._group:
+            settings['group'] = hmap._group
+        if hmap._label:
+            settings['label'] = hmap._label
+        settings.update(params)
+        return cls(stack=np.array([frame.data for frame in frames]),
+                   template=template, **settings)
+
+
+    @classmethod
+    def _validate_frames(cls, frames, template):
+        "Raises a ValueError if the frames cannot be stacked."
+        if not isinstance(template, cls.params('template').class_):
+            raise ValueError("%s cannot hold %s frames." %
+                             (cls.__name__, type(template).__name__))
+        shape = template.data.shape
+        for frame in frames:
+            if type(frame) is not type(template) or frame.data.shape != shape:
+                raise ValueError("%s requires frames of the same type and shape."
+                                 % cls.__name__)
+
+
+    @property
+    def _row_index(self):
+        "Maps each key in the key space onto its row in the stack."
+        if self._rows is None:
+            self._rows = {k: i for i, k in enumerate(self.key_space)}
+        return self._rows
+
+
+    def _frame(self, *key):
+        return self.template.clone(self.stack[self._row_index[key]])
+
+
+    def _materialize(self):
+        "Returns a HoloMap holding every frame in the stack."
+        return self._clone_as(HoloMap, [(k, self.template.clone(data))
+                                        for k, data in zip(self.key_space, self.stack)])
+
+
+    def _subset(self, keys):
+        items = [(k, self.data[k]) for k in keys if k in self._lru]
+        return self.clone(items, shared_data=False, key_space=keys,
+                          stack=self.stack[[self._row_index[k] for k in keys]])
+
+
+    def _gather(self, table, values):
+        """
+        Given a Table computed from a single frame, with the key of
+        the first frame prepended, returns a Table repeating its rows
+        for every frame, holding the supplied array of values of
+        shape (frames, rows) or (frames, rows, value dimensions).
+        """
+        if values.ndim == 2:
+            values = values[..., np.newaxis]
+        frames, rows = values.shape[:2]
+        data = table.data if isinstance(table.data, ColumnarData) else ColumnarData(table.data)
+        frame_keys = [ColumnarData._column_array([k[i] for k in self.key_space])
+                      for i in range(self.ndims)]
+        key_columns = ([np.repeat(column, rows) for column in frame_keys] +
+                       [np.tile(data.key_column(i), frames)
+                        for i in range(self.ndims, table.ndims)])
+        value_columns = list(values.reshape(frames * rows, -1).T)
+        with item_check(False):
+            return table.clone(ColumnarData.from_columns(key_columns, value_columns))
+
+
+
 class GridSpace(UniformNdMapping):
     """
     Grids are distinct from Layouts as they ensure all contained
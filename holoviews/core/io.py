@@ -14,11 +14,18 @@ Archives: A collection of HoloViews objects that are first collected
 """
 from __future__ import absolute_import
 
-import re, os, time, string, zipfile, tarfile, shutil, itertools, pickle
+import re, os, time, string, zipfile, tarfile, shutil, itertools, pickle, pickletools
+import struct, zlib
 
 from io import BytesIO
 from hashlib import sha256
 
+try:
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:
+    ThreadPoolExecutor = None
+
+import numpy as np
 import param
 from param.parameterized import bothmethod
 
@@ -254,11 +261,28 @@ class Deserializer(Importer):
        pickle.load may be used although this will not load customized
        options.""")
 
+    # Offset indexes of the most recently indexed files by filename as
+    # (file size, modification time, digest of the last indexed record,
+    # offsets), holding at most _max_indexes files
+    _indexes = OrderedDict()
+    _max_indexes = 32
+
     def __call__(self, data):
         return self.deserializer(BytesIO(data))
 
     @bothmethod
-    def load(self_or_cls, filename):
+    def load(self_or_cls, filename, index=None):
+        """
+        Loads the first object saved to the file or, if an index is
+        supplied, seeks straight to the object at that position in
+        the file using the offset index.
+        """
+        if index is not None:
+            offset = self_or_cls.offsets(filename)[index]
+            with open(filename, 'rb') as f:
+                f.seek(offset)
+                self_or_cls.deserializer(f)
+                return self_or_cls.deserializer(f)
         with open(filename, 'rb') as f:
             data = self_or_cls.deserializer(f)
             try:
@@ -266,6 +290,71 @@ class Deserializer(Importer):
             except: pass
         return data
 
+    @bothmethod
+    def iterload(self_or_cls, filename):
+        """
+        Iterates over all the objects appended to the file by
+        Serializer.save, yielding (metadata, object) pairs one at a
+        time.
+        """
+        size = os.path.getsize(filename)
+        with open(filename, 'rb') as f:
+            while f.tell() < size:
+                metadata = self_or_cls.deserializer(f)
+                yield metadata, self_or_cls.deserializer(f)
+
+    @bothmethod
+    def offsets(self_or_cls, filename):
+        """
+        Returns the byte offsets of each (metadata, object) record in
+        the file. The index is cached and only the records appended
+        since it was last built are scanned, unless the last indexed
+        record has changed in which case the index is rebuilt. Only
+        the indexes of the most recently accessed files are kept.
+        """
+        stat = os.stat(filename)
+        path = os.path.abspath(filename)
+        cached = self_or_cls._indexes.pop(path, None)
+        size, mtime, digest, offsets = cached if cached else (0, None, None, [])
+        with open(filename, 'rb') as f:
+            # A file that was rewritten rather than appended to no
+            # longer holds the last indexed record at the same offset
+            if size > stat.st_size or (offsets and
+                                       self_or_cls._digest(f, offsets[-1], size) != digest):
+                size, offsets = 0, []
+            elif (size, mtime) == (stat.st_size, stat.st_mtime):
+                self_or_cls._indexes[path] = cached
+                return list(offsets)
+            offsets = list(offsets)
+            f.seek(size)
+            while f.tell() < stat.st_size:
+                offsets.append(f.tell())
+                self_or_cls._skip(f)
+                self_or_cls._skip(f)
+            digest = self_or_cls._digest(f, offsets[-1], stat.st_size) if offsets else None
+        self_or_cls._indexes[path] = (stat.st_size, stat.st_mtime, digest, offsets)
+        # Evict the indexes of the least recently indexed files
+        while len(self_or_cls._indexes) > self_or_cls._max_indexes:
+            self_or_cls._indexes.popitem(last=False)
+        return list(offsets)
+
+    @classmethod
+    def _digest(cls, f, start, end):
+        "Returns a digest of the bytes of the file between the offsets"
+        f.seek(start)
+        return sha256(f.read(end - start)).hexdigest()
+
+    @bothmethod
+    def _skip(self_or_cls, f):
+        """
+        Advances the file past the next serialized object, scanning
+        the opcodes of pickles without constructing the objects.
+        """
+        if self_or_cls.deserializer in (Store.load, pickle.load):
+            for _ in pickletools.genops(f): pass
+        else:
+            self_or_cls.deserializer(f)
+
     @bothmethod
     def key(self_or_cls, filename):
         with open(filename, "rb") as f:
@@ -282,6 +371,68 @@ class Deserializer(Importer):
 
 
 
+class ArrayPickler(pickle.Pickler):
+    """
+    Pickler that leaves a reference to a separate .npy member of a zip
+    archive in place of the data of large NumPy arrays. The arrays to
+    be stored under each member name are collected on the arrays
+    attribute.
+    """
+
+    array_prefix = 'arrays/'
+
+    def __init__(self, file, entry, threshold, protocol=2):
+        pickle.Pickler.__init__(self, file, protocol)
+        self.entry = entry
+        self.threshold = threshold
+        self.arrays = OrderedDict()
+
+    def persistent_id(self, obj):
+        if (not isinstance(obj, np.ndarray) or obj.dtype.hasobject
+            or obj.nbytes < self.threshold):
+            return None
+        for name, array in self.arrays.items():
+            if array is obj: return name
+        name = '%s%s/%d.npy' % (self.array_prefix, self.entry, len(self.arrays))
+        self.arrays[name] = obj
+        return name
+
+
+
+class ArrayUnpickler(pickle.Unpickler):
+    """
+    Unpickler for the pickles written by ArrayPickler. Arrays stored
+    uncompressed in an archive on disk are memory-mapped (copy on
+    write) rather than read into memory.
+    """
+
+    _header_readers = {(1, 0): np.lib.format.read_array_header_1_0,
+                       (2, 0): np.lib.format.read_array_header_2_0}
+
+    def __init__(self, file, zipf, filename):
+        pickle.Unpickler.__init__(self, file)
+        self.zipf = zipf
+        self.filename = filename
+
+    def persistent_load(self, name):
+        info = self.zipf.getinfo(name)
+        if isinstance(self.filename, str) and info.compress_type == zipfile.ZIP_STORED:
+            with open(self.filename, 'rb') as f:
+                # Skip the local file header to the start of the member data
+                f.seek(info.header_offset)
+                name_len, extra_len = struct.unpack('<HH', f.read(30)[26:30])
+                f.seek(info.header_offset + 30 + name_len + extra_len)
+                version = np.lib.format.read_magic(f)
+                if version in self._header_readers:
+                    shape, fortran, dtype = self._header_readers[version](f)
+                    if np.prod(shape):
+                        mapped = np.memmap(self.filename, dtype=dtype, mode='c', shape=shape,
+                                           order='F' if fortran else 'C', offset=f.tell())
+                        return mapped.view(np.ndarray)
+        return np.load(BytesIO(self.zipf.read(name)), allow_pickle=False)
+
+
+
 class Pickler(Exporter):
     """
     The recommended pickler for serializing HoloViews object to a .hvz
@@ -294,7 +445,10 @@ class Pickler(Exporter):
     3. Support for metadata per saved component.
 
     The output file with the .hvz file extension is simply a zip
-    archive containing pickled HoloViews objects.
+    archive containing pickled HoloViews objects. With the opt-in
+    format version 2, large NumPy arrays are stored alongside the
+    pickles as uncompressed .npy members so that they may be
+    memory-mapped when loaded.
     """
 
     protocol = param.Integer(default=2, doc="""
@@ -302,7 +456,29 @@ class Pickler(Exporter):
         versions and 2 is efficient for new style classes.""")
 
     compress = param.Boolean(default=True, doc="""
-        Whether compression is enabled or not""")
+        Whether (deflate) compression is enabled or not""")
+
+    format_version = param.Integer(default=1, bounds=(1, 2), doc="""
+        The version of the .hvz format to write. Version 1 pickles
+        each component in its entirety, while version 2 stores NumPy
+        arrays of at least array_threshold bytes as separate
+        uncompressed .npy members that are memory-mapped on load.
+        Version 2 archives cannot be loaded by older versions of
+        HoloViews, so it has to be enabled explicitly.""")
+
+    array_threshold = param.Integer(default=2**16, bounds=(0, None), doc="""
+        The minimum size in bytes of the arrays stored as separate
+        .npy members when using format version 2.""")
+
+    compression_level = param.Integer(default=None, allow_None=True, bounds=(0, 9), doc="""
+        The zlib compression level used when compress is enabled,
+        from 0 (fastest) to 9 (smallest). If None, the zlib default
+        is used.""")
+
+    workers = param.Integer(default=1, bounds=(1, None), doc="""
+        The number of threads used to pickle and compress the
+        components of a Layout. The entries are written to the archive
+        in the same order as they become ready.""")
 
     mime_type = 'application/zip'
     file_ext = 'hvz'
@@ -319,8 +495,7 @@ class Pickler(Exporter):
         base_info = {'file-ext': 'hvz', 'mime_type':self_or_cls.mime_type}
         key = self_or_cls._merge_metadata(obj, self_or_cls.key_fn, key)
         info = self_or_cls._merge_metadata(obj, self_or_cls.info_fn, info, base_info)
-        compression = zipfile.ZIP_STORED if self_or_cls.compress else zipfile.ZIP_DEFLATED
-
+        compression = zipfile.ZIP_DEFLATED if self_or_cls.compress else zipfile.ZIP_STORED
         filename = self_or_cls._filename(filename) if isinstance(filename, str) else filename
         with zipfile.ZipFile(filename, 'w', compression=compression) as f:
 
@@ -333,11 +508,184 @@ class Pickler(Exporter):
                                       sanitize_identifier(obj.label, False))]
                 components = [obj]
 
-            for component, entry in zip(components, entries):
-                f.writestr(entry,
-                           Store.dumps(component, protocol=self_or_cls.protocol))
+            with Store.state_lock:
+                Store.save_option_state = True
+                try:
+                    parallel = (self_or_cls.workers > 1 and len(components) > 1 and
+                                ThreadPoolExecutor is not None)
+                    if parallel:
+                        self_or_cls._save_parallel(f, components, entries)
+                    else:
+                        for component, entry in zip(components, entries):
+                            serialized = self_or_cls._serialize(component, entry)
+                            self_or_cls._write_serialized(f, entry, serialized)
+                finally:
+                    Store.save_option_state = False
             f.writestr('metadata',
-                       pickle.dumps({'info':info, 'key':key}))
+                       pickle.dumps({'info':info, 'key':key,
+                                     'version': self_or_cls.format_version}))
+
+
+    @bothmethod
+    def _serialize(self_or_cls, component, entry):
+        """
+        Pickles the component, returning the pickled data, the data as
+        compressed by _compress and the list of (member name, array)
+        pairs to store alongside it.
+        """
+        if self_or_cls.format_version == 1:
+            data, arrays = pickle.dumps(component, protocol=self_or_cls.protocol), []
+        else:
+            buff = BytesIO()
+            pickler = ArrayPickler(buff, entry, self_or_cls.array_threshold,
+                                   protocol=self_or_cls.protocol)
+            pickler.dump(component)
+            data, arrays = buff.getvalue(), list(pickler.arrays.items())
+        return data, self_or_cls._compress(data), arrays
+
+
+    @bothmethod
+    def _compress(self_or_cls, data):
+        """
+        Returns the raw deflate stream of the data as stored in the zip
+        file or None if compression is disabled.
+        """
+        if not self_or_cls.compress:
+            return None
+        level = self_or_cls.compression_level
+        compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION if level is None else level,
+                                      zlib.DEFLATED, -15)
+        return compressor.compress(data) + compressor.flush()
+
+
+    @bothmethod
+    def _save_parallel(self_or_cls, f, components, entries):
+        """
+        Serializes and compresses the components using a pool of
+        worker threads, writing each entry to the open zip file in
+        order as soon as it (and all previous entries) are ready. As
+        zlib releases the GIL, the workers compress concurrently.
+        """
+        workers = self_or_cls.workers
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = []
+            for component, entry in zip(components, entries):
+                pending.append((entry, executor.submit(self_or_cls._serialize,
+                                                       component, entry)))
+                # Bound the number of serialized entries held in memory
+                if len(pending) >= 2 * workers:
+                    entry, future = pending.pop(0)
+                    self_or_cls._write_serialized(f, entry, future.result())
+            for entry, future in pending:
+                self_or_cls._write_serialized(f, entry, future.result())
+
+
+    @classmethod
+    def _write_arrays(cls, f, arrays):
+        "Writes the arrays as uncompressed .npy members of the zip file"
+        for name, array in arrays:
+            buff = BytesIO()
+            np.lib.format.write_array(buff, array, allow_pickle=False)
+            f.writestr(name, buff.getvalue(), compress_type=zipfile.ZIP_STORED)
+
+
+    @classmethod
+    def _write_serialized(cls, f, entry, serialized):
+        "Writes the result of _serialize for the given entry to the zip file"
+        data, compressed, arrays = serialized
+        cls._write_arrays(f, arrays)
+        if compressed is None:
+            f.writestr(entry, data, compress_type=zipfile.ZIP_STORED)
+            return
+        # zipfile always compresses the data itself, so the member
+        # holding the precompressed data is written directly
+        zinfo = zipfile.ZipInfo(entry, time.localtime(time.time())[:6])
+        zinfo.compress_type = zipfile.ZIP_DEFLATED
+        zinfo.external_attr = 0o600 << 16
+        zinfo.file_size = len(data)
+        zinfo.compress_size = len(compressed)
+        zinfo.CRC = zlib.crc32(data) & 0xffffffff
+        zinfo.header_offset = f.fp.tell()
+        f.fp.write(zinfo.FileHeader())
+        f.fp.write(compressed)
+        f.filelist.append(zinfo)
+        f.NameToInfo[entry] = zinfo
+        if hasattr(f, 'start_dir'):
+            f.start_dir = f.fp.tell()
+
+
+
+class LazyComponent(object):
+    """
+    Proxy for a single entry of a .hvz archive as returned by
+    Unpickler.load in lazy mode. The entry is only unpickled when one
+    of the attributes of the component is first accessed (e.g. when
+    it is displayed) or when resolve is called. Printing a proxy or a
+    Layout of proxies does not unpickle any entry.
+
+    All the proxies loaded from the same archive share a record of
+    which components are currently held in memory. Once the size of
+    the loaded entries exceeds the memory budget, the least recently
+    used components are released and unpickled again when next needed.
+    """
+
+    def __init__(self, filename, entry, size, loaded, budget=None):
+        self.filename = filename
+        self.entry = entry
+        self.size = size
+        self.budget = budget
+        self._loaded = loaded
+        self._component = None
+
+
+    @property
+    def resolved(self):
+        "Whether the component is currently held in memory."
+        return self._component is not None
+
+
+    def resolve(self):
+        "Returns the component, unpickling it if necessary."
+        if self._component is None:
+            with zipfile.ZipFile(self.filename, 'r') as f:
+                self._component = Unpickler._load_entry(f, self.filename, self.entry)
+        component, loaded = self._component, self._loaded
+        loaded.pop(self, None)
+        loaded[self] = self.size
+        if self.budget is not None:
+            while len(loaded) > 1 and sum(loaded.values()) > self.budget:
+                loaded.popitem(last=False)[0].release()
+        return component
+
+
+    def release(self):
+        "Releases the unpickled component from memory."
+        self._loaded.pop(self, None)
+        self._component = None
+
+
+    @classmethod
+    def resolve_all(cls, obj):
+        """
+        Returns the supplied object with any proxies resolved, i.e. the
+        component of a proxy or a clone of a Layout holding proxies.
+        """
+        if isinstance(obj, cls):
+            return obj.resolve()
+        elif isinstance(obj, Layout) and any(isinstance(v, cls) for v in obj.data.values()):
+            return obj.clone([(k, v.resolve() if isinstance(v, cls) else v)
+                              for k, v in obj.data.items()])
+        return obj
+
+
+    def __getattr__(self, attr):
+        if attr.startswith('_') and not attr.startswith(('_repr_', '_ipython_')):
+            raise AttributeError(attr)
+        return getattr(self.resolve(), attr)
+
+
+    def __repr__(self):
+        return "%s(%r)" % (self.__class__.__name__, self.entry)
 
 
 
@@ -354,26 +702,66 @@ class Unpickler(Importer):
     the entries method.
     """
 
-    def __call__(self, data, entries=None):
+    lazy = param.Boolean(default=False, doc="""
+        Whether to defer unpickling the components of the archive. If
+        enabled, load returns LazyComponent proxies (in a Layout if
+        there are multiple entries) that unpickle the corresponding
+        entry on first access.""")
+
+    memory_budget = param.Integer(default=None, allow_None=True, bounds=(0, None), doc="""
+        The maximum total size in bytes of the (uncompressed) pickled
+        entries that lazily loaded components may hold in memory at
+        once. When exceeded, the least recently used components are
+        released. If None, loaded components are never released.""")
+
+    def __call__(self, data, entries=None, lazy=None):
         buff = BytesIO(data)
-        return self.load(buff, entries=entries)
+        return self.load(buff, entries=entries, lazy=lazy)
 
     @bothmethod
-    def load(self_or_cls, filename, entries=None):
+    def load(self_or_cls, filename, entries=None, lazy=None):
         components, single_layout = [], False
+        lazy = self_or_cls.lazy if lazy is None else lazy
         entries = entries if entries else self_or_cls.entries(filename)
+        loaded = OrderedDict()
         with zipfile.ZipFile(filename, 'r') as f:
             for entry in entries:
                 if entry not in f.namelist():
                     raise Exception("Entry %s not available" % entry)
-                components.append(Store.loads(f.read(entry)))
+                if lazy:
+                    component = LazyComponent(filename, entry, f.getinfo(entry).file_size,
+                                              loaded, self_or_cls.memory_budget)
+                else:
+                    component = self_or_cls._load_entry(f, filename, entry)
+                components.append(component)
                 single_layout = entry.endswith('(L)')
 
         if len(components) == 1 and not single_layout:
             return components[0]
+        elif lazy:
+            return Layout(items=[(self_or_cls._entry_path(entry), component)
+                                 for entry, component in zip(entries, components)])
         else:
             return Layout.from_values(components)
 
+    @classmethod
+    def _load_entry(cls, zipf, filename, entry):
+        "Unpickles the given entry of an open archive"
+        unpickler = ArrayUnpickler(BytesIO(zipf.read(entry)), zipf, filename)
+        with Store.state_lock:
+            Store.load_counter_offset = max(Store.custom_options) if Store.custom_options else 0
+            try:
+                return unpickler.load()
+            finally:
+                Store.load_counter_offset = None
+
+    @classmethod
+    def _entry_path(cls, entry):
+        "Returns the Layout path of the component saved under entry"
+        entry = entry[:-3] if entry.endswith('(L)') else entry
+        path = tuple(el for el in entry.split('.') if el)
+        return path if len(path) > 1 else path + ('I',)
+
     @bothmethod
     def _load_metadata(self_or_cls, filename, name):
         with zipfile.ZipFile(filename, 'r') as f:
@@ -395,7 +783,8 @@ class Unpickler(Importer):
     @bothmethod
     def entries(self_or_cls, filename):
         with zipfile.ZipFile(filename, 'r') as f:
-            return [el for el in f.namelist() if el != 'metadata']
+            return [el for el in f.namelist() if el != 'metadata'
+                    and not el.startswith(ArrayPickler.array_prefix)]
 
 
 
@@ -525,6 +914,28 @@ class FileArchive(Archive):
        practical maximum for zip and tar file generation, but you may
        wish to use a lower value to avoid long filenames.""")
 
+    asynchronous = param.Boolean(default=False, doc="""
+       Whether objects are rendered by a pool of worker threads as
+       they are added, with the rendered files written out to the
+       export directory or archive in the order they were added as
+       soon as they are ready. Export then only finalizes the
+       archive.
+
+       In this mode, the {timestamp} field is set at the time of the
+       first call to add and the exporters must be safe to call from
+       a background thread. Exporters pickling objects through the
+       Store, such as the Pickler, hold Store.state_lock while doing
+       so and therefore run one at a time.""")
+
+    workers = param.Integer(default=1, bounds=(1,None), doc="""
+       The number of worker threads used to render objects when
+       asynchronous is enabled.""")
+
+    max_pending = param.Integer(default=4, bounds=(1,None), doc="""
+       The maximum number of added objects that may be rendering or
+       waiting to be written out when asynchronous is enabled. Once
+       reached, add blocks until the oldest object is written out.""")
+
 
     ffields = {'type', 'group', 'label', 'obj', 'SHA', 'timestamp', 'dimensions'}
     efields = {'timestamp'}
@@ -540,9 +951,15 @@ class FileArchive(Archive):
             raise SyntaxError("Could not parse formatter %r" % formatter)
 
     def __init__(self, **params):
-        super(FileArchive, self).__init__(**params)
+        # The state used by __len__ is set up first as some versions of
+        # param evaluate the truth value of the object when setting
+        # parameters during initialization
         #  Items with key: (basename,ext) and value: (data, info)
         self._files = OrderedDict()
+        # State of asynchronous exports
+        self._executor, self._timestamp = None, None
+        self._pending, self._archive, self._held = [], None, None
+        super(FileArchive, self).__init__(**params)
         self._validate_formatters()
 
 
@@ -601,21 +1018,96 @@ class FileArchive(Archive):
 
         self._validate_formatters()
 
-        entries = []
-        if data is None:
-            for exporter in self.exporters:
-                rendered = exporter(obj)
-                if rendered is None: continue
-                (data, new_info) = rendered
-                info = dict(info, **new_info)
-                entries.append((data, info))
-        else:
-            entries.append((data, info))
+        if self.asynchronous:
+            self._add_async(obj, filename, data, info)
+            return
 
+        entries = self._render(obj, info) if data is None else [(data, info)]
         for (data, info) in entries:
             self._add_content(obj, data, info, filename=filename)
 
 
+    def _render(self, obj, info):
+        "Returns the (data, info) entries generated by the exporters"
+        entries = []
+        for exporter in self.exporters:
+            rendered = exporter(obj)
+            if rendered is None: continue
+            (data, new_info) = rendered
+            info = dict(info, **new_info)
+            entries.append((data, info))
+        return entries
+
+
+    def _add_async(self, obj, filename, data, info):
+        if self._timestamp is None:
+            self._timestamp = time.strftime(self.timestamp_format,
+                                            tuple(time.localtime()))
+        if data is not None:
+            entries = [(data, info)]
+        elif ThreadPoolExecutor is None:
+            entries = self._render(obj, info)
+        else:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers)
+            entries = self._executor.submit(self._render, obj, info)
+        self._pending.append((obj, filename, entries))
+        self._flush(self.max_pending)
+
+
+    def _flush(self, maximum=0):
+        """
+        Writes out the files rendered for the pending objects in the
+        order they were added, blocking until no more than maximum
+        objects are pending.
+        """
+        while self._pending:
+            (obj, filename, entries) = self._pending[0]
+            ready = not hasattr(entries, 'result') or entries.done()
+            if not ready and len(self._pending) <= maximum:
+                break
+            self._pending.pop(0)
+            entries = entries.result() if hasattr(entries, 'result') else entries
+            for (data, info) in entries:
+                (basename, ext) = self._compute_filename(obj, info, filename=filename)
+                self._files[(basename, ext)] = (None, info)
+                basename = self._format(basename, {'timestamp': self._timestamp})
+                self._write_async((basename, ext), (data, info))
+
+
+    def _write_async(self, key, entry):
+        """
+        Writes a file to the export directory or archive, which is
+        only opened once a second file is written as a single file is
+        exported on its own.
+        """
+        if self._archive is None and self._held is None:
+            self._held = (key, entry)
+            return
+        export_name = self._format(self.export_name, {'timestamp': self._timestamp})
+        if self._archive is None:
+            self._archive = self._open_archive(export_name, os.path.abspath(self.root))
+            (held, self._held) = (self._held, None)
+            self._archive_file(self._archive, export_name, *held)
+        self._archive_file(self._archive, export_name, key, entry)
+
+
+    def _export_async(self):
+        "Writes out any pending files and finalizes the export"
+        try:
+            self._flush()
+            if self._held is not None:
+                export_name = self._format(self.export_name, {'timestamp': self._timestamp})
+                self._single_file_archive(export_name, [self._held], os.path.abspath(self.root))
+            elif isinstance(self._archive, (zipfile.ZipFile, tarfile.TarFile)):
+                self._archive.close()
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown()
+            self._executor, self._timestamp = None, None
+            self._pending, self._archive, self._held = [], None, None
+
+
     def _add_content(self, obj, data, info, filename=None):
         (unique_key, ext) = self._compute_filename(obj, info, filename=filename)
         self._files[(unique_key, ext)] = (data, info)
@@ -646,22 +1138,47 @@ class FileArchive(Archive):
                                               self._files.keys(), force=True)
         return (unique_key, ext)
 
+    def _open_archive(self, export_name, root, archive_format=None):
+        """
+        Returns the output directory (if pack is False) or the zip or
+        tar file the exported files are to be written to.
+        """
+        if not self.pack and archive_format is None:
+            output_dir = os.path.join(root, self._unique_name(export_name,'', root)[0])
+            if os.path.isdir(output_dir):
+                shutil.rmtree(output_dir)
+            os.makedirs(output_dir)
+            return output_dir
+        archive_format = self.archive_format if archive_format is None else archive_format
+        archname = '.'.join(self._unique_name(export_name, archive_format, root))
+        if archive_format == 'zip':
+            return zipfile.ZipFile(os.path.join(root, archname), 'w')
+        else:
+            return tarfile.TarFile(os.path.join(root, archname), 'w')
+
+    def _archive_file(self, archive, export_name, key, entry):
+        "Writes a single file to an archive opened with _open_archive"
+        filename = self._truncate_name(*key)
+        filedata = Exporter.encode(entry)
+        if isinstance(archive, zipfile.ZipFile):
+            archive.writestr(('%s/%s' % (export_name, filename)), filedata)
+        elif isinstance(archive, tarfile.TarFile):
+            tarinfo = tarfile.TarInfo('%s/%s' % (export_name, filename))
+            tarinfo.size = len(filedata)
+            archive.addfile(tarinfo, BytesIO(filedata))
+        else:
+            with open(os.path.join(archive, filename), 'wb') as f:
+                f.write(filedata)
+
     def _zip_archive(self, export_name, files, root):
-        archname = '.'.join(self._unique_name(export_name, 'zip', root))
-        with zipfile.ZipFile(os.path.join(root, archname), 'w') as zipf:
-            for (basename, ext), entry in files:
-                filename = self._truncate_name(basename, ext)
-                zipf.writestr(('%s/%s' % (export_name, filename)),Exporter.encode(entry))
+        with self._open_archive(export_name, root, 'zip') as zipf:
+            for key, entry in files:
+                self._archive_file(zipf, export_name, key, entry)
 
     def _tar_archive(self, export_name, files, root):
-        archname = '.'.join(self._unique_name(export_name, 'tar', root))
-        with tarfile.TarFile(os.path.join(root, archname), 'w') as tarf:
-            for (basename, ext), entry in files:
-                filename = self._truncate_name(basename, ext)
-                tarinfo = tarfile.TarInfo('%s/%s' % (export_name, filename))
-                filedata = Exporter.encode(entry)
-                tarinfo.size = len(filedata)
-                tarf.addfile(tarinfo, BytesIO(filedata))
+        with self._open_archive(export_name, root, 'tar') as tarf:
+            for key, entry in files:
+                self._archive_file(tarf, export_name, key, entry)
 
     def _single_file_archive(self, export_name, files, root):
         ((basename, ext), entry) = files[0]
@@ -674,17 +1191,9 @@ class FileArchive(Archive):
             f.write(Exporter.encode(entry))
 
     def _directory_archive(self, export_name, files, root):
-        output_dir = os.path.join(root, self._unique_name(export_name,'', root)[0])
-        if os.path.isdir(output_dir):
-            shutil.rmtree(output_dir)
-        os.makedirs(output_dir)
-
-        for (basename, ext), entry in files:
-            (data, info) = entry
-            filename = self._truncate_name(basename, ext)
-            fpath = os.path.join(output_dir, filename)
-            with open(fpath, 'wb') as f:
-                f.write(Exporter.encode(entry))
+        output_dir = self._open_archive(export_name, root)
+        for key, entry in files:
+            self._archive_file(output_dir, export_name, key, entry)
 
 
     def _unique_name(self, basename, ext, existing, force=False):
@@ -733,6 +1242,10 @@ class FileArchive(Archive):
         """
         Export the archive, directory or file.
         """
+        if self.asynchronous:
+            self._export_async()
+            self._files = OrderedDict()
+            return
         tval = tuple(time.localtime()) if timestamp is None else timestamp
         tstamp = time.strftime(self.timestamp_format, tval)
 
@@ -4,14 +4,21 @@ map types. The former class only allows indexing whereas the latter
 also enables slicing over multiple dimension ranges.
 """
 
-from operator import itemgetter
+import bisect
+import numbers
+try:
+    from collections.abc import MutableMapping
+except ImportError:
+    from collections import MutableMapping
+
 import numpy as np
 
 import param
 
 from . import traversal
 from .dimension import OrderedDict, Dimension, Dimensioned, ViewableElement
-from .util import unique_iterator, sanitize_identifier, dimension_sort, group_select, iterative_select
+from .util import (unique_iterator, sanitize_identifier, dimension_sort,
+                   is_number, value_ranks, factorize)
 
 
 class item_check(object):
@@ -55,6 +62,326 @@ class sorted_context(object):
 
 
 
+class ColumnarData(MutableMapping):
+    """
+    ColumnarData is an ordered mapping of key tuples to value tuples,
+    which stores the keys and values column by column, holding one
+    NumPy array per key and value component. Columns of only integers,
+    only floats, only complex numbers or only booleans are stored in
+    typed arrays, all other columns (including columns mixing integers
+    and floats) in object arrays, so that the values keep their type.
+
+    Rows added after the columns have been built are buffered and
+    merged into the columns when they are next accessed. Looking up a
+    row by key uses a dictionary mapping each key to its row, which is
+    only built once a key is first looked up.
+
+    ColumnarData may be initialized with a dictionary or a list of
+    (key, value) items, which must not contain duplicate keys.
+    """
+
+    def __init__(self, items=None):
+        self._key_columns, self._value_columns = [], []
+        self._rows = 0
+        self._shape = None
+        self._pending = []
+        self._index = None
+        if items is not None:
+            items = list(items.items() if isinstance(items, (dict, MutableMapping))
+                         else items)
+            for key, value in items:
+                self._check_row(key, value)
+            self._pending = items
+            self._flush()
+
+
+    @classmethod
+    def from_columns(cls, key_columns, value_columns):
+        """
+        Constructs ColumnarData from lists of key and value columns,
+        which must all be of the same length and must not contain
+        duplicate keys.
+        """
+        columns = [cls._column_array(c) if not isinstance(c, np.ndarray) else c
+                   for c in list(key_columns) + list(value_columns)]
+        lengths = set(len(c) for c in columns)
+        if len(lengths) > 1:
+            raise ValueError("Columns must all be of the same length.")
+        data = cls()
+        data._rows = lengths.pop() if lengths else 0
+        if data._rows:
+            ndims = len(key_columns)
+            data._shape = (ndims, len(columns)-ndims)
+            data._key_columns, data._value_columns = columns[:ndims], columns[ndims:]
+        return data
+
+
+    @staticmethod
+    def _type_kind(t):
+        "Returns the kind of typed column that may hold values of type t."
+        if issubclass(t, (bool, np.bool_)):
+            return 'b'
+        elif issubclass(t, (numbers.Integral, np.integer)):
+            return 'i'
+        elif issubclass(t, (numbers.Real, np.floating)):
+            return 'f'
+        elif issubclass(t, (numbers.Complex, np.complexfloating)):
+            return 'c'
+        return None
+
+
+    @classmethod
+    def _column_array(cls, values):
+        """
+        Converts a sequence of values into a column array, which is a
+        typed array if all values are of the same kind (booleans,
+        integers, floats or complex numbers) and an object array
+        otherwise.
+        """
+        types = set(type(v) for v in values)
+        kinds = set(cls._type_kind(t) for t in types)
+        if kinds == {'b'}:
+            return np.array(values, dtype=bool)
+        elif len(kinds) == 1 and None not in kinds:
+            column = np.array(values)
+            if column.ndim == 1:
+                return column
+        column = np.empty(len(values), dtype=object)
+        if any(issubclass(t, (list, tuple, np.ndarray)) for t in types):
+            for i, v in enumerate(values):
+                column[i] = v
+        else:
+            column[:] = values
+        return column
+
+
+    @staticmethod
+    def _column_kind(column):
+        kind = column.dtype.kind
+        return 'i' if kind == 'u' else kind
+
+
+    @classmethod
+    def _concatenate(cls, column, other):
+        """
+        Concatenates two columns, falling back to an object column if
+        the kinds of the two columns are incompatible.
+        """
+        if not len(column):
+            return other
+        elif not len(other):
+            return column
+        elif cls._column_kind(column) != cls._column_kind(other):
+            column, other = column.astype(object), other.astype(object)
+        return np.concatenate([column, other])
+
+
+    @staticmethod
+    def _item(column, row):
+        value = column[row]
+        return value.item() if isinstance(value, np.generic) else value
+
+
+    def _check_row(self, key, value):
+        shape = (len(key), len(value))
+        if self._shape is None:
+            self._shape = shape
+        elif shape != self._shape:
+            raise ValueError("ColumnarData rows must all have %d key and %d value "
+                             "components, not %d and %d." % (self._shape + shape))
+
+
+    def _flush(self):
+        """
+        Merges the buffered rows into the columns.
+        """
+        if not self._pending:
+            return
+        keys, values = zip(*self._pending)
+        ndims, nvals = self._shape
+        key_columns = [self._column_array(c) for c in zip(*keys)] if ndims else []
+        value_columns = [self._column_array(c) for c in zip(*values)] if nvals else []
+        if self._rows:
+            key_columns = [self._concatenate(c, n) for c, n
+                           in zip(self._key_columns, key_columns)]
+            value_columns = [self._concatenate(c, n) for c, n
+                             in zip(self._value_columns, value_columns)]
+        self._key_columns, self._value_columns = key_columns, value_columns
+        self._rows += len(self._pending)
+        self._pending = []
+
+
+    def _get_index(self):
+        if self._index is None:
+            self._index = {key: row for row, key in enumerate(self)}
+        return self._index
+
+
+    def _key_at(self, row):
+        if row >= self._rows:
+            return self._pending[row-self._rows][0]
+        return tuple(self._item(c, row) for c in self._key_columns)
+
+
+    def _value_at(self, row):
+        if row >= self._rows:
+            return self._pending[row-self._rows][1]
+        return tuple(self._item(c, row) for c in self._value_columns)
+
+
+    def _assign(self, row, value):
+        """
+        Overwrites the values in the specified row of the columns,
+        promoting the type of any column that cannot hold the value.
+        """
+        for i, v in enumerate(value):
+            column = self._value_columns[i]
+            new = self._column_array([v])
+            if self._column_kind(column) != self._column_kind(new):
+                column = column.astype(object)
+            elif column.dtype != object:
+                column = column.astype(np.result_type(column, new), copy=False)
+            column[row] = v
+            self._value_columns[i] = column
+
+
+    @property
+    def ndims(self):
+        "The number of key components or None if there are no rows."
+        return None if self._shape is None else self._shape[0]
+
+
+    def key_column(self, index):
+        "Returns the array of key values along the specified component."
+        self._flush()
+        return self._key_columns[index] if self._rows else np.array([])
+
+
+    def value_column(self, index):
+        "Returns the array of values along the specified component."
+        self._flush()
+        return self._value_columns[index] if self._rows else np.array([])
+
+
+    def row(self, index):
+        "Returns the (key, value) pair in the specified row."
+        return self._key_at(index), self._value_at(index)
+
+
+    def take(self, rows):
+        """
+        Returns new ColumnarData holding the specified rows, in the
+        order the rows are supplied.
+        """
+        self._flush()
+        rows = np.asarray(rows, dtype=int)
+        data = ColumnarData()
+        if self._rows and len(rows):
+            data._key_columns = [c[rows] for c in self._key_columns]
+            data._value_columns = [c[rows] for c in self._value_columns]
+            data._rows, data._shape = len(rows), self._shape
+        return data
+
+
+    def select_values(self, indices):
+        """
+        Returns new ColumnarData holding the keys and only the
+        specified value components.
+        """
+        data = self.copy()
+        if data._rows:
+            data._value_columns = [data._value_columns[i] for i in indices]
+            data._shape = (data._shape[0], len(indices))
+        return data
+
+
+    def copy(self):
+        self._flush()
+        data = ColumnarData()
+        data._key_columns = [c.copy() for c in self._key_columns]
+        data._value_columns = [c.copy() for c in self._value_columns]
+        data._rows, data._shape = self._rows, self._shape
+        return data
+
+
+    def keys(self):
+        return list(self)
+
+
+    def values(self):
+        self._flush()
+        if not self._rows:
+            return []
+        elif not self._shape[1]:
+            return [()] * self._rows
+        return list(zip(*[c.tolist() for c in self._value_columns]))
+
+
+    def items(self):
+        return list(zip(self.keys(), self.values()))
+
+
+    def __getitem__(self, key):
+        return self._value_at(self._get_index()[key])
+
+
+    def __setitem__(self, key, value):
+        index = self._get_index()
+        row = index.get(key)
+        if row is None:
+            self._check_row(key, value)
+            index[key] = self._rows + len(self._pending)
+            self._pending.append((key, value))
+        elif row >= self._rows:
+            self._pending[row-self._rows] = (key, value)
+        else:
+            self._check_row(key, value)
+            self._assign(row, value)
+
+
+    def __delitem__(self, key):
+        row = self._get_index()[key]
+        self._flush()
+        self._key_columns = [np.delete(c, row) for c in self._key_columns]
+        self._value_columns = [np.delete(c, row) for c in self._value_columns]
+        self._rows -= 1
+        self._index = None
+
+
+    def __contains__(self, key):
+        return key in self._get_index()
+
+
+    def __iter__(self):
+        self._flush()
+        if not self._rows:
+            return iter([])
+        elif not self._shape[0]:
+            return iter([()] * self._rows)
+        return iter(zip(*[c.tolist() for c in self._key_columns]))
+
+
+    def __reversed__(self):
+        for row in range(len(self)-1, -1, -1):
+            yield self._key_at(row)
+
+
+    def __len__(self):
+        return self._rows + len(self._pending)
+
+
+    def __repr__(self):
+        return '%s(%r)' % (type(self).__name__, self.items())
+
+
+    def __getstate__(self):
+        self._flush()
+        state = self.__dict__.copy()
+        state['_index'] = None
+        return state
+
+
+
 class MultiDimensionalMapping(Dimensioned):
     """
     An MultiDimensionalMapping is a Dimensioned mapping (like a
@@ -90,21 +417,32 @@ class MultiDimensionalMapping(Dimensioned):
     _sorted = True
     _check_items = True
 
+    # Sorted list of (sort key, key) pairs mirroring the data order
+    _sort_index = None
+    _pending_sort = False
+
+    # Columnar key store holding the list of keys in data order and
+    # one array of key values per key dimension
+    _key_store = None
+
+    # Whether the data is shared with a clone and has to be copied
+    # before it is modified
+    _shared = False
+
+    # Whether the data is stored as ColumnarData instead of an OrderedDict
+    _columnar = False
+
     def __init__(self, initial_items=None, **params):
         if isinstance(initial_items, NdMapping):
-            map_type = type(initial_items)
-            own_params = self.params()
-            new_params = dict(initial_items.get_param_values(onlychanged=True))
-            if new_params.get('group') == map_type.__name__:
-                new_params.pop('group')
-            params = dict({name: value for name, value in new_params.items()
-                           if name in own_params}, **params)
+            params = dict(self._inherited_params(initial_items), **params)
         super(MultiDimensionalMapping, self).__init__(OrderedDict(), **params)
 
         self._next_ind = 0
         self._check_key_type = True
         self._cached_index_types = [d.type for d in self.key_dimensions]
         self._cached_index_values = {d.name:d.values for d in self.key_dimensions}
+        self._cached_index_ranks = {d.name: {} if d.values == 'initial' else value_ranks(d.values)
+                                    for d in self.key_dimensions if d.values}
         self._cached_categorical = any(d.values for d in self.key_dimensions)
 
         self._instantiated = not any(v == 'initial' for v in self._cached_index_values.values())
@@ -112,11 +450,16 @@ class MultiDimensionalMapping(Dimensioned):
         if isinstance(initial_items, tuple):
             self._add_item(initial_items[0], initial_items[1])
         elif not self._check_items and self._instantiated:
-            if isinstance(initial_items, (dict, MultiDimensionalMapping)):
-                initial_items = initial_items.items()
-            self.data = OrderedDict((k if isinstance(k, tuple) else (k,), v)
-                                    for k, v in initial_items)
+            if isinstance(initial_items, ColumnarData):
+                self.data = initial_items
+            else:
+                if isinstance(initial_items, (dict, MultiDimensionalMapping)):
+                    initial_items = initial_items.items()
+                self.data = OrderedDict((k if isinstance(k, tuple) else (k,), v)
+                                        for k, v in initial_items)
             self._resort()
+        elif isinstance(initial_items, ColumnarData):
+            self.extend(initial_items)
         elif initial_items is not None:
             self.update(OrderedDict(initial_items))
         self._instantiated = True
@@ -141,6 +484,20 @@ class MultiDimensionalMapping(Dimensioned):
             raise KeyError('Key has to match number of dimensions.')
 
 
+    @classmethod
+    def _inherited_params(cls, mapping):
+        """
+        Returns the parameters of the supplied NdMapping passed on to
+        a mapping of this class constructed from it.
+        """
+        own_params = cls.params()
+        new_params = dict(mapping.get_param_values(onlychanged=True))
+        if new_params.get('group') == type(mapping).__name__:
+            new_params.pop('group')
+        return {name: value for name, value in new_params.items()
+                if name in own_params}
+
+
     def _add_item(self, dim_vals, data, sort=True):
         """
         Adds item to the data, applying dimension types and ensuring
@@ -157,29 +514,46 @@ class MultiDimensionalMapping(Dimensioned):
 
         # Check and validate for categorical dimensions
         if self._cached_categorical:
-            valid_vals = zip(self._cached_index_names, dim_vals)
+            valid_vals = zip(self.key_dimensions, dim_vals)
         else:
             valid_vals = []
 
         for dim, val in valid_vals:
-            vals = self._cached_index_values[dim]
-            if vals == 'initial': self._cached_index_values[dim] = []
-            if not self._instantiated and self.get_dimension(dim).values == 'initial':
-                if val not in vals:
-                    self._cached_index_values[dim].append(val)
-            elif vals and val not in vals:
+            if not dim.values: continue
+            vals = self._cached_index_values[dim.name]
+            if vals == 'initial': self._cached_index_values[dim.name] = []
+            if not self._instantiated and dim.values == 'initial':
+                self._add_categorical_value(dim.name, val)
+            elif vals and val not in self._cached_index_ranks[dim.name]:
                 raise KeyError('%s Dimension value %s not in'
-                               ' specified Dimension values.' % (dim, repr(val)))
+                               ' specified Dimension values.' % (dim.name, repr(val)))
 
+        self._unshare()
         # Updates nested data structures rather than simply overriding them.
-        if ((dim_vals in self.data)
-            and isinstance(self.data[dim_vals], (NdMapping, OrderedDict))):
-            self.data[dim_vals].update(data)
+        if dim_vals in self._data:
+            self._key_store = None
+            if isinstance(self._data[dim_vals], (NdMapping, OrderedDict)):
+                self._data[dim_vals].update(data)
+            else:
+                self._data[dim_vals] = data
+        elif sort and self._sorted:
+            self._data[dim_vals] = data
+            self._key_store = None
+            self._insert_sorted(dim_vals)
         else:
             self.data[dim_vals] = data
+            self._key_store = None
 
-        if sort:
-            self._resort()
+
+    def _add_categorical_value(self, dim, val):
+        """
+        Appends a value to the values of a categorical dimension
+        declared as 'initial', keeping the rank map in sync.
+        """
+        ranks = self._cached_index_ranks[dim]
+        if val not in ranks:
+            ranks[val] = len(self._cached_index_values[dim])
+            self._cached_index_values[dim].append(val)
 
 
     def _apply_key_type(self, keys):
@@ -236,21 +610,188 @@ class MultiDimensionalMapping(Dimensioned):
 
 
     def _resort(self):
-        if self._sorted:
-            resorted = dimension_sort(self.data, self.key_dimensions,
+        if not self._sorted:
+            return
+        elif isinstance(self._data, ColumnarData):
+            order = self._sort_order()
+            if (np.diff(order) < 0).any():
+                self.data = self._data.take(order)
+            else:
+                self._sort_index, self._pending_sort = None, False
+        else:
+            resorted = dimension_sort(self._get_data(), self.key_dimensions,
                                       self._cached_categorical,
-                                      self._cached_index_values)
+                                      self._cached_index_ranks)
             self.data = OrderedDict(resorted)
 
 
+    def _sort_order(self):
+        """
+        Returns the rows of ColumnarData in sorted order. Numeric key
+        columns and categorical dimensions are sorted directly on the
+        columnar key store, other keys using the usual sort semantics.
+        """
+        columns = self._get_key_store()[1]
+        if all(c.dtype.kind in 'biuf' for c in columns) and len(self._data):
+            return np.lexsort(columns[::-1]) if columns else np.arange(len(self._data))
+        rows = OrderedDict((k, i) for i, k in enumerate(self._data))
+        resorted = dimension_sort(rows, self.key_dimensions,
+                                  self._cached_categorical,
+                                  self._cached_index_ranks)
+        return np.array([i for _, i in resorted], dtype=int)
+
+
+    def _sort_key(self, key):
+        """
+        Returns the key used to sort the supplied key, replacing
+        values along categorical dimensions with their position in
+        the declared Dimension values.
+        """
+        if not self._cached_categorical:
+            return key
+        return tuple(self._cached_index_ranks[d.name][v] if d.values else v
+                     for d, v in zip(self.key_dimensions, key))
+
+
+    def _insert_sorted(self, key):
+        """
+        Inserts a key, which has just been appended to the data, into
+        the sorted index using a binary search. Keys arriving in
+        sorted order leave the data untouched, otherwise reordering
+        the data is deferred until it is next accessed. If the index
+        is missing or out of sync with the data, the data is resorted
+        and the index rebuilt.
+        """
+        index = self._sort_index
+        if index is None or len(index) != len(self._data)-1:
+            self._resort()
+            self._sort_index = [(self._sort_key(k), k) for k in self._data]
+            return
+        entry = (self._sort_key(key), key)
+        try:
+            position = bisect.bisect_right(index, entry)
+        except TypeError:
+            # Keys of incomparable types require a full resort
+            self._resort()
+            return
+        index.insert(position, entry)
+        if position != len(index)-1:
+            self._pending_sort = True
+
+
+    @property
+    def data(self):
+        """
+        The OrderedDict of items sorted along the key dimensions. If
+        the data is shared with a clone it is copied first, so that it
+        may be modified in place.
+        """
+        self._unshare()
+        return self._get_data()
+
+
+    def _get_data(self):
+        """
+        Returns the data, applying any pending sort, without copying
+        data shared with a clone. The data must not be modified.
+        """
+        if self._pending_sort:
+            if isinstance(self._data, ColumnarData):
+                index = self._data._get_index()
+                self._data = self._data.take([index[k] for _, k in self._sort_index])
+            else:
+                self._data = OrderedDict((k, self._data[k]) for _, k in self._sort_index)
+            self._pending_sort = False
+            self._key_store = None
+        return self._data
+
+
+    @data.setter
+    def data(self, data):
+        if self._columnar and not isinstance(data, ColumnarData):
+            data = ColumnarData(data)
+        self._data = data
+        self._sort_index = None
+        self._pending_sort = False
+        self._key_store = None
+        self._shared = False
+
+
+    def _share_data(self, other):
+        """
+        Shares the data of another mapping with the same key
+        dimensions, avoiding a copy until either mapping is modified.
+        """
+        self._data = other._get_data()
+        self._sort_index = other._sort_index
+        self._key_store = other._key_store
+        self._shared = other._shared = True
+        for dim, values in other._cached_index_values.items():
+            if isinstance(values, list) and self._cached_index_values[dim] == 'initial':
+                self._cached_index_values[dim] = list(values)
+                self._cached_index_ranks[dim] = dict(other._cached_index_ranks[dim])
+
+
+    def _unshare(self):
+        """
+        Copies the data if it is shared with another mapping so that
+        it may be modified in place.
+        """
+        if self._shared:
+            self._data = self._data.copy()
+            self._key_store = None
+            if self._sort_index is not None:
+                self._sort_index = list(self._sort_index)
+            self._shared = False
+
+
+    def _get_key_store(self):
+        """
+        Returns the columnar key store, consisting of the list of keys
+        in data order and a list of arrays holding the key values
+        along each key dimension. The arrays of categorical dimensions
+        hold the position of each key in the declared Dimension
+        values. If the data is stored as ColumnarData, the data takes
+        the place of the list of keys and the key columns are used
+        directly. The store is built lazily and discarded whenever
+        keys are added or removed.
+        """
+        if self._key_store is not None:
+            return self._key_store
+        data = self._get_data()
+        if isinstance(data, ColumnarData):
+            keys = data
+            columns = [data.key_column(i) for i in range(self.ndims)]
+        else:
+            keys = list(data.keys())
+            columns = list(zip(*keys))
+        for i, (dim, column) in enumerate(zip(self.key_dimensions, columns)):
+            if dim.values:
+                ranks = self._cached_index_ranks[dim.name]
+                column = [ranks[v] for v in column]
+            columns[i] = column if isinstance(column, np.ndarray) else np.array(column)
+        if not len(keys):
+            columns = [np.array([]) for _ in range(self.ndims)]
+        self._key_store = (keys, columns)
+        return self._key_store
+
+
     def clone(self, data=None, shared_data=True, *args, **overrides):
         """
         Overrides Dimensioned clone to avoid checking items if data
-        is unchanged.
+        is unchanged. If the data is shared and the key dimensions
+        are unchanged, the clone references the data of this mapping
+        until either of them is modified.
         """
+        share = (shared_data and (data is None or data is self._get_data())
+                 and 'key_dimensions' not in overrides)
         with item_check(not shared_data and self._check_items):
-            return super(MultiDimensionalMapping, self).clone(data, shared_data,
-                                                              *args, **overrides)
+            clone = super(MultiDimensionalMapping, self).clone([] if share else data,
+                                                               shared_data, *args,
+                                                               **overrides)
+        if share:
+            clone._share_data(self)
+        return clone
 
 
     def groupby(self, dimensions, container_type=None, group_type=None, **kwargs):
@@ -269,12 +810,27 @@ class MultiDimensionalMapping(Dimensioned):
                          for dim in dimensions))
         inames, idims = zip(*((dim.name, dim) for dim in self.key_dimensions
                               if not dim.name in dimensions))
-        selects = unique_iterator(itemgetter(*inds)(key) if len(inds) > 1 else (key[inds[0]],)
-                                  for key in self.data.keys())
+        iinds = [self.get_dimension_index(name) for name in inames]
+
+        # Partition the items by their group key in a single pass,
+        # the items within each group remain sorted
+        grouped = OrderedDict()
+        for key, value in self._get_data().items():
+            group_key = tuple(key[i] for i in inds)
+            if group_key not in grouped:
+                grouped[group_key] = []
+            grouped[group_key].append((tuple(key[i] for i in iinds), value))
+
+        # Each group is constructed directly as the group_type with
+        # the parameters it would inherit from a clone of this mapping,
+        # except for the constant dimensions which groups do not carry
         with item_check(False):
-            selects = group_select(list(selects))
-            groups = [(k, group_type(v.reindex(inames), **kwargs))
-                      for k, v in iterative_select(self, dimensions, selects)]
+            prototype = self.clone([], key_dimensions=list(idims))
+            settings = group_type._inherited_params(prototype)
+            settings.pop('constant_dimensions', None)
+            settings.update(kwargs)
+            groups = [(group_key, group_type(items, **settings))
+                      for group_key, items in grouped.items()]
             return container_type(groups, key_dimensions=dims)
 
 
@@ -296,7 +852,7 @@ class MultiDimensionalMapping(Dimensioned):
         dimensions.insert(dim_pos, dimension)
 
         items = OrderedDict()
-        for key, val in self.data.items():
+        for key, val in self._get_data().items():
             new_key = list(key)
             new_key.insert(dim_pos, dim_val)
             items[tuple(new_key)] = val
@@ -321,7 +877,7 @@ class MultiDimensionalMapping(Dimensioned):
             dimension = all_dims[dimension]
 
         if dimension in self._cached_index_names:
-            return [k[self.get_dimension_index(dimension)] for k in self.data.keys()]
+            return [k[self.get_dimension_index(dimension)] for k in self._get_data().keys()]
         elif dimension in all_dims:
             values = [el.dimension_values(dimension) for el in self
                       if dimension in el.dimensions()]
@@ -346,9 +902,9 @@ class MultiDimensionalMapping(Dimensioned):
 
         indices = [self.get_dimension_index(el) for el in dimension_labels]
 
-        keys = [tuple(k[i] for i in indices) for k in self.data.keys()]
+        keys = [tuple(k[i] for i in indices) for k in self._get_data().keys()]
         reindexed_items = OrderedDict(
-            (k, v) for (k, v) in zip(keys, self.data.values()))
+            (k, v) for (k, v) in zip(keys, self._get_data().values()))
         reduced_dims = set(self._cached_index_names).difference(dimension_labels)
         dimensions = [self.get_dimension(d) for d in dimension_labels
                       if d not in reduced_dims]
@@ -366,16 +922,29 @@ class MultiDimensionalMapping(Dimensioned):
                               constant_dimensions=constant_dimensions)
 
 
+    def _last_key(self):
+        """
+        Returns the last key along the map dimensions, looking it up in
+        the sorted index rather than applying a pending sort.
+        """
+        if self._pending_sort:
+            return self._sort_index[-1][1]
+        return next(reversed(self._data))
+
+
     @property
     def last(self):
         "Returns the item highest data item along the map dimensions."
-        return list(self.data.values())[-1] if len(self) else None
+        return self._data[self._last_key()] if len(self) else None
 
 
     @property
     def last_key(self):
         "Returns the last key value."
-        return list(self.keys())[-1] if len(self) else None
+        if not len(self):
+            return None
+        key = self._last_key()
+        return key[0] if self.ndims == 1 else key
 
 
     @property
@@ -404,15 +973,20 @@ class MultiDimensionalMapping(Dimensioned):
     def table(self, **kwargs):
         "Creates a table from the stored keys and data."
 
-        table = None
-        for key, value in self.data.items():
+        table, items = None, []
+        for key, value in self._get_data().items():
             value = value.table(**kwargs)
-            for idx, (dim, val) in enumerate(zip(self.key_dimensions, key)):
-                value = value.add_dimension(dim, idx, val)
             if table is None:
                 table = value
-            else:
-                table.update(value)
+                for dim in self._cached_index_names:
+                    if dim in table._cached_index_names:
+                        raise Exception('{dim} dimension already defined'.format(dim=dim))
+            items.extend((key + k, v) for k, v in value.data.items())
+        if table is None:
+            return None
+        table = table.clone(shared_data=False,
+                            key_dimensions=self.key_dimensions+table.key_dimensions)
+        table.extend(items, validate=None)
         return table
 
 
@@ -422,9 +996,14 @@ class MultiDimensionalMapping(Dimensioned):
             import pandas
         except ImportError:
             raise Exception("Cannot build a DataFrame without the pandas library.")
-        labels = self._cached_index_names + [self.group]
-        return pandas.DataFrame(
-            [dict(zip(labels, k + (v,))) for (k, v) in self.data.items()])
+        keys = list(self._get_data().keys())
+        columns = OrderedDict((name, [k[i] for k in keys])
+                              for i, name in enumerate(self._cached_index_names))
+        values = np.empty(len(keys), dtype=object)
+        for i, value in enumerate(self._get_data().values()):
+            values[i] = value
+        columns[self.group] = values
+        return pandas.DataFrame(columns, columns=list(columns))
 
 
     def update(self, other):
@@ -444,17 +1023,189 @@ class MultiDimensionalMapping(Dimensioned):
         self._resort()
 
 
+    def extend(self, items, validate='once'):
+        """
+        Inserts a list of (key, value) items, a dictionary or another
+        mapping in bulk, sorting the data only once all items have
+        been added.
+
+        The validate argument controls how the items are checked. If
+        'once', the keys are type coerced and validated against the
+        declared Dimension values a whole dimension at a time. If
+        'each', every item is inserted individually as in update and
+        if None, the items are assumed to be valid and are inserted
+        without any checks, although the values of categorical
+        Dimensions declared as 'initial' are still collected.
+        """
+        if validate not in ['once', 'each', None]:
+            raise ValueError("validate must be one of 'once', 'each' or None.")
+        if isinstance(items, ColumnarData) and validate != 'each':
+            return self._extend_columns(items, validate)
+        elif isinstance(items, NdMapping):
+            if self.key_dimensions != items.key_dimensions:
+                raise KeyError("Cannot extend with NdMapping that has"
+                               " a different set of key dimensions.")
+            items = items.data.items()
+        elif isinstance(items, dict):
+            items = items.items()
+        if validate == 'each':
+            return self.update(OrderedDict(items))
+
+        items = list(items)
+        if not items:
+            return
+        keys = [k if isinstance(k, tuple) else (k,) for k, _ in items]
+        values = [v for _, v in items]
+        if validate:
+            keys = self._validate_keys(keys)
+            for key, value in zip(keys, values):
+                self._item_check(key, value)
+        elif not self._instantiated:
+            self._collect_initial_values(list(zip(*keys)))
+
+        if len(self):
+            self._unshare()
+            data = self.data
+            self._sort_index = None
+            self._key_store = None
+            for key, value in zip(keys, values):
+                if key in data and isinstance(data[key], (NdMapping, OrderedDict)):
+                    data[key].update(value)
+                else:
+                    data[key] = value
+        elif self._columnar and len(set(keys)) == len(keys):
+            self.data = ColumnarData(zip(keys, values))
+        else:
+            self.data = OrderedDict(zip(keys, values))
+        self._resort()
+
+
+    def _extend_columns(self, data, validate):
+        """
+        Inserts the rows of the supplied ColumnarData, validating the
+        keys a whole column at a time. Where keys are repeated the
+        last row with that key is kept, as when inserting the rows
+        one by one.
+        """
+        if not len(data):
+            return
+        elif data.ndims != self.ndims:
+            raise KeyError('Key has to match number of dimensions.')
+        columns = [data.key_column(i) for i in range(self.ndims)]
+        if validate:
+            columns = self._validate_columns(columns)
+            if self.data_type is not None:
+                for key, value in data.items():
+                    self._item_check(key, value)
+        elif not self._instantiated:
+            self._collect_initial_values(columns)
+        columns = [c if isinstance(c, np.ndarray) else ColumnarData._column_array(c)
+                   for c in columns]
+
+        values = [data.value_column(i) for i in range(data._shape[1])]
+        groups, first = factorize(columns) if columns else ([], [0])
+        if len(first) < len(data):
+            last = np.zeros(len(first), dtype=int)
+            np.maximum.at(last, groups, np.arange(len(data)))
+            rows = np.sort(last)
+            columns, values = [c[rows] for c in columns], [v[rows] for v in values]
+        new = ColumnarData.from_columns(columns, values)
+        if len(self) or not self._columnar:
+            self.extend(new.items(), validate=None)
+        else:
+            self.data = new
+            self._resort()
+
+
+    def _validate_keys(self, keys):
+        """
+        Applies the dimension types to a list of keys and validates
+        them against any declared Dimension values, processing one
+        key dimension at a time.
+        """
+        if any(len(k) != self.ndims for k in keys):
+            raise KeyError('Key has to match number of dimensions.')
+        elif not self.ndims:
+            return keys
+        return list(zip(*self._validate_columns(list(zip(*keys)))))
+
+
+    def _validate_columns(self, columns):
+        """
+        Applies the dimension types to a list of key columns and
+        validates them against any declared Dimension values. Numeric
+        column arrays are cast to int or float types without leaving
+        NumPy.
+        """
+        validated = []
+        for dim, dim_type, column in zip(self.key_dimensions,
+                                         self._cached_index_types, columns):
+            if dim_type in (int, float) and isinstance(column, np.ndarray) \
+                    and column.dtype.kind in 'biuf':
+                column = column.astype(dim_type)
+            elif dim_type is not None:
+                column = [dim_type(v) for v in column]
+            if dim.values:
+                vals = self._cached_index_values[dim.name]
+                if vals == 'initial':
+                    vals = self._cached_index_values[dim.name] = []
+                ranks = self._cached_index_ranks[dim.name]
+                items = column.tolist() if isinstance(column, np.ndarray) else column
+                if not self._instantiated and dim.values == 'initial':
+                    for v in unique_iterator(items):
+                        self._add_categorical_value(dim.name, v)
+                elif vals:
+                    invalid = [v for v in items if v not in ranks]
+                    if invalid:
+                        raise KeyError('%s Dimension value %s not in'
+                                       ' specified Dimension values.'
+                                       % (dim.name, repr(invalid[0])))
+            validated.append(column)
+        return validated
+
+
+    def _collect_initial_values(self, columns):
+        """
+        Collects the values of categorical Dimensions declared as
+        'initial' from the key columns when the keys are inserted
+        without validation.
+        """
+        for dim, column in zip(self.key_dimensions, columns):
+            if dim.values != 'initial':
+                continue
+            elif self._cached_index_values[dim.name] == 'initial':
+                self._cached_index_values[dim.name] = []
+            items = column.tolist() if isinstance(column, np.ndarray) else column
+            for v in unique_iterator(items):
+                self._add_categorical_value(dim.name, v)
+
+
+    @classmethod
+    def from_items(cls, items, validate='once', **params):
+        """
+        Constructs a new mapping from a list of (key, value) items or
+        a dictionary, inserting them in bulk using the extend method.
+        Categorical Dimensions with values declared as 'initial'
+        collect their values from the supplied items.
+        """
+        mapping = cls(**params)
+        mapping._instantiated = False
+        mapping.extend(items, validate=validate)
+        mapping._instantiated = True
+        return mapping
+
+
     def keys(self):
         " Returns the keys of all the elements."
         if self.ndims == 1:
-            return [k[0] for k in self.data.keys()]
+            return [k[0] for k in self._get_data().keys()]
         else:
-            return list(self.data.keys())
+            return list(self._get_data().keys())
 
 
     def values(self):
         " Returns the values of all the elements."
-        return list(self.data.values())
+        return list(self._get_data().values())
 
 
     def items(self):
@@ -475,7 +1226,11 @@ class MultiDimensionalMapping(Dimensioned):
     def pop(self, key, default=None):
         "Standard pop semantics for all mapping types"
         if not isinstance(key, tuple): key = (key,)
-        return self.data.pop(key, default)
+        self._unshare()
+        value = self.data.pop(key, default)
+        self._sort_index = None
+        self._key_store = None
+        return value
 
 
     def __getitem__(self, key):
@@ -487,7 +1242,7 @@ class MultiDimensionalMapping(Dimensioned):
         if key in [Ellipsis, ()]:
             return self
         map_slice, data_slice = self._split_index(key)
-        return self._dataslice(self.data[map_slice], data_slice)
+        return self._dataslice(self._get_data()[map_slice], data_slice)
 
 
     def __setitem__(self, key, value):
@@ -504,12 +1259,33 @@ class MultiDimensionalMapping(Dimensioned):
 
     def __contains__(self, key):
         if self.ndims == 1:
-            return key in self.data.keys()
+            return key in self._get_data().keys()
         else:
             return key in self.keys()
 
     def __len__(self):
-        return len(self.data)
+        return len(self._data)
+
+
+    def __getstate__(self):
+        state = super(MultiDimensionalMapping, self).__getstate__()
+        state['_data'] = self._get_data()
+        state.pop('_sort_index', None)
+        state.pop('_pending_sort', None)
+        state.pop('_key_store', None)
+        state.pop('_shared', None)
+        return state
+
+
+    def __setstate__(self, d):
+        # Pickles created before data was stored on the _data attribute
+        if 'data' in d:
+            d['_data'] = d.pop('data')
+        if '_cached_index_ranks' not in d and '_cached_index_values' in d:
+            d['_cached_index_ranks'] = {dim: value_ranks([] if vals == 'initial' else vals)
+                                        for dim, vals in d['_cached_index_values'].items()
+                                        if vals}
+        super(MultiDimensionalMapping, self).__setstate__(d)
 
 
 
@@ -542,14 +1318,27 @@ class NdMapping(MultiDimensionalMapping):
         map_slice = self._expand_slice(map_slice)
 
         if all(not isinstance(el, (slice, set, list, tuple)) for el in map_slice):
-            return self._dataslice(self.data[map_slice], data_slice)
+            return self._dataslice(self._get_data()[map_slice], data_slice)
+        elif not data_slice and all(isinstance(el, slice) and el == slice(None)
+                                    for el in map_slice):
+            # The whole mapping is selected, share the data with a clone
+            return self.clone()
         else:
             conditions = self._generate_conditions(map_slice)
-            items = self.data.items()
-            for cidx, (condition, dim) in enumerate(zip(conditions, self.key_dimensions)):
-                values = self._cached_index_values.get(dim.name, None)
+            mask, unmasked = self._generate_mask(map_slice)
+            data = self._get_data()
+            if isinstance(data, ColumnarData) and not data_slice:
+                return self._slice_columns(data, mask, unmasked, conditions)
+            elif mask is None:
+                items = list(data.items())
+            else:
+                keys = self._get_key_store()[0]
+                items = [(keys[i], data[keys[i]]) for i in np.flatnonzero(mask)]
+            for cidx in unmasked:
+                condition, dim = conditions[cidx], self.key_dimensions[cidx]
+                ranks = self._cached_index_ranks.get(dim.name, None)
                 items = [(k, v) for k, v in items
-                         if condition(values.index(k[cidx]) if values else k[cidx])]
+                         if condition(ranks[k[cidx]] if ranks else k[cidx])]
             items = [(k, self._dataslice(v, data_slice)) for k, v in items]
             if len(items) == 0:
                 raise KeyError('No items within specified slice.')
@@ -557,14 +1346,33 @@ class NdMapping(MultiDimensionalMapping):
                 return self.clone(items)
 
 
+    def _slice_columns(self, data, mask, unmasked, conditions):
+        """
+        Slices ColumnarData by taking the rows selected by the mask
+        and filtering them on any dimensions that could not be
+        vectorized, avoiding building the key and value tuples.
+        """
+        rows = np.arange(len(data)) if mask is None else np.flatnonzero(mask)
+        for cidx in unmasked:
+            condition, dim = conditions[cidx], self.key_dimensions[cidx]
+            ranks = self._cached_index_ranks.get(dim.name, None)
+            column = data.key_column(cidx)
+            rows = [r for r in rows
+                    if condition(ranks[column[r]] if ranks else column[r])]
+        if len(rows) == 0:
+            raise KeyError('No items within specified slice.')
+        with item_check(False):
+            return self.clone(data.take(rows))
+
+
     def _expand_slice(self, indices):
         """
         Expands slices containing steps into a list.
         """
-        keys = list(self.data.keys())
         expanded = []
         for idx, ind in enumerate(indices):
             if isinstance(ind, slice) and ind.step is not None:
+                keys, columns = self._get_key_store()
                 dim_ind = slice(ind.start, ind.stop)
                 if dim_ind == slice(None):
                     condition = self._all_condition()
@@ -574,7 +1382,13 @@ class NdMapping(MultiDimensionalMapping):
                     condition = self._from_condition(dim_ind)
                 else:
                     condition = self._range_condition(dim_ind)
-                dim_vals = unique_iterator(k[idx] for k in keys)
+                column = columns[idx]
+                if not self.key_dimensions[idx].values and column.dtype.kind in 'biuf':
+                    # Unique values in order of first occurrence
+                    uniques, first = np.unique(column, return_index=True)
+                    dim_vals = uniques[np.argsort(first)].tolist()
+                else:
+                    dim_vals = unique_iterator(k[idx] for k in keys)
                 expanded.append(set([k for k in dim_vals if condition(k)][::int(ind.step)]))
             else:
                 expanded.append(ind)
@@ -598,9 +1412,9 @@ class NdMapping(MultiDimensionalMapping):
             if isinstance(dim_slice, slice):
                 start, stop = dim_slice.start, dim_slice.stop
                 if dim.values:
-                    values = self._cached_index_values[dim.name]
-                    dim_slice = slice(None if start is None else values.index(start),
-                                      None if stop is None else values.index(stop))
+                    ranks = self._cached_index_ranks[dim.name]
+                    dim_slice = slice(None if start is None else ranks[start],
+                                      None if stop is None else ranks[stop])
                 if dim_slice == slice(None):
                     conditions.append(self._all_condition())
                 elif start is None:
@@ -611,7 +1425,7 @@ class NdMapping(MultiDimensionalMapping):
                     conditions.append(self._range_condition(dim_slice))
             elif isinstance(dim_slice, set):
                 if dim.values:
-                    dim_slice = [self._cached_index_values[dim.name].index(dim_val)
+                    dim_slice = [self._cached_index_ranks[dim.name][dim_val]
                                  for dim_val in dim_slice]
                 conditions.append(self._values_condition(dim_slice))
             elif dim_slice is Ellipsis:
@@ -620,11 +1434,63 @@ class NdMapping(MultiDimensionalMapping):
                 raise ValueError("Keys may only be selected with sets, not lists or tuples.")
             else:
                 if dim.values:
-                    dim_slice = self._cached_index_values[dim.name].index(dim_slice)
+                    dim_slice = self._cached_index_ranks[dim.name][dim_slice]
                 conditions.append(self._value_condition(dim_slice))
         return conditions
 
 
+    def _generate_mask(self, map_slice):
+        """
+        Evaluates the slice on the columnar key store, returning a
+        boolean mask over the keys in data order (or None if no
+        dimension was evaluated) along with the indices of any
+        dimensions that cannot be vectorized and still have to be
+        filtered using the conditions.
+        """
+        columns = self._get_key_store()[1]
+        mask, unmasked = None, []
+        for idx, (dim, dim_slice) in enumerate(zip(self.key_dimensions, map_slice)):
+            column = columns[idx]
+            if dim_slice is Ellipsis or (isinstance(dim_slice, slice) and
+                                         dim_slice == slice(None)):
+                continue
+            if dim.values:
+                ranks = self._cached_index_ranks[dim.name]
+                if isinstance(dim_slice, slice):
+                    dim_slice = slice(*[None if v is None else ranks[v]
+                                        for v in (dim_slice.start, dim_slice.stop,
+                                                  dim_slice.step)])
+                elif isinstance(dim_slice, set):
+                    dim_slice = {ranks[v] for v in dim_slice}
+                else:
+                    dim_slice = ranks[dim_slice]
+
+            if isinstance(dim_slice, slice):
+                start, stop = dim_slice.start, dim_slice.stop
+                bounds = [b for b in (start, stop) if b is not None]
+                vectorizable = dim_slice.step is None and all(is_number(b) for b in bounds)
+            elif isinstance(dim_slice, set):
+                vectorizable = all(is_number(v) for v in dim_slice)
+            else:
+                vectorizable = is_number(dim_slice)
+            if not vectorizable or column.dtype.kind not in 'biuf':
+                unmasked.append(idx)
+                continue
+
+            if isinstance(dim_slice, set):
+                dim_mask = np.in1d(column, list(dim_slice))
+            elif not isinstance(dim_slice, slice):
+                dim_mask = column == dim_slice
+            elif start is None:
+                dim_mask = column < stop
+            elif stop is None:
+                dim_mask = column > start
+            else:
+                dim_mask = (column >= start) & (column < stop)
+            mask = dim_mask if mask is None else mask & dim_mask
+        return mask, unmasked
+
+
     def _value_condition(self, value):
         return lambda x: x == value
 
@@ -680,6 +1546,9 @@ class UniformNdMapping(NdMapping):
     _deep_indexable = True
     _auxiliary_component = False
 
+    # Dimension groups of the contained HoloMaps (see traversal.uniform)
+    _dimension_groups = None
+
     def __init__(self, initial_items=None, group=None, label=None, **params):
         self._type = None
         self._group_check, self.group = None, group
@@ -695,16 +1564,43 @@ class UniformNdMapping(NdMapping):
         If shared_data is set to True and no data explicitly supplied,
         the clone will share data with the original.
         """
-        settings = dict(self.get_param_values())
-        if settings.get('group', None) != self._group:
-            settings.pop('group')
-        if settings.get('label', None) != self._label:
-            settings.pop('label')
+        # The group and label are only passed on if explicitly set,
+        # avoiding inferring them from all the items
+        settings = {name: getattr(self, name) for name in self.params()
+                    if name not in ['group', 'label']}
+        if self._group:
+            settings['group'] = self._group
+        if self._label:
+            settings['label'] = self._label
         settings.update(overrides)
-        if data is None and shared_data:
-            data = self.data
+        share = (shared_data and (data is None or data is self._get_data())
+                 and 'key_dimensions' not in overrides)
+        if share:
+            data = []
+        elif data is None and shared_data:
+            data = self._get_data()
         with item_check(not shared_data and self._check_items):
-            return self.__class__(data, *args, **settings)
+            clone = self.__class__(data, *args, **settings)
+        if share:
+            clone._share_data(self)
+        return clone
+
+
+    def _share_data(self, other):
+        super(UniformNdMapping, self)._share_data(other)
+        self._type = other._type
+        self._dimension_groups = other._dimension_groups
+
+
+    @MultiDimensionalMapping.data.setter
+    def data(self, data):
+        MultiDimensionalMapping.data.fset(self, data)
+        self._dimension_groups = None
+
+
+    def pop(self, key, default=None):
+        self._dimension_groups = None
+        return super(UniformNdMapping, self).pop(key, default)
 
 
     @property
@@ -769,9 +1665,16 @@ class UniformNdMapping(NdMapping):
             raise AssertionError("%s must only contain one type of object, not both %s and %s." %
                                  (self.__class__.__name__, type(data).__name__, self.type.__name__))
 
-        if not traversal.uniform(NdMapping([(0, self), (1, data)])):
-            raise ValueError("HoloMaps dimensions must be consistent in %s." %
-                             type(self).__name__)
+        # The dimension groups of the existing items are accumulated
+        # so only the new item has to be traversed
+        if self._dimension_groups is None:
+            self._dimension_groups = traversal.dimension_groups(self)
+        if data._deep_indexable:
+            dim_groups = self._dimension_groups | traversal.dimension_groups(data)
+            if not traversal.uniform_groups(dim_groups):
+                raise ValueError("HoloMaps dimensions must be consistent in %s." %
+                                 type(self).__name__)
+            self._dimension_groups = dim_groups
         super(UniformNdMapping, self)._item_check(dim_vals, data)
 
 
@@ -783,9 +1686,9 @@ class UniformNdMapping(NdMapping):
         """
         import pandas
         dframes = []
-        for key, view in self.data.items():
+        for key, view in self._get_data().items():
             view_frame = view.dframe()
-            for val, dim in reversed(zip(key, self._cached_index_names)):
+            for val, dim in reversed(list(zip(key, self._cached_index_names))):
                 dim = dim.replace(' ', '_')
                 dimn = 1
                 while dim in view_frame:
@@ -33,6 +33,8 @@ Store:
 
 """
 import pickle
+import weakref
+import threading
 from contextlib import contextmanager
 
 import numpy as np
@@ -300,11 +302,23 @@ class OptionTree(AttrTree):
     given an object and a mode. For a given node of the tree, the
     options method computes a Options object containing the result of
     inheritance for a given group up to the root of the tree.
+
+    The results of closest are memoized; the cache is invalidated
+    whenever any OptionTree is created or modified.
     """
 
+    # Incremented whenever any OptionTree is created or mutated
+    _version = 0
+
+    # Memoized closest lookups and the _version they were computed at
+    _closest_cache = {}
+    _closest_cache_version = 0
+    _closest_cache_size = 10000
+
     def __init__(self, items=None, identifier=None, parent=None, groups=None):
         if groups is None:
             raise ValueError('Please supply groups dictionary')
+        OptionTree._version += 1
         self.__dict__['groups'] = groups
         self.__dict__['_instantiated'] = False
         AttrTree.__init__(self, items, identifier, parent)
@@ -317,6 +331,7 @@ class OptionTree(AttrTree):
         name from the existing Options on the node and the
         new Options which are passed in.
         """
+        OptionTree._version += 1
         override_kwargs = dict(options.kwargs)
         if not self._instantiated:
             override_kwargs['allowed_keywords'] = options.allowed_keywords
@@ -364,6 +379,7 @@ class OptionTree(AttrTree):
 
 
     def __setattr__(self, identifier, val):
+        OptionTree._version += 1
         identifier = sanitize_identifier(identifier, escape=False)
         new_groups = {}
         if isinstance(val, dict):
@@ -427,7 +443,16 @@ class OptionTree(AttrTree):
         object
         """
         components = (obj.__class__.__name__, obj.group, obj.label)
-        return self.find(components).options(group)
+        cache = OptionTree._closest_cache
+        if (OptionTree._closest_cache_version != OptionTree._version or
+            len(cache) > OptionTree._closest_cache_size):
+            cache.clear()
+            OptionTree._closest_cache_version = OptionTree._version
+        # Custom trees fall back to Store.options so it is part of the key
+        key = (id(self), id(Store.options), group) + components
+        if key not in cache:
+            cache[key] = self.find(components).options(group)
+        return cache[key]
 
 
 
@@ -700,19 +725,29 @@ class Store(object):
 
     # A dictionary of custom OptionTree by custom object id
     custom_options = {}
+
+    # Weak references to the objects using each custom OptionTree id
+    _custom_option_owners = {}
+
     load_counter_offset = None
     save_option_state = False
 
+    # Held while load_counter_offset or save_option_state are set so
+    # that objects may be pickled and unpickled from several threads
+    state_lock = threading.RLock()
+
     @classmethod
     def load(cls, filename):
         """
         Equivalent to pickle.load except that the HoloViews trees is
         restored appropriately.
         """
-        cls.load_counter_offset = max(cls.custom_options) if cls.custom_options else 0
-        val = pickle.load(filename)
-        cls.load_counter_offset = None
-        return val
+        with cls.state_lock:
+            cls.load_counter_offset = max(cls.custom_options) if cls.custom_options else 0
+            try:
+                return pickle.load(filename)
+            finally:
+                cls.load_counter_offset = None
 
 
     @classmethod
@@ -729,10 +764,12 @@ class Store(object):
         Equivalent to pickle.loads except that the HoloViews trees is
         restored appropriately.
         """
-        cls.load_counter_offset = max(cls.custom_options) if cls.custom_options else 0
-        val = pickle.loads(pickle_string)
-        cls.load_counter_offset = None
-        return val
+        with cls.state_lock:
+            cls.load_counter_offset = max(cls.custom_options) if cls.custom_options else 0
+            try:
+                return pickle.loads(pickle_string)
+            finally:
+                cls.load_counter_offset = None
 
 
     @classmethod
@@ -741,9 +778,12 @@ class Store(object):
         Equivalent to pickle.dump except that the HoloViews option
         tree is saved appropriately.
         """
-        cls.save_option_state = True
-        pickle.dump(obj, filename, protocol=protocol)
-        cls.save_option_state = False
+        with cls.state_lock:
+            cls.save_option_state = True
+            try:
+                pickle.dump(obj, filename, protocol=protocol)
+            finally:
+                cls.save_option_state = False
 
     @classmethod
     def dumps(cls, obj, protocol=0):
@@ -751,10 +791,54 @@ class Store(object):
         Equivalent to pickle.dumps except that the HoloViews option
         tree is saved appropriately.
         """
-        cls.save_option_state = True
-        val = pickle.dumps(obj, protocol=protocol)
-        cls.save_option_state = False
-        return val
+        with cls.state_lock:
+            cls.save_option_state = True
+            try:
+                return pickle.dumps(obj, protocol=protocol)
+            finally:
+                cls.save_option_state = False
+
+
+    @classmethod
+    def register_id(cls, obj, old_id, new_id):
+        """
+        Records that obj switched from the custom options tree with
+        old_id to the one with new_id, allowing trees that are no longer
+        referenced by any live object to be garbage collected.
+        """
+        if old_id is not None and old_id in cls._custom_option_owners:
+            cls._custom_option_owners[old_id].discard(obj)
+        if new_id is not None:
+            if new_id not in cls._custom_option_owners:
+                cls._custom_option_owners[new_id] = weakref.WeakSet()
+            cls._custom_option_owners[new_id].add(obj)
+
+
+    @classmethod
+    def custom_option_counts(cls):
+        """
+        Returns a dictionary mapping the id of each custom options
+        tree to the number of live objects referencing it.
+        """
+        owners = cls._custom_option_owners
+        return {tree_id: len(owners[tree_id]) if tree_id in owners else 0
+                for tree_id in cls.custom_options}
+
+
+    @classmethod
+    def garbage_collect(cls):
+        """
+        Removes the custom options trees that are no longer referenced
+        by any live object, returning the list of removed ids.
+        """
+        removed = sorted(tree_id for tree_id, count in cls.custom_option_counts().items()
+                         if count == 0)
+        for tree_id in removed:
+            del cls.custom_options[tree_id]
+        for tree_id in list(cls._custom_option_owners):
+            if not cls._custom_option_owners[tree_id]:
+                del cls._custom_option_owners[tree_id]
+        return removed
 
 
     @classmethod
@@ -1093,6 +1177,7 @@ class StoreOptions(object):
 
         # {'Image.Channel:{'plot':  Options(size=50),
         #                  'style': Options('style', cmap='Blues')]}
+        Store.garbage_collect()
         options = cls.merge_options(options, **kwargs)
         spec, compositor_applied = cls.expand_compositor_keys(options)
         custom_trees, id_mapping = cls.create_custom_trees(obj, spec)
@@ -196,6 +196,11 @@ class PrettyPrinter(object):
         if node is None: return ''
         return cls.type_formatter.format(type=str(type(node).__name__))
 
+    @classmethod
+    def unresolved(cls, node):
+        "Whether the node is a lazily loaded proxy that is not yet loaded"
+        return getattr(node, 'resolved', True) is False
+
     @classmethod
     def recurse(cls, node, attrpath=None, attrpaths=[], siblings=[], level=0, value_dims=True):
         """
@@ -203,6 +208,7 @@ class PrettyPrinter(object):
         AttrTree node.
         """
         level, lines = cls.node_info(node, attrpath, attrpaths, siblings, level, value_dims)
+        if cls.unresolved(node): return lines
         attrpaths = ['.'.join(k) for k in node.keys()] if  hasattr(node, 'children') else []
         siblings = [node.get(child) for child in attrpaths]
         for index, attrpath in enumerate(attrpaths):
@@ -215,7 +221,9 @@ class PrettyPrinter(object):
         """
         Given a node, return relevant information.
         """
-        if hasattr(node, 'children'):
+        if cls.unresolved(node):
+            (lvl, lines) = (level, [(level, cls.component_type(node) + cls.tab + '(not loaded)')])
+        elif hasattr(node, 'children'):
             (lvl, lines) = (level, [(level, cls.component_type(node))])
         elif getattr(node, '_deep_indexable', False):
             (lvl, lines) = cls.ndmapping_info(node, siblings, level, value_dims)
@@ -14,20 +14,31 @@ def create_ndkey(length, indexes, values):
         key[i] = v
     return tuple(key)
 
+def dimension_groups(obj):
+    """
+    Returns the set of key dimension names of all the HoloMaps
+    contained in the object, each group of names as a frozenset.
+    """
+    from .element import HoloMap
+    return set(obj.traverse(lambda x: frozenset(x._cached_index_names),
+                            (HoloMap,)))
+
+
+def uniform_groups(dim_groups):
+    """
+    Whether all the supplied groups of dimension names are subsets
+    or supersets of each other.
+    """
+    return all(g1 <= g2 or g1 >= g2 for g1 in dim_groups for g2 in dim_groups)
+
+
 def uniform(obj):
     """
     Finds all common dimension keys in the object including subsets of
     dimensions. If there are is no common subset of dimensions, None
     is returned.
     """
-    from .element import HoloMap
-    dim_groups = obj.traverse(lambda x: tuple(x.key_dimensions),
-                              (HoloMap,))
-    if dim_groups:
-        dgroups = [[d.name for d in dg] for dg in dim_groups]
-        return all(set(g1) <= set(g2) or set(g1) >= set(g2)
-                   for g1 in dgroups for g2 in dgroups)
-    return True
+    return uniform_groups(dimension_groups(obj))
 
 
 def unique_dimkeys(obj, default_dim='Frame'):
@@ -40,9 +51,10 @@ def unique_dimkeys(obj, default_dim='Frame'):
     keys.
     """
     from .ndmapping import NdMapping
-    from .element import HoloMap
+    from .element import HoloMap, LazyHoloMap
     key_dims = obj.traverse(lambda x: (tuple(x.key_dimensions),
-                                       list(x.data.keys())), (HoloMap,))
+                                       x.key_space if isinstance(x, LazyHoloMap)
+                                       else list(x.data.keys())), (HoloMap,))
     if not key_dims:
         return [Dimension(default_dim)], [(0,)]
     dim_groups, keys = zip(*sorted(key_dims, key=lambda x: -len(x[0])))
@@ -61,13 +73,14 @@ def unique_dimkeys(obj, default_dim='Frame'):
     unique_keys = []
     for group, keys in zip(dim_groups, keys):
         dim_idxs = [all_dims.index(dim) for dim in group]
+        # A key is already covered if any unique key matches it along
+        # the dimensions of the group, found by hashing the projection
+        # of the unique keys onto those dimensions.
+        seen = set(tuple(item[i] for i in dim_idxs) for item in unique_keys)
         for key in keys:
-            padded_key = create_ndkey(ndims, dim_idxs, key)
-            matches = [item for item in unique_keys
-                       if padded_key == tuple(k if k is None else i
-                                              for i, k in zip(item, padded_key))]
-            if not matches:
-                unique_keys.append(padded_key)
+            if key not in seen:
+                seen.add(key)
+                unique_keys.append(create_ndkey(ndims, dim_idxs, key))
 
     sorted_keys = NdMapping({key: None for key in unique_keys},
                             key_dimensions=all_dims).data.keys()
@@ -83,10 +96,10 @@ def bijective(keys):
         return True
     for idx in range(ndims):
         getter = itemgetter(*(i for i in range(ndims) if i != idx))
-        store = []
+        store = set()
         for key in keys:
             subkey = getter(key)
             if subkey in store:
                 return False
-            store.append(subkey)
+            store.add(subkey)
     return True
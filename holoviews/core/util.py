@@ -1,4 +1,4 @@
-import sys, warnings, operator
+import sys, warnings
 import numbers
 import itertools
 import string
@@ -101,6 +101,20 @@ class sanitize_identifier_fn(param.ParameterizedFunction):
 
     prefix = 'A_'
 
+    # Maximum number of sanitized identifiers to memoize
+    _lookup_size = 10000
+
+    def _settings(self):
+        """
+        Returns the settings the sanitized identifiers depend on, which
+        are part of the memoization key so that changing a parameter on
+        the instance or class, or editing a list or dictionary parameter
+        in place, does not return stale identifiers.
+        """
+        return (self.capitalize, self.disable_leading_underscore, self.prefix,
+                tuple(self.eliminations), tuple(sorted(self.substitutions.items())),
+                tuple(self.transforms), tuple(self.disallowed))
+
     @param.parameterized.bothmethod
     def allowable(self_or_cls, name, disable_leading_underscore=None):
        disabled_reprs = ['javascript', 'jpeg', 'json', 'latex',
@@ -159,8 +173,19 @@ class sanitize_identifier_fn(param.ParameterizedFunction):
 
     def __call__(self, name, escape=True, version=None):
         if name in [None, '']: return name
-        name = safe_unicode(name)
         version = self.version if version is None else version
+        lookup_table = self.__dict__.setdefault('_lookup_table', {})
+        key = (name, version, self._settings())
+        if key in lookup_table:
+            return lookup_table[key]
+        sanitized = self._sanitize_name(safe_unicode(name), version)
+        if len(lookup_table) >= self._lookup_size:
+            lookup_table.clear()
+        lookup_table[key] = sanitized
+        return sanitized
+
+
+    def _sanitize_name(self, name, version):
         if not self.allowable(name):
             raise AttributeError("String %r is in the disallowed list of attribute names: %r" % self.disallowed)
 
@@ -256,6 +281,45 @@ def find_range(values, soft_range=[]):
          return (None, None)
 
 
+def nanminmax(array, blocksize=2**16):
+    """
+    Computes the minimum and maximum of each column of a two
+    dimensional array, ignoring NaNs. The rows are processed in
+    blocks small enough to stay in cache while both the minimum and
+    maximum are taken, so the array is only read from memory once.
+    Returns the arrays of column minima and maxima.
+    """
+    with warnings.catch_warnings():
+        warnings.filterwarnings('ignore', r'All-NaN (slice|axis) encountered')
+        if len(array) <= blocksize:
+            return np.nanmin(array, axis=0), np.nanmax(array, axis=0)
+        mins, maxs = [], []
+        for start in range(0, len(array), blocksize):
+            block = array[start:start+blocksize]
+            mins.append(np.nanmin(block, axis=0))
+            maxs.append(np.nanmax(block, axis=0))
+        return np.nanmin(mins, axis=0), np.nanmax(maxs, axis=0)
+
+
+def cached_range(range_fn):
+    """
+    Decorator for the range method of Elements, memoizing the range
+    of each dimension on the Element. The cache is cleared whenever
+    the data or dimensions of the Element are reassigned.
+    """
+    def range(self, dim, data_range=True):
+        dimension = self.get_dimension(dim)
+        if dimension is None:
+            return range_fn(self, dim, data_range)
+        cache = self.__dict__.setdefault('_range_cache', {})
+        key = (dimension.name, data_range)
+        if key not in cache:
+            cache[key] = range_fn(self, dim, data_range)
+        return cache[key]
+    range.__name__, range.__doc__ = range_fn.__name__, range_fn.__doc__
+    return range
+
+
 def max_range(ranges):
    """
    Computes the maximal lower and upper bounds from a list bounds.
@@ -346,6 +410,39 @@ def unique_iterator(seq):
             yield item
 
 
+# Memoized predicates of compiled specifications
+_compiled_specs = {}
+
+def compile_spec(spec):
+    """
+    Compiles a specification as accepted by LabelledData.matches into
+    a predicate accepting a LabelledData object. A specification may
+    be a class, a callable or a "{type}.{group}.{label}" string or
+    tuple of strings, where '*' or None match any value. The parsed
+    string and tuple specifications are memoized.
+    """
+    if callable(spec) and not isinstance(spec, type):
+        return spec
+    elif spec in _compiled_specs:
+        return _compiled_specs[spec]
+    elif isinstance(spec, type):
+        predicate = lambda obj: isinstance(obj, spec)
+    else:
+        split_spec = tuple(spec.split('.')) if not isinstance(spec, tuple) else spec
+        indices = tuple(i for i, s in enumerate(split_spec) if s not in ['*', None])
+        values = tuple(split_spec[i] for i in indices)
+        def predicate(obj):
+            specification = (type(obj).__name__, obj.group, obj.label)
+            if tuple(specification[i] for i in indices) == values:
+                return True
+            return tuple(sanitize_identifier(specification[i], escape=False)
+                         for i in indices) == values
+    if len(_compiled_specs) >= 1000:
+        _compiled_specs.clear()
+    _compiled_specs[spec] = predicate
+    return predicate
+
+
 def match_spec(element, specification):
     """
     Matches the group.label specification of the supplied
@@ -382,22 +479,136 @@ def python2sort(x,key=None):
     return itertools.chain.from_iterable(sorted(group, key=key) for group in groups)
 
 
-def dimension_sort(odict, dimensions, categorical, cached_values):
+def value_ranks(values):
+    """
+    Returns a dictionary mapping each of the supplied categorical
+    values to the position of its first occurrence, providing
+    constant time lookups of the categorical ordering.
+    """
+    ranks = {}
+    for i, v in enumerate(values):
+        ranks.setdefault(v, i)
+    return ranks
+
+
+def dimension_sort(odict, dimensions, categorical, cached_ranks):
     """
     Sorts data by key using usual Python tuple sorting semantics
-    or sorts in categorical order for any categorical Dimensions.
+    or sorts in categorical order for any categorical Dimensions,
+    using the supplied dictionaries of value ranks (see value_ranks).
     """
     sortkws = {}
     if categorical:
-       sortkws['key'] = lambda x: tuple(cached_values[d.name].index(x[0][i])
-                                        if d.values else x[0][i]
-                                        for i, d in enumerate(dimensions))
+       ranks = [cached_ranks[d.name] if d.values else None for d in dimensions]
+       sortkws['key'] = lambda x: tuple(r[x[0][i]] if r is not None else x[0][i]
+                                        for i, r in enumerate(ranks))
     if sys.version_info.major == 3:
         return python2sort(odict.items(), **sortkws)
     else:
         return sorted(odict.items(), **sortkws)
 
 
+def factorize(columns):
+    """
+    Assigns a group index to each row of the supplied list of equal
+    length column arrays, where rows with the same values across all
+    columns belong to the same group. Groups are numbered in order of
+    their first occurrence. Returns the array of group indices and
+    the index of the first row in each group.
+    """
+    length = len(columns[0]) if len(columns) else 0
+    groups = np.zeros(length, dtype=int)
+    for column in columns:
+        if column.dtype.kind in 'biuf':
+            codes = np.unique(column, return_inverse=True)[1]
+        else:
+            uniques = {}
+            codes = np.array([uniques.setdefault(v, len(uniques)) for v in column],
+                             dtype=int)
+        groups = groups * (codes.max()+1 if length else 1) + codes
+        # Renumber the groups to keep the combined indices small
+        groups = np.unique(groups, return_inverse=True)[1]
+    _, first, groups = np.unique(groups, return_index=True, return_inverse=True)
+    order = np.argsort(first)
+    renumbered = np.empty(len(order), dtype=int)
+    renumbered[order] = np.arange(len(order))
+    return renumbered[groups], first[order]
+
+
+# Reductions that may be computed for all groups at once
+_group_reductions = {np.sum: np.add, sum: np.add, np.prod: np.multiply,
+                     np.min: np.minimum, np.amin: np.minimum, min: np.minimum,
+                     np.max: np.maximum, np.amax: np.maximum, max: np.maximum,
+                     np.mean: 'mean', np.std: 'std', np.var: 'var',
+                     len: 'count', np.size: 'count'}
+
+
+def group_reduce(columns, groups, function):
+    """
+    Reduces each of the supplied column arrays within the groups
+    returned by factorize, returning one array of reduced values per
+    column. Sums, products, minima, maxima, means, standard deviations,
+    variances and counts of numeric columns are computed for all
+    groups at once using ufunc.reduceat on the rows sorted by group,
+    any other function is applied to the values of each group in turn.
+    """
+    order = np.argsort(groups, kind='mergesort')
+    sorted_groups = groups[order]
+    starts = np.flatnonzero(np.concatenate([[True], sorted_groups[1:] != sorted_groups[:-1]]))
+    counts = np.diff(np.concatenate([starts, [len(groups)]]))
+    try:
+        reduction = _group_reductions.get(function)
+    except TypeError:
+        reduction = None
+
+    reduced = []
+    for column in columns:
+        values = column[order]
+        if not len(values):
+            reduced.append(np.array([]))
+        elif reduction is None or values.dtype.kind not in 'iuf':
+            reduced.append([function(values[s:s+n]) for s, n in zip(starts, counts)])
+        elif reduction == 'count':
+            reduced.append(counts)
+        elif isinstance(reduction, np.ufunc):
+            dtype = np.sum(values[:0]).dtype if reduction in [np.add, np.multiply] else None
+            reduced.append(reduction.reduceat(values, starts, dtype=dtype))
+        else:
+            values = values.astype(float)
+            means = np.add.reduceat(values, starts) / counts
+            if reduction == 'mean':
+                reduced.append(means)
+                continue
+            deviations = values - np.repeat(means, counts)
+            variances = np.add.reduceat(deviations**2, starts) / counts
+            reduced.append(variances if reduction == 'var' else np.sqrt(variances))
+    return reduced
+
+
+def is_dataframe(data):
+    """
+    Checks whether the supplied data is a pandas DataFrame without
+    importing pandas if it has not been imported already.
+    """
+    pd = sys.modules.get('pandas')
+    return pd is not None and isinstance(data, pd.DataFrame)
+
+
+def dframe_column(dframe, name):
+    """
+    Returns the named column of a pandas DataFrame as a NumPy array
+    without copying numeric or object columns. Columns of any other
+    dtype (e.g. datetimes) are returned as object arrays holding
+    pandas scalars.
+    """
+    column = dframe[name]
+    if column.dtype.kind in 'biufcO':
+        return column.values
+    values = np.empty(len(column), dtype=object)
+    values[:] = list(column)
+    return values
+
+
 # Copied from param should make param version public
 def is_number(obj):
     if isinstance(obj, numbers.Number): return True
@@ -507,40 +718,3 @@ def layer_groups(ordering, length=2):
    for el in ordering:
       group_orderings[el[:length]].append(el)
    return group_orderings
-
-
-def group_select(selects, length=None, depth=None):
-    """
-    Given a list of key tuples to select, groups them into sensible
-    chunks to avoid duplicating indexing operations.
-    """
-    if length == None and depth == None:
-        length = depth = len(selects[0])
-    getter = operator.itemgetter(depth-length)
-    if length > 1:
-        selects = sorted(selects, key=getter)
-        grouped_selects = defaultdict(dict)
-        for k, v in itertools.groupby(selects, getter):
-            grouped_selects[k] = group_select(list(v), length-1, depth)
-        return grouped_selects
-    else:
-        return list(selects)
-
-
-def iterative_select(obj, dimensions, selects, depth=None):
-    """
-    Takes the output of group_select selecting subgroups iteratively,
-    avoiding duplicating select operations.
-    """
-    ndims = len(dimensions)
-    depth = depth if depth is not None else ndims
-    items = []
-    if isinstance(selects, dict):
-        for k, v in selects.items():
-            items += iterative_select(obj.select(**{dimensions[ndims-depth]: k}),
-                                      dimensions, v, depth-1)
-    else:
-        for s in selects:
-            items.append((s, obj.select(**{dimensions[-1]: s[-1]})))
-    return items
-
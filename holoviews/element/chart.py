@@ -3,7 +3,7 @@ import numpy as np
 import param
 
 from ..core import util
-from ..core import OrderedDict, Dimension, NdMapping, Element2D, NdElement, HoloMap
+from ..core import OrderedDict, Dimension, NdMapping, Element2D, NdElement, HoloMap, FrameStack
 from .tabular import ItemTable, Table
 
 
@@ -34,7 +34,10 @@ class Chart(Element2D):
         elif isinstance(data, NdMapping) or (isinstance(data, list) and data
                                            and isinstance(data[0], Element2D)):
             data, settings = self._process_map(data)
-        data = list(data)
+        elif util.is_dataframe(data):
+            data, settings = self._process_dframe(data, params)
+        if not isinstance(data, np.ndarray):
+            data = list(data)
         data = self._null_value if (data is None) or (len(data) == 0) else data
         if len(data) and not isinstance(data, np.ndarray):
             data = np.array(data)
@@ -55,8 +58,8 @@ class Chart(Element2D):
         Should return the data and parameters of the new Chart.
         """
         if isinstance(ndmap, Table):
-            data = np.vstack([np.concatenate([key, vals])
-                              for key, vals in ndmap.data.items()]).astype(np.float)
+            columns = [ndmap.dimension_values(d) for d in ndmap.dimensions(label=True)]
+            data = np.column_stack(columns).astype(np.float)
             settings = dict(ndmap.get_param_values(onlychanged=True))
         else:
             data = np.concatenate([v.data for v in ndmap])
@@ -64,6 +67,25 @@ class Chart(Element2D):
         return data, settings
 
 
+    def _process_dframe(self, dframe, params):
+        """
+        Stacks the columns of a pandas DataFrame matching the supplied
+        key and value dimensions. If no dimensions are supplied the
+        leading columns become the key dimensions and the remaining
+        columns the value dimensions.
+        """
+        columns = list(dframe.columns)
+        ndims = len(params.get('key_dimensions', type(self).key_dimensions))
+        kdims = params.get('key_dimensions', columns[:ndims])
+        kdim_names = [d.name if isinstance(d, Dimension) else d for d in kdims]
+        vdims = params.get('value_dimensions', [c for c in columns
+                                                if c not in kdim_names])
+        names = kdim_names + [d.name if isinstance(d, Dimension) else d
+                              for d in vdims]
+        data = np.column_stack([util.dframe_column(dframe, n) for n in names])
+        return data, dict(key_dimensions=kdims, value_dimensions=vdims)
+
+
     def closest(self, coords):
         """
         Given single or multiple x-values, returns the list
@@ -181,6 +203,7 @@ class Chart(Element2D):
             return super(Chart, self).dimension_values(dim)
 
 
+    @util.cached_range
     def range(self, dim, data_range=True):
         dim_idx = dim if isinstance(dim, int) else self.get_dimension_index(dim)
         dim = self.get_dimension(dim_idx)
@@ -192,8 +215,8 @@ class Chart(Element2D):
             else:
                 data = self.data
             if len(data):
-                data = data[:, dim_idx]
-                data_range = np.nanmin(data), np.nanmax(data)
+                mins, maxs = self._column_ranges(data)
+                data_range = mins[dim_idx], maxs[dim_idx]
             else:
                 data_range = (np.NaN, np.NaN)
         if data_range:
@@ -205,7 +228,7 @@ class Chart(Element2D):
     def dframe(self):
         import pandas as pd
         columns = [d.name for d in self.dimensions()]
-        return pd.DataFrame(self.data, columns=columns)
+        return pd.DataFrame(self.data, columns=columns, copy=False)
 
 
 
@@ -523,3 +546,61 @@ class VectorField(Points):
                 [el for el in (col.flat if isinstance(col,np.ndarray) else col)]
                 for col in data]).T
         super(VectorField, self).__init__(data, **params)
+
+
+
+class ChartStack(FrameStack):
+    """
+    A ChartStack is a FrameStack of homogeneous Chart elements, which
+    share the same samples along their key dimensions, holding the
+    data of all frames in an array of shape (frames, samples,
+    dimensions). Sampling and reducing the frames looks up or reduces
+    the values of all frames at once.
+    """
+
+    template = param.ClassSelector(class_=Chart, doc="""
+        Chart element supplying the type, parameters and key
+        dimension samples of the frames.""")
+
+    @classmethod
+    def _validate_frames(cls, frames, template):
+        super(ChartStack, cls)._validate_frames(frames, template)
+        if template.data.ndim != 2:
+            raise ValueError("ChartStack requires two-dimensional Chart data.")
+        keys = template.data[:, :template.ndims]
+        if not all(np.array_equal(frame.data[:, :template.ndims], keys)
+                   for frame in frames):
+            raise ValueError("ChartStack requires frames sharing the same "
+                             "key dimension samples.")
+
+
+    def _index_frame(self):
+        "Returns a clone of the template holding the row index as values."
+        data = self.template.data.astype(float)
+        data[:, self.template.ndims:] = np.arange(len(data))[:, np.newaxis]
+        return self.template.clone(data)
+
+
+    def sample(self, samples=[], bounds=None, **sample_values):
+        """
+        Samples every frame as in HoloMap.sample, looking up the
+        sampled rows across the whole stack at once.
+        """
+        prototype = self._clone_as(HoloMap, [(self.key_space[0], self._index_frame())])
+        table = prototype.sample(samples, bounds, **sample_values)
+        index = np.round(table.dimension_values(table.value_dimensions[0].name)).astype(int)
+        return self._gather(table, self.stack[:, index, self.template.ndims:])
+
+
+    def reduce(self, dimensions=[], function=None, **reduce_map):
+        """
+        Reduces every frame to a point as in HoloMap.reduce, applying
+        the reduce function along the samples axis of the stack.
+        """
+        prototype = self._clone_as(HoloMap, [(self.key_space[0], self.template)])
+        table = prototype.reduce(dimensions, function, **reduce_map)
+        if reduce_map and not self.template._valid_dimensions(dimensions):
+            function = list(reduce_map.values())[0]
+        reduced = function(self.stack[:, :, self.template.ndims:], axis=1)
+        return self._gather(table, reduced[:, np.newaxis, :])
+
@@ -1,5 +1,6 @@
 import param
 
+from ..core import util
 from ..core import Dimension, Element3D
 from .chart import Chart
 from .raster import Image
@@ -34,6 +35,7 @@ class Surface(Image, Element3D):
         Image.__init__(self, data, extents=extents, **params)
 
 
+    @util.cached_range
     def range(self, dim, data_range=True):
         dim_idx = dim if isinstance(dim, int) else self.get_dimension_index(dim)
         if dim_idx in [0, 1]:
@@ -239,8 +239,10 @@ class Comparison(ComparisonInterface):
             raise cls.failureException("Dimension unit declarations mismatched: %s != %s"
                                        % (dim1.unit , dim2.unit))
         if dim1.values != dim2.values:
+            values1, values2 = [list(v) if isinstance(v, tuple) else v
+                                for v in (dim1.values, dim2.values)]
             raise cls.failureException("Dimension value declarations mismatched: %s != %s"
-                                       % (dim1.values , dim2.values))
+                                       % (values1 , values2))
         if dim1.format_string != dim2.format_string:
             raise cls.failureException("Dimension format string declarations mismatched: %s != %s"
                                        % (dim1.format_string , dim2.format_string))
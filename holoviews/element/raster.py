@@ -1,13 +1,13 @@
-from itertools import product
+import warnings
 import numpy as np
 import colorsys
 import param
 
 from ..core import util
-from ..core import OrderedDict, Dimension, NdMapping, Element2D, Overlay
+from ..core import OrderedDict, Dimension, NdMapping, Element2D, Overlay, HoloMap, FrameStack
 from ..core.boundingregion import BoundingRegion, BoundingBox
 from ..core.sheetcoords import SheetCoordinateSystem, Slice
-from .chart import Curve
+from .chart import Curve, Histogram
 from .tabular import Table
 
 
@@ -138,7 +138,7 @@ class Raster(Element2D):
                 reduced_view = reduced_view.reduce(**{dim: reduce_fn})
             return reduced_view
         else:
-            dimension, reduce_fn = reduce_map.items()[0]
+            dimension, reduce_fn = list(reduce_map.items())[0]
             other_dimension = [d for d in self.key_dimensions if d.name != dimension]
             x_vals = sorted(set(self.dimension_values(other_dimension[0].name)))
             data = zip(x_vals, reduce_fn(self.data, axis=self.get_dimension_index(other_dimension[0])))
@@ -166,6 +166,30 @@ class Raster(Element2D):
             return super(Raster, self).dimension_values(dim)
 
 
+    def _grid_coords(self):
+        """
+        Returns the coordinates of the columns and rows of the data
+        array along the x- and y-dimension respectively.
+        """
+        rows, cols = self.data.shape[:2]
+        return np.arange(cols), np.arange(rows)
+
+
+    def dframe(self):
+        """
+        Returns a pandas DataFrame with one row per array cell, in the
+        row-major order of the data array.
+        """
+        import pandas
+        xs, ys = self._grid_coords()
+        values = self.data.reshape(len(xs)*len(ys), -1)
+        columns = OrderedDict([(self.key_dimensions[0].name, np.tile(xs, len(ys))),
+                               (self.key_dimensions[1].name, np.repeat(ys, len(xs)))])
+        for i, dim in enumerate(self.value_dimensions):
+            columns[dim.name] = values[:, i]
+        return pandas.DataFrame(columns, columns=list(columns), copy=False)
+
+
     @property
     def depth(self):
         return 1 if len(self.data.shape) == 2 else self.data.shape[2]
@@ -272,12 +296,30 @@ class HeatMap(Raster):
 
 
     def dframe(self, dense=False):
-        if dense:
-            keys1, keys2 = self.dense_keys()
-            dense_map = self.clone({(k1, k2): self._data.get((k1, k2), np.NaN)
-                                 for k1, k2 in product(keys1, keys2)})
-            return dense_map.dframe()
-        return super(HeatMap, self).dframe()
+        """
+        Returns a pandas DataFrame of the samples in the HeatMap. If
+        dense, every combination of the keys along the two dimensions
+        is included, filling missing samples with NaNs.
+        """
+        if not dense:
+            # Columns of the sparse samples rather than the Raster cells
+            return Element2D.dframe(self)
+        import pandas
+        keys1, keys2 = self.dense_keys()
+        index1 = {k: i for i, k in enumerate(keys1)}
+        index2 = {k: i for i, k in enumerate(keys2)}
+        cells = np.array([index1[k1]*len(keys2) + index2[k2]
+                          for k1, k2 in self._data.keys()], dtype=int)
+        columns = OrderedDict()
+        columns[self.key_dimensions[0].name] = np.repeat(np.array(keys1), len(keys2))
+        columns[self.key_dimensions[1].name] = np.tile(np.array(keys2), len(keys1))
+        for dim in self.value_dimensions:
+            values = np.array(self.dimension_values(dim.name))
+            dtype = float if values.dtype.kind in 'biuf' else object
+            column = np.full(len(keys1)*len(keys2), np.NaN, dtype=dtype)
+            column[cells] = values
+            columns[dim.name] = column
+        return pandas.DataFrame(columns, columns=list(columns), copy=False)
 
 
 
@@ -361,6 +403,7 @@ class Image(SheetCoordinateSystem, Raster):
                           bounds=bounds)
 
 
+    @util.cached_range
     def range(self, dim, data_range=True):
         dim_idx = dim if isinstance(dim, int) else self.get_dimension_index(dim)
         dim = self.get_dimension(dim_idx)
@@ -374,8 +417,9 @@ class Image(SheetCoordinateSystem, Raster):
                 data_range = (l, r)
         elif dim_idx < len(self.value_dimensions) + 2:
             dim_idx -= 2
-            data = np.atleast_3d(self.data)[:, :, dim_idx]
-            data_range = (np.nanmin(data), np.nanmax(data))
+            data = np.atleast_3d(self.data)
+            mins, maxs = self._column_ranges(data.reshape(-1, data.shape[2]))
+            data_range = (mins[dim_idx], maxs[dim_idx])
         if data_range:
             return util.max_range([data_range, dim.soft_range])
         else:
@@ -386,6 +430,11 @@ class Image(SheetCoordinateSystem, Raster):
         return self.sheet2matrixidx(*coord)
 
 
+    def _grid_coords(self):
+        rows, cols = self.data.shape[:2]
+        return self.matrixidx2sheet(np.arange(rows), np.arange(cols))
+
+
     def dimension_values(self, dim):
         """
         The set of samples available along a particular dimension.
@@ -507,6 +556,7 @@ class RGB(Image):
         super(RGB, self).__init__(data if sliced is None else sliced, **params)
         if sliced is not None:
             self.value_dimensions.append(self.alpha_dimension)
+            self._cache_dimensions()
             self.data = data
 
 
@@ -567,3 +617,219 @@ class HSV(RGB):
         return RGB(np.dstack(hsv), bounds=self.bounds,
                    group=self.group,
                    label=self.label)
+
+
+
+class RasterStack(FrameStack):
+    """
+    A RasterStack is a FrameStack of homogeneous Raster elements,
+    such as Images sharing the same shape and bounds, holding the
+    data of all frames in an array of shape (frames, rows, columns).
+
+    Slicing and selecting return new RasterStacks wherever possible,
+    while collapse, sample, reduce, range and hist operate on all
+    frames at once as NumPy reductions over the stacked axis.
+    """
+
+    template = param.ClassSelector(class_=Raster, doc="""
+        Raster element supplying the type and parameters of the
+        frames, which are clones of the template holding the
+        corresponding slice of the stack.""")
+
+    @classmethod
+    def _validate_frames(cls, frames, template):
+        super(RasterStack, cls)._validate_frames(frames, template)
+        bounds = getattr(template, 'bounds', None)
+        if isinstance(template, HeatMap) or template.data.ndim != 2:
+            raise ValueError("RasterStack only supports two-dimensional "
+                             "Raster and Image frames.")
+        elif any(getattr(frame, 'bounds', None) != bounds for frame in frames):
+            raise ValueError("RasterStack requires frames with the same bounds.")
+
+
+    def _index_frame(self):
+        "Returns a clone of the template holding the flat index of each pixel."
+        rows, cols = self.template.data.shape
+        return self.template.clone(np.arange(rows*cols).reshape(rows, cols))
+
+
+    def _map_frames(self, fn):
+        """
+        Applies the function to the template holding pixel indices
+        and if it returns a Raster of the same type, the stack is
+        gathered accordingly. Otherwise the frames are mapped lazily.
+        """
+        indexed = fn(self._index_frame())
+        if type(indexed) is not type(self.template) or indexed.data.ndim != 2:
+            return super(RasterStack, self)._map_frames(fn)
+        index = indexed.data.ravel()
+        shape = indexed.data.shape
+        stack = self.stack.reshape(len(self.stack), -1)[:, index]
+        template = indexed.clone(self.template.data.ravel()[index].reshape(shape))
+        items = [(k, fn(v)) for k, v in self.data.items()]
+        return self.clone(items, shared_data=False, key_space=self.key_space,
+                          stack=stack.reshape((len(stack),)+shape), template=template)
+
+
+    def _collapse_rows(self, function, rows=None, **kwargs):
+        stack = self.stack if rows is None else self.stack[rows]
+        if isinstance(function, np.ufunc):
+            return function.reduce(stack)
+        else:
+            return function(stack, axis=0, **kwargs)
+
+
+    def collapse(self, dimensions=None, function=None, **kwargs):
+        """
+        Collapses the frames along the supplied key dimensions by
+        applying the function across the stacked axis.
+        """
+        from ..core.operation import MapOperation
+        if isinstance(function, MapOperation):
+            return self._materialize().collapse(dimensions, function, **kwargs)
+        if not dimensions:
+            dimensions = self._cached_index_names
+        unknown = [dim for dim in dimensions if dim not in self._cached_index_names]
+        if unknown:
+            raise Exception("Dimension %s not found in %s." %
+                            (unknown[0], self.__class__.__name__))
+        if self.ndims > 1 and len(dimensions) != self.ndims:
+            dims = [dim for dim in self._cached_index_names if dim not in dimensions]
+            indices = [self.get_dimension_index(dim) for dim in dims]
+            groups = OrderedDict()
+            for row, key in enumerate(self.key_space):
+                groups.setdefault(tuple(key[i] for i in indices), []).append(row)
+            collapsed = [(key, self.template.clone(self._collapse_rows(function, rows, **kwargs)))
+                         for key, rows in groups.items()]
+            return HoloMap(collapsed, key_dimensions=[self.get_dimension(d) for d in dims])
+        collapsed = self.template.clone(self._collapse_rows(function, **kwargs))
+        return HoloMap([(0, collapsed)]) if self.ndims > 1 else collapsed
+
+
+    def sample(self, samples=[], bounds=None, **sample_values):
+        """
+        Samples every frame as in HoloMap.sample, looking up the
+        sampled pixels across the whole stack at once.
+        """
+        prototype = self._clone_as(HoloMap, [(self.key_space[0], self._index_frame())])
+        table = prototype.sample(samples, bounds, **sample_values)
+        index = np.round(table.dimension_values(table.value_dimensions[0].name)).astype(int)
+        return self._gather(table, self.stack.reshape(len(self.stack), -1)[:, index])
+
+
+    def reduce(self, dimensions=None, function=None, **reduce_map):
+        """
+        Reduces every frame as in HoloMap.reduce, applying the reduce
+        functions along the corresponding axes of the stack.
+        """
+        prototype = self._clone_as(HoloMap, [(self.key_space[0], self.template)])
+        table = prototype.reduce(dimensions, function, **reduce_map)
+        dimensions = self.template._valid_dimensions(dimensions)
+        if dimensions:
+            reduce_map = {d: function for d in dimensions}
+        elif not reduce_map:
+            reduce_map = {d: function for d in self.template._cached_index_names}
+        reduce_fns = list(reduce_map.items())
+        dimension, reduce_fn = reduce_fns[0]
+        other = [d for d in self.template.key_dimensions if d.name != dimension][0]
+        reduced = reduce_fn(self.stack, axis=1+self.template.get_dimension_index(other))
+        if len(reduce_fns) > 1:
+            reduced = reduce_fns[1][1](reduced, axis=1)[:, np.newaxis]
+        return self._gather(table, reduced)
+
+
+    def range(self, dimension, data_range=True):
+        dim = self.get_dimension(dimension)
+        if dim is None:
+            dim = self.template.get_dimension(dimension)
+        if dim is None:
+            return (None, None)
+        elif dim.range != (None, None):
+            return dim.range
+        elif not data_range:
+            return (None, None)
+        soft_range = [r for r in dim.soft_range if r is not None]
+        if dim in self.key_dimensions:
+            idx = self.get_dimension_index(dim.name)
+            return util.find_range([k[idx] for k in self.key_space], soft_range)
+        elif dim in self.template.value_dimensions:
+            with warnings.catch_warnings():
+                warnings.filterwarnings('ignore', r'All-NaN (slice|axis) encountered')
+                values = [np.nanmin(self.stack), np.nanmax(self.stack)]
+            return util.find_range(values, soft_range)
+        return self.template.range(dim.name, data_range)
+
+
+    def _histogram(self, num_bins, bin_range=None, normed=True):
+        """
+        Computes the histogram of every frame as np.histogram would,
+        binning the values of all frames in a single bincount.
+        """
+        frames = len(self.stack)
+        values = self.stack.reshape(frames, -1).astype(float)
+        if bin_range is None:
+            with warnings.catch_warnings():
+                warnings.filterwarnings('ignore', r'All-NaN (slice|axis) encountered')
+                lower = np.fmin(np.nanmin(values, axis=1), 0)
+                upper = np.fmax(np.nanmax(values, axis=1), -np.inf)
+        else:
+            lower = np.full(frames, bin_range[0], dtype=float)
+            upper = np.full(frames, bin_range[1], dtype=float)
+        upper[(lower == 0) & (upper == 0)] = 1
+        # Ranges np.histogram rejects result in empty histograms
+        invalid = ~(np.isfinite(lower) & np.isfinite(upper) & (lower <= upper))
+        empty = lower == upper
+        lower, upper = np.where(empty, lower-0.5, lower), np.where(empty, upper+0.5, upper)
+        edges = np.array([np.linspace(l, u, num_bins+1) for l, u in zip(lower, upper)])
+
+        valid = ~invalid
+        values, lower, upper = values[valid], lower[valid, None], upper[valid, None]
+        valid_edges = edges[valid]
+        keep = np.isfinite(values) & (values >= lower) & (values <= upper)
+        with np.errstate(invalid='ignore'):
+            indices = ((values - lower) * (num_bins / (upper - lower)))
+        indices = np.where(keep, indices, 0).astype(np.intp)
+        indices[indices == num_bins] -= 1
+        rows = np.arange(len(values))[:, None]
+        indices -= values < valid_edges[rows, indices]
+        indices += ((values >= valid_edges[rows, indices+1]) & (indices != num_bins-1))
+        offsets = (rows * num_bins + indices)[keep]
+        counts = np.bincount(offsets, minlength=len(values)*num_bins)
+        counts = counts.reshape(len(values), num_bins)
+
+        hists = np.zeros((frames, num_bins))
+        if normed:
+            with np.errstate(invalid='ignore', divide='ignore'):
+                counts = counts/np.diff(valid_edges, axis=1)/counts.sum(axis=1)[:, None]
+            counts[np.isnan(counts)] = 0
+        hists[valid] = counts
+        return hists, edges
+
+
+    def hist(self, num_bins=20, bin_range=None, adjoin=True, individually=True, **kwargs):
+        """
+        Computes a histogram of the values of each frame, as in
+        HoloMap.hist, binning the whole stack at once.
+        """
+        dimension = kwargs.get('dimension')
+        vdim = self.template.value_dimensions[0]
+        style_prefix = kwargs.pop('style_prefix', 'Custom[<' + self.name + '>]_')
+        if (dimension not in [None, vdim.name] or
+            set(kwargs) - set(['dimension', 'normed'])):
+            histmap = self._materialize().hist(num_bins, bin_range, adjoin=False,
+                                               individually=individually,
+                                               style_prefix=style_prefix, **kwargs)
+            return (self << histmap) if adjoin else histmap
+
+        if not individually:
+            if 'dimension' not in kwargs:
+                raise Exception("Please supply the dimension to compute a histogram for.")
+            bin_range = self.range(dimension) if bin_range is None else bin_range
+        # The style_prefix is not applied by the histogram operation,
+        # so the frames may be binned without it
+        hists, edges = self._histogram(num_bins, bin_range, kwargs.get('normed', True))
+        label = self.template.label
+        histograms = [(key, Histogram(hist, edge, key_dimensions=[vdim], label=label))
+                      for key, hist, edge in zip(self.key_space, hists, edges)]
+        histmap = self._clone_as(HoloMap, histograms)
+        return (self << histmap) if adjoin else histmap
@@ -2,7 +2,9 @@ import numpy as np
 
 import param
 
+from ..core import util
 from ..core import OrderedDict, Dimension, Element, NdElement, HoloMap, NdMapping
+from ..core.ndmapping import ColumnarData, item_check
 
 
 class ItemTable(Element):
@@ -160,10 +162,11 @@ class Table(NdElement):
          The group is used to describe the Table.""")
 
     def __init__(self, data=None, **params):
-
-        init_data = data if isinstance(data, NdMapping) else OrderedDict()
+        if util.is_dataframe(data):
+            data, params = self._process_dframe(data, params)
+        init_data = data if isinstance(data, (NdMapping, ColumnarData)) else OrderedDict()
         super(Table, self).__init__(init_data, **params)
-        if isinstance(data, NdMapping): return
+        if isinstance(data, (NdMapping, ColumnarData)): return
 
         data = {} if data is None else data
         if self.indexed:
@@ -172,12 +175,41 @@ class Table(NdElement):
         else:
             data = dict(data)
 
-        for k in sorted(data.keys()):
-            self[k] = data[k] # Validates input
+        # Validates input, inserting all rows at once
+        self.extend([(k, self._validate_row(k, data[k], row))
+                     for row, k in enumerate(sorted(data.keys()), len(self))])
+
+
+    def _process_dframe(self, dframe, params):
+        """
+        Converts a pandas DataFrame into ColumnarData holding the
+        columns matching the supplied key and value dimensions. By
+        default the rows are indexed by the 'Row' dimension and all
+        other columns become value dimensions.
+        """
+        kdims = params.get('key_dimensions', type(self).key_dimensions)
+        kdim_names = [d.name if isinstance(d, Dimension) else d for d in kdims]
+        vdims = params.get('value_dimensions', [c for c in dframe.columns
+                                                if c not in kdim_names])
+        vdim_names = [d.name if isinstance(d, Dimension) else d for d in vdims]
+        keys = [np.arange(len(dframe)) if n == 'Row' and n not in dframe.columns
+                else util.dframe_column(dframe, n) for n in kdim_names]
+        values = [util.dframe_column(dframe, n) for n in vdim_names]
+        return (ColumnarData.from_columns(keys, values),
+                dict(params, key_dimensions=kdims, value_dimensions=vdims))
 
 
     def __setitem__(self, key, value):
-        if self.indexed and ((key != len(self)) and (key != (len(self),))):
+        value = self._validate_row(key, value, len(self))
+        super(Table, self).__setitem__(key, value)
+
+
+    def _validate_row(self, key, value, row):
+        """
+        Validates the key of a row to be inserted at the given row
+        number and converts dictionary and ItemTable values.
+        """
+        if self.indexed and ((key != row) and (key != (row,))):
             raise Exception("Supplied key %s does not correspond to the items row number." % key)
 
         if isinstance(value, (dict, OrderedDict)):
@@ -190,7 +222,7 @@ class Table(NdElement):
             if value.value_dimensions != self.value_dimensions:
                 raise Exception("Input ItemTables dimensions must match value dimensions.")
             value = value.data.values()
-        super(Table, self).__setitem__(key, value)
+        return value
 
     @property
     def indexed(self):
@@ -224,11 +256,15 @@ class Table(NdElement):
             return str(self.key_dimensions[col])
         else:
             dim = self.get_dimension(col)
-            if col >= ndims:
+            if isinstance(self.data, ColumnarData):
+                row_data, row_values = self.data.row(row-1)
+            elif col >= ndims:
                 row_values = self.values()[row-1]
-                val = row_values[col - ndims]
             else:
                 row_data = list(self.data.keys())[row-1]
+            if col >= ndims:
+                val = row_values[col - ndims]
+            else:
                 val = row_data[col]
             return dim.pprint_value(val)
 
@@ -250,7 +286,6 @@ class Table(NdElement):
         return TableConversion(self)
 
     def dframe(self, value_label='data'):
-        import pandas
         dframe = super(Table, self).dframe(value_label=value_label)
         # Drop 'Row' column as it is redundant with dframe index
         if self.indexed: del dframe['Row']
@@ -281,13 +316,66 @@ class TableConversion(object):
             raise Exception("Dimensions %r could not be found during conversion to %s new_type" %
                             (invalid, new_type.__name__))
         group_dims = [dim for dim in self._table._cached_index_names if not dim in key_dimensions]
-        selected = self._table.select(**{'value': value_dimensions})
         params = dict({'key_dimensions': [self._table.get_dimension(kd) for kd in key_dimensions],
                        'value_dimensions': [self._table.get_dimension(vd) for vd in value_dimensions]},
                        **kwargs)
-        if len(key_dimensions) == self._table.ndims:
-            return new_type(selected, **params)
-        return selected.groupby(group_dims, container_type=HoloMap, group_type=new_type, **params)
+        columns = [np.asarray(self._table.dimension_values(d))
+                   for d in key_dimensions+value_dimensions]
+        # The rows are sorted along the new key dimensions
+        ranks = [self._ranks(d, c) for d, c in zip(key_dimensions, columns)]
+        if not group_dims:
+            order = np.lexsort(ranks[::-1]) if ranks else slice(None)
+            return self._create(new_type, [c[order] for c in columns], params)
+
+        # Partition the rows by the group dimensions, sorting the rows
+        # within each group along the new key dimensions
+        group_columns = [np.asarray(self._table.dimension_values(d)) for d in group_dims]
+        groups, first = util.factorize(group_columns)
+        order = np.lexsort(ranks[::-1] + [groups])
+        bounds = np.concatenate([[0], np.cumsum(np.bincount(groups))])
+        columns = [c[order] for c in columns]
+        group_keys = zip(*[c[first].tolist() for c in group_columns])
+        dims = [self._table.get_dimension(d) for d in group_dims]
+        elements = []
+        for start, stop, key in zip(bounds[:-1], bounds[1:], group_keys):
+            element = self._create(new_type, [c[start:stop] for c in columns], params)
+            elements.append((key, element))
+        with item_check(False):
+            return HoloMap(elements, key_dimensions=dims)
+
+
+    def _ranks(self, dimension, column):
+        """
+        Returns an array of the sort ranks of the values in the column
+        of the named dimension, ordering categorical dimensions by
+        their declared values.
+        """
+        if self._table.get_dimension(dimension).values:
+            ranks = self._table._cached_index_ranks.get(dimension)
+            if ranks is not None:
+                return np.array([ranks[v] for v in column], dtype=int)
+        if column.dtype.kind in 'biuf':
+            return column
+        return np.unique(column, return_inverse=True)[1]
+
+
+    def _create(self, new_type, columns, params):
+        """
+        Creates an Element of the supplied type from the key and value
+        columns. Charts are built from the stacked columns, all other
+        types from a Table holding the columns.
+        """
+        from .chart import Chart
+        settings = dict(self._table.get_param_values(onlychanged=True))
+        settings = {k: v for k, v in settings.items() if k in new_type.params()}
+        if issubclass(new_type, Chart):
+            return new_type(np.column_stack(columns).astype(np.float) if columns else [],
+                            **dict(settings, **params))
+        ndims = len(params['key_dimensions'])
+        data = ColumnarData.from_columns(columns[:ndims], columns[ndims:])
+        with item_check(False):
+            table = self._table.clone(data, **dict(settings, **params))
+        return new_type(table, **params)
 
     def bars(self, key_dimensions, value_dimensions, **kwargs):
         from .chart import Bars
@@ -315,7 +403,7 @@ class TableConversion(object):
 
     def surface(self, key_dimensions, value_dimensions, **kwargs):
         from .chart3d import Surface
-        heatmap = self.to_heatmap(key_dimensions, value_dimensions, **kwargs)
+        heatmap = self.heatmap(key_dimensions, value_dimensions, **kwargs)
         return Surface(heatmap.data, **dict(self._table.get_param_values(onlychanged=True)))
 
     def vectorfield(self, key_dimensions, value_dimensions, **kwargs):
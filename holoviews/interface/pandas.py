@@ -20,6 +20,8 @@ import param
 
 from ..core import ViewableElement, NdMapping, NdOverlay,\
     NdLayout, GridSpace, Element, HoloMap
+from ..core import util
+from ..core.ndmapping import ColumnarData
 from ..element import Chart, Table, Curve, Scatter, Bars, Points, VectorField, HeatMap, Scatter3D, Surface
 
 
@@ -282,11 +284,10 @@ class DFrame(DataFrameView):
 
             vdata = v.data.filter(el_dims)
             vdata = vdata.dropna() if dropna else vdata
+            data = [util.dframe_column(vdata, d) for d in el_dims]
             if issubclass(view_type, Chart):
-                data = [np.array(vdata[d]) for d in el_dims]
                 hmap[k] = self._create_chart(data, **create_kwargs)
             else:
-                data = [np.array(vdata[d]) for d in el_dims]
                 hmap[k] = self._create_table(data, **create_kwargs)
         return hmap if mdims != ['Default'] else hmap.last
 
@@ -301,12 +302,10 @@ class DFrame(DataFrameView):
     def _create_table(self, data, key_dimensions=None, value_dimensions=None,
                       view_type=None, **kwargs):
         ndims = len(key_dimensions)
-        key_data, value_data = data[:ndims], data[ndims:]
-        keys = zip(*key_data)
-        values = zip(*value_data)
+        columns = ColumnarData.from_columns(data[:ndims], data[ndims:])
         inherited = dict(key_dimensions=key_dimensions,
                          value_dimensions=value_dimensions, label=self.label)
-        return view_type(zip(keys, values), **dict(inherited, **kwargs))
+        return view_type(columns, **dict(inherited, **kwargs))
 
 
     def curve(self, kdims, vdims, mdims=[], reduce_fn=None, **kwargs):
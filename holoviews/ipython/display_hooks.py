@@ -26,6 +26,7 @@ except:
 import param
 
 from ..core.options import Store
+from ..core.io import LazyComponent
 from ..core import Element, ViewableElement, HoloMap, AdjointLayout, NdLayout,\
     NdOverlay, GridSpace, Layout, Overlay
 from ..core.traversal import unique_dimkeys, bijective
@@ -201,6 +202,7 @@ def display_hook(fn):
         if not ip.display_formatter.formatters['text/plain'].pprint:
             return None
         try:
+            element = LazyComponent.resolve_all(element)
             widget_mode = OutputMagic.options['widgets']
             map_format  = OutputMagic.options['holomap']
             # If widget_mode is None, widgets are not being used
@@ -234,6 +236,12 @@ def animation_display(anim, map_format, dpi=72, **kwargs):
     return animate(anim, dpi, *OutputMagic.ANIMATION_OPTS[map_format])
 
 
+def lazy_display(proxy):
+    "Displays the component of a lazily loaded archive entry."
+    ip = get_ipython()  #  # pyflakes:ignore (in IPython namespace)
+    return ip.display_formatter.formatters['text/html'](proxy.resolve())
+
+
 @display_hook
 def element_display(element, size, **kwargs):
     if not isinstance(element, ViewableElement): return None
@@ -334,3 +342,4 @@ def set_display_hooks(ip):
     html_formatter.for_type(AdjointLayout, layout_display)
     html_formatter.for_type(NdLayout, layout_display)
     html_formatter.for_type(GridSpace, grid_display)
+    html_formatter.for_type(LazyComponent, lazy_display)
@@ -15,7 +15,7 @@ from param.parameterized import bothmethod
 
 from ..core.options import Cycle, Palette, Options, StoreOptions
 from ..core import Dimension, Layout, NdLayout, Overlay
-from ..core.io import Exporter
+from ..core.io import Exporter, LazyComponent
 from .annotation import * # pyflakes:ignore (API import)
 from .chart import * # pyflakes:ignore (API import)
 from .chart3d import * # pyflakes:ignore (API import)
@@ -143,6 +143,7 @@ class MPLPlotRenderer(Exporter):
         """
         Render the supplied HoloViews component using matplotlib.
         """
+        obj = LazyComponent.resolve_all(obj)
         if isinstance(obj, AdjointLayout):
             obj = Layout.from_values(obj)
 
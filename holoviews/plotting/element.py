@@ -10,7 +10,7 @@ import param
 
 from ..core import util
 from ..core.options import Store
-from ..core import OrderedDict, Element, NdOverlay, Overlay, HoloMap, CompositeOverlay, Element3D
+from ..core import OrderedDict, Element, NdOverlay, Overlay, HoloMap, LazyHoloMap, CompositeOverlay, Element3D
 from ..element import Annotation, Table, ItemTable
 from ..operation import Compositor
 from .plot import Plot
@@ -135,7 +135,9 @@ class ElementPlot(Plot):
             self.projection = '3d'
 
         dimensions = self.map.key_dimensions if dimensions is None else dimensions
-        keys = keys if keys else list(self.map.data.keys())
+        if not keys:
+            keys = (self.map.key_space if isinstance(self.map, LazyHoloMap)
+                    else list(self.map.data.keys()))
         plot_opts = Store.lookup_options(self.map.last, 'plot').options
         super(ElementPlot, self).__init__(keys=keys, dimensions=dimensions, adjoined=adjoined,
                                           uniform=uniform, **dict(params, **plot_opts))
@@ -154,6 +156,8 @@ class ElementPlot(Plot):
             else:
                 select = {d: key[dimensions.index(d)]
                           for d in key_dimensions}
+        elif isinstance(key, int) and isinstance(self.map, LazyHoloMap):
+            return self.map[self.map.key_space[min([key, len(self.map.key_space)-1])]]
         elif isinstance(key, int):
             return self.map.values()[min([key, len(self.map)-1])]
         else:
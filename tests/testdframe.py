@@ -0,0 +1,96 @@
+"""
+Unit tests of conversions between Elements and pandas DataFrames
+"""
+from unittest import SkipTest
+
+import numpy as np
+try:
+    import pandas as pd
+except ImportError:
+    raise SkipTest("Required dependencies not satisfied for testing DataFrame conversions")
+
+from holoviews import Table, Curve, Points, Raster, HeatMap
+from holoviews.element.comparison import ComparisonTestCase
+
+
+class TestElementToDFrame(ComparisonTestCase):
+
+    def setUp(self):
+        self.keys1 =   [('M',10), ('M',16), ('F',12)]
+        self.values1 = [(15, 0.8), (18, 0.6), (10, 0.8)]
+        self.key_dims1 = ['Gender', 'Age']
+        self.val_dims1 = ['Weight', 'Height']
+
+    def test_table_dframe(self):
+        table = Table(zip(self.keys1, self.values1),
+                      key_dimensions = self.key_dims1,
+                      value_dimensions = self.val_dims1)
+        dframe = table.dframe()
+        self.assertEqual(list(dframe.columns), self.key_dims1 + self.val_dims1)
+        self.assertEqual(list(dframe['Gender']), ['F', 'M', 'M'])
+        self.assertEqual(dframe['Age'].dtype.kind, 'i')
+        self.assertEqual(list(dframe['Height']), [0.8, 0.8, 0.6])
+
+    def test_indexed_table_dframe(self):
+        table = Table([(1, 2), (3, 4)], value_dimensions=['a', 'b'])
+        dframe = table.dframe()
+        self.assertEqual(list(dframe.columns), ['a', 'b'])
+        self.assertEqual(list(dframe['b']), [2, 4])
+
+    def test_curve_dframe_shares_memory(self):
+        curve = Curve(np.random.rand(5, 2))
+        dframe = curve.dframe()
+        self.assertEqual(list(dframe.columns), ['x', 'y'])
+        self.assertTrue(np.shares_memory(dframe['y'].values, curve.data))
+
+    def test_raster_dframe(self):
+        raster = Raster(np.arange(6.).reshape(2, 3))
+        dframe = raster.dframe()
+        self.assertEqual(list(dframe['x']), [0, 1, 2, 0, 1, 2])
+        self.assertEqual(list(dframe['y']), [0, 0, 0, 1, 1, 1])
+        self.assertEqual(list(dframe['z']), list(range(6)))
+
+    def test_heatmap_dframe_dense(self):
+        heatmap = HeatMap({(0, 0): 1, (1, 1): 2, (2, 0): 3})
+        dframe = heatmap.dframe(dense=True)
+        self.assertEqual(list(dframe['x']), [0, 0, 1, 1, 2, 2])
+        self.assertEqual(list(dframe['y']), [0, 1, 0, 1, 0, 1])
+        self.assertEqual(np.isnan(dframe['z'].values).tolist(),
+                         [False, True, True, False, False, True])
+
+    def test_heatmap_dframe_sparse(self):
+        heatmap = HeatMap({(0, 0): 1, (1, 1): 2, (2, 0): 3})
+        self.assertEqual(len(heatmap.dframe()), 3)
+
+
+class TestDFrameToElement(ComparisonTestCase):
+
+    def setUp(self):
+        self.dframe = pd.DataFrame({'x': np.arange(5.), 'y': np.arange(5)**2,
+                                    'z': list('abcab')})
+
+    def test_curve_from_dframe(self):
+        curve = Curve(self.dframe[['x', 'y']])
+        self.assertEqual(curve.key_dimensions[0].name, 'x')
+        self.assertEqual(curve.value_dimensions[0].name, 'y')
+        self.assertEqual(curve.data[:, 1], np.arange(5.)**2)
+
+    def test_points_from_dframe_dimensions(self):
+        points = Points(self.dframe, key_dimensions=['y', 'x'], value_dimensions=[])
+        self.assertEqual(points.data, np.column_stack([np.arange(5)**2, np.arange(5.)]))
+
+    def test_table_from_dframe_indexed(self):
+        table = Table(self.dframe)
+        self.assertEqual(table.key_dimensions[0].name, 'Row')
+        self.assertEqual([d.name for d in table.value_dimensions], ['x', 'y', 'z'])
+        self.assertEqual(table.data[(3,)], (3., 9, 'a'))
+
+    def test_table_from_dframe_repeated_keys(self):
+        table = Table(self.dframe, key_dimensions=['z'], value_dimensions=['y'])
+        self.assertEqual(table.items(), [('a', (9,)), ('b', (16,)), ('c', (4,))])
+
+    def test_table_dframe_roundtrip(self):
+        table = Table(self.dframe, key_dimensions=['x'], value_dimensions=['y', 'z'])
+        dframe = table.dframe()
+        self.assertEqual(list(dframe['y']), list(self.dframe['y']))
+        self.assertEqual(list(dframe['z']), list(self.dframe['z']))
@@ -1,7 +1,8 @@
 """
 Test cases for Dimension and Dimensioned object behaviour.
 """
-from holoviews.core import Dimensioned
+from holoviews.core import Dimension, Dimensioned, HoloMap
+from holoviews.element import Curve
 from holoviews.element.comparison import ComparisonTestCase
 
 
@@ -18,3 +19,62 @@ class DimensionedTest(ComparisonTestCase):
             view.label = 'another label'
             raise AssertionError("Label should be a constant parameter.")
         except TypeError: pass
+
+    def test_dimensioned_get_dimension(self):
+        view = Dimensioned(None, key_dimensions=['a', 'b'], value_dimensions=['c'])
+        self.assertEqual(view.get_dimension('c').name, 'c')
+        self.assertEqual(view.get_dimension(1).name, 'b')
+        self.assertEqual(view.get_dimension('d'), None)
+
+    def test_dimensioned_get_dimension_index(self):
+        view = Dimensioned(None, key_dimensions=['a', 'b'], value_dimensions=['c'])
+        self.assertEqual(view.get_dimension_index('c'), 2)
+        self.assertEqual(view.get_dimension_index(Dimension('b')), 1)
+
+    def test_dimensioned_dimensions_by_group(self):
+        view = Dimensioned(None, key_dimensions=['a', 'b'], value_dimensions=['c'])
+        self.assertEqual(view.dimensions(label=True), ['a', 'b', 'c'])
+        self.assertEqual(view.dimensions('key', label=True), ['a', 'b'])
+        self.assertEqual(view.dimensions('value', label=True), ['c'])
+
+    def test_deep_dimensions_lookup(self):
+        hmap = HoloMap({0: Curve([(0, 1)])}, key_dimensions=['k'])
+        self.assertEqual(hmap.get_dimension_index('y'), 2)
+        self.assertEqual(hmap.get_dimension('x').name, 'x')
+
+
+class DimensionTest(ComparisonTestCase):
+
+    def test_dimension_hash_consistent_with_equality(self):
+        self.assertEqual(hash(Dimension('x', unit='m')), hash(Dimension('x')))
+        self.assertEqual({Dimension('x'): 1}.get('x'), 1)
+
+    def test_dimension_interned(self):
+        self.assertIs(Dimension('x', unit='m'), Dimension('x', unit='m'))
+        self.assertIsNot(Dimension('x', unit='m'), Dimension('x', unit='s'))
+
+    def test_dimension_copy_constructor(self):
+        dim = Dimension('x', unit='m')
+        self.assertIs(Dimension(dim), dim)
+        self.assertEqual(Dimension(dim, cyclic=True).unit, 'm')
+
+    def test_dimension_immutable(self):
+        dim = Dimension('x')
+        try:
+            dim.unit = 'm'
+            raise AssertionError("Dimension should be immutable.")
+        except AttributeError: pass
+
+    def test_dimension_values_immutable(self):
+        dim = Dimension('x', values=['a', 'b'])
+        self.assertEqual(dim.values, ('a', 'b'))
+        self.assertIs(Dimension('x', values=('a', 'b')), dim)
+        with self.assertRaises(AttributeError):
+            dim.values.append('c')
+
+    def test_dimension_pickle(self):
+        import pickle
+        dim = Dimension('x', values=['a', 'b'])
+        unpickled = pickle.loads(pickle.dumps(dim))
+        self.assertIs(unpickled, dim)
+        self.assertEqual(unpickled.values, ('a', 'b'))
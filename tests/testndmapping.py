@@ -1,7 +1,13 @@
+import random
 from collections import OrderedDict
 
+import numpy as np
+
 from holoviews.core import Dimension
-from holoviews.core.ndmapping import MultiDimensionalMapping
+from holoviews.core.ndmapping import MultiDimensionalMapping, NdMapping
+from holoviews.core.element import HoloMap, LazyHoloMap
+from holoviews.core.overlay import NdOverlay
+from holoviews.element import Curve, Image, ChartStack
 from holoviews.element.comparison import ComparisonTestCase
 
 
@@ -108,3 +114,372 @@ class NdIndexableMappingTest(ComparisonTestCase):
         ndmap = MultiDimensionalMapping(data, key_dimensions=[self.dim1])
 
         self.assertEqual(list(ndmap.keys()), [0, 1])
+
+    def test_idxmapping_incremental_insertion_sorted(self):
+        ndmap = MultiDimensionalMapping(key_dimensions=[self.dim1, self.dim2])
+        for key in [(5, 1.0), (1, 3.0), (3, 2.0), (1, 1.0), (7, 0.5)]:
+            ndmap[key] = str(key)
+        self.assertEqual(list(ndmap.keys()), [(1, 1.0), (1, 3.0), (3, 2.0),
+                                              (5, 1.0), (7, 0.5)])
+        self.assertEqual(ndmap.last, str((7, 0.5)))
+        self.assertEqual(ndmap.last_key, (7, 0.5))
+
+    def test_idxmapping_last_defers_sort(self):
+        ndmap = MultiDimensionalMapping(key_dimensions=[self.dim1])
+        keys = [5, 1, 7, 3]
+        for i, key in enumerate(keys):
+            ndmap[key] = str(key)
+            self.assertEqual(ndmap.last_key, max(keys[:i+1]))
+        self.assertEqual(ndmap.last, '7')
+        self.assertTrue(ndmap._pending_sort)
+        self.assertEqual(list(ndmap.keys()), [1, 3, 5, 7])
+
+    def test_idxmapping_incremental_insertion_categorical(self):
+        dim = Dimension('strdim', values=['c', 'a', 'b'])
+        ndmap = MultiDimensionalMapping(key_dimensions=[dim])
+        for key in ['b', 'c', 'a']:
+            ndmap[key] = key
+        self.assertEqual(list(ndmap.keys()), ['c', 'a', 'b'])
+
+    def test_idxmapping_insertion_after_pop(self):
+        ndmap = MultiDimensionalMapping(self.init_items_1D_list, key_dimensions=[self.dim1])
+        ndmap[3] = 'c'
+        ndmap.pop(1)
+        ndmap[0] = 'd'
+        self.assertEqual(list(ndmap.items()), [(0, 'd'), (3, 'c'), (5, 'b')])
+
+    def test_holomap_incremental_insertion_shuffled(self):
+        # Scaled down benchmark of incremental insertion, reading the
+        # last frame after every insert as when animating a HoloMap
+        keys = list(range(20000))
+        random.shuffle(keys)
+        curve = Curve([(0, 1), (1, 2)])
+        hmap = HoloMap(key_dimensions=[self.dim1])
+        for i, key in enumerate(keys):
+            hmap[key] = curve
+            if i % 1000 == 0:
+                self.assertEqual(hmap.last_key, max(keys[:i+1]))
+            hmap.last
+        self.assertEqual(hmap.keys(), sorted(keys))
+
+    def test_holomap_nested_dimensions_after_pop(self):
+        curve = Curve([(0, 1), (1, 2)])
+        hmap = HoloMap(key_dimensions=[self.dim1])
+        hmap[0] = HoloMap([((0, 0), curve)], key_dimensions=[self.dim1, 'x'])
+        hmap.pop(0)
+        hmap[1] = HoloMap([((0, 0), curve)], key_dimensions=[self.dim1, 'y'])
+        self.assertEqual(hmap.keys(), [1])
+
+    def test_holomap_nested_dimensions_after_data_assignment(self):
+        curve = Curve([(0, 1), (1, 2)])
+        hmap = HoloMap(key_dimensions=[self.dim1])
+        hmap[0] = HoloMap([((0, 0), curve)], key_dimensions=[self.dim1, 'x'])
+        hmap.data = OrderedDict()
+        hmap[1] = HoloMap([((0, 0), curve)], key_dimensions=[self.dim1, 'y'])
+        self.assertEqual(hmap.keys(), [1])
+
+    def test_holomap_nested_dimensions_after_clone(self):
+        curve = Curve([(0, 1), (1, 2)])
+        hmap = HoloMap(key_dimensions=[self.dim1])
+        hmap[0] = HoloMap([((0, 0), curve)], key_dimensions=[self.dim1, 'x'])
+        clone = hmap.clone([], shared_data=False)
+        clone[1] = HoloMap([((0, 0), curve)], key_dimensions=[self.dim1, 'y'])
+        self.assertEqual(clone.keys(), [1])
+
+    def test_idxmapping_from_items(self):
+        items = [((5, 3), 'b'), ((1, 2), 'a')]
+        ndmap = MultiDimensionalMapping.from_items(items, key_dimensions=[self.dim1, self.dim2])
+        self.assertEqual(list(ndmap.items()), [((1, 2.0), 'a'), ((5, 3.0), 'b')])
+        self.assertEqual(type(ndmap.keys()[0][1]), float)
+
+    def test_idxmapping_from_items_initial_values(self):
+        dim = Dimension('strdim', values='initial')
+        ndmap = MultiDimensionalMapping.from_items([('b', 1), ('a', 2), ('b', 3)],
+                                                   key_dimensions=[dim])
+        self.assertEqual(list(ndmap.items()), [('b', 3), ('a', 2)])
+
+    def test_idxmapping_from_items_initial_values_unvalidated(self):
+        dim = Dimension('strdim', values='initial')
+        ndmap = MultiDimensionalMapping.from_items([('b', 1), ('a', 2), ('c', 3)],
+                                                   validate=None, key_dimensions=[dim])
+        self.assertEqual(list(ndmap.items()), [('b', 1), ('a', 2), ('c', 3)])
+
+    def test_idxmapping_from_items_invalid_value(self):
+        dim = Dimension('strdim', values=['a', 'b'])
+        with self.assertRaises(KeyError):
+            MultiDimensionalMapping.from_items([('a', 1), ('c', 2)], key_dimensions=[dim])
+
+    def test_idxmapping_from_items_key_length(self):
+        with self.assertRaises(KeyError):
+            MultiDimensionalMapping.from_items(self.init_item_list, key_dimensions=[self.dim1])
+
+    def test_idxmapping_extend(self):
+        ndmap = MultiDimensionalMapping(self.init_items_1D_list, key_dimensions=[self.dim1])
+        ndmap.extend([(3, 'c'), (0.5, 'd')])
+        self.assertEqual(list(ndmap.items()), [(0, 'd'), (1, 'a'), (3, 'c'), (5, 'b')])
+
+    def test_idxmapping_extend_nested_update(self):
+        inner = NdMapping([(0, 'a')], key_dimensions=[self.dim1])
+        ndmap = MultiDimensionalMapping([(0.5, inner)], key_dimensions=[self.dim2])
+        ndmap.extend([(0.5, {(1,): 'b'})])
+        self.assertEqual(list(ndmap[0.5].values()), ['a', 'b'])
+
+    def test_ndmapping_clone_shares_data(self):
+        ndmap = NdMapping([(i, i) for i in range(5)], key_dimensions=[self.dim1])
+        clone = ndmap.clone()
+        self.assertIs(clone._data, ndmap._data)
+        clone[10] = 10
+        ndmap.pop(0)
+        self.assertEqual(ndmap.keys(), [1, 2, 3, 4])
+        self.assertEqual(clone.keys(), [0, 1, 2, 3, 4, 10])
+
+    def test_ndmapping_full_slice_shares_data(self):
+        ndmap = NdMapping([((i, i), i) for i in range(5)], key_dimensions=[self.dim1, 'b'])
+        sliced = ndmap[:, :]
+        self.assertIs(sliced._data, ndmap._data)
+        sliced[(5, 5)] = 5
+        self.assertEqual(len(ndmap), 5)
+
+    def test_ndmapping_shared_data_access_copies(self):
+        ndmap = NdMapping([(i, i) for i in range(5)], key_dimensions=[self.dim1])
+        sliced = ndmap[:]
+        sliced.data[(0,)] = 'a'
+        ndmap.data[(1,)] = 'b'
+        self.assertEqual(ndmap.values(), [0, 'b', 2, 3, 4])
+        self.assertEqual(sliced.values(), ['a', 1, 2, 3, 4])
+
+    def test_holomap_select_unmatched_shares_data(self):
+        hmap = HoloMap([(i, Curve([(0, i)])) for i in range(3)], key_dimensions=[self.dim1])
+        self.assertIs(hmap.select(z=0)._data, hmap._data)
+
+    def test_holomap_relabel_leaves_original(self):
+        hmap = HoloMap([(i, Curve([(0, i)])) for i in range(3)], key_dimensions=[self.dim1])
+        relabelled = hmap.relabel('Test')
+        self.assertEqual([c.label for c in relabelled.values()], ['Test']*3)
+        self.assertEqual([c.label for c in hmap.values()], ['']*3)
+
+    def test_holomap_groupby_inner_dimension(self):
+        hmap = HoloMap([((a, b, c), Curve([(0, a*100+b*10+c)]))
+                        for a in range(3) for b in range(2) for c in range(2)],
+                       key_dimensions=['a', 'b', 'c'])
+        grouped = hmap.groupby(['b'])
+        self.assertEqual(grouped.keys(), [0, 1])
+        group = grouped[1]
+        self.assertEqual([d.name for d in group.key_dimensions], ['a', 'c'])
+        self.assertEqual(group.keys(), [(a, c) for a in range(3) for c in range(2)])
+        self.assertEqual(group[2, 1].data[0, 1], 211)
+
+    def test_holomap_groupby_constant_dimensions(self):
+        hmap = HoloMap([((a, b), Curve([(0, a*10+b)])) for a in range(3) for b in range(2)],
+                       key_dimensions=['a', 'b'], constant_dimensions={Dimension('z'): 1})
+        self.assertEqual(hmap.groupby(['a'])[1].constant_dimensions, OrderedDict())
+
+    def test_holomap_overlay_group_parameters(self):
+        hmap = HoloMap([((a, b), Curve([(0, a*10+b)])) for a in range(3) for b in range(2)],
+                       key_dimensions=['a', 'b'])
+        overlay = hmap.overlay(['b'])
+        self.assertEqual(type(overlay[2]), NdOverlay)
+        self.assertEqual(overlay[2].constant_dimensions, OrderedDict())
+        self.assertEqual(overlay[2].keys(), [0, 1])
+        self.assertEqual(overlay[2][1].data[0, 1], 21)
+
+    def test_holomap_extend_type_check(self):
+        hmap = HoloMap([(0, Curve([(0, 1)]))], key_dimensions=[self.dim1])
+        with self.assertRaises(AssertionError):
+            hmap.extend([(1, Curve([(0, 1)])), (2, Image(np.zeros((2, 2))))])
+
+    def test_ndmapping_slice_range_set_value(self):
+        keys = [(a, b, c) for a in range(5) for b in range(3) for c in ['x', 'y']]
+        ndmap = NdMapping([(k, k) for k in keys], key_dimensions=['a', 'b', 'c'])
+        sliced = ndmap[1:3, {0, 2}, 'y']
+        self.assertEqual(sliced.keys(), [(1, 0, 'y'), (1, 2, 'y'), (2, 0, 'y'), (2, 2, 'y')])
+
+    def test_ndmapping_slice_step(self):
+        ndmap = NdMapping([(i, i) for i in range(10)], key_dimensions=[self.dim1])
+        self.assertEqual(ndmap[2:8:2].keys(), [2, 4, 6])
+
+    def test_ndmapping_slice_categorical(self):
+        dim = Dimension('strdim', values=['c', 'b', 'a'])
+        keys = [(a, b) for a in range(3) for b in ['a', 'b', 'c']]
+        ndmap = NdMapping([(k, k) for k in keys], key_dimensions=[self.dim1, dim])
+        self.assertEqual(ndmap[1:, 'c':'a'].keys(), [(2, 'c'), (2, 'b')])
+
+    def test_ndmapping_slice_after_insertion(self):
+        ndmap = NdMapping([(i, i) for i in range(5)], key_dimensions=[self.dim2])
+        self.assertEqual(ndmap[1:3].keys(), [1, 2])
+        ndmap[1.5] = 'a'
+        ndmap.pop(2.0)
+        ndmap[2.5] = 'b'
+        self.assertEqual(ndmap[1:3].keys(), [1, 1.5, 2.5])
+
+    def test_idxmapping_categorical_sort(self):
+        dim = Dimension('strdim', values=['c', 'a', 'b'])
+        ndmap = MultiDimensionalMapping([(('b', 1), 1), (('c', 0), 2), (('a', 2), 3)],
+                                        key_dimensions=[dim, self.dim1])
+        self.assertEqual(ndmap.keys(), [('c', 0), ('a', 2), ('b', 1)])
+
+    def test_idxmapping_initial_values_substring(self):
+        dim = Dimension('strdim', values='initial')
+        ndmap = MultiDimensionalMapping([('t', 1), ('a', 2), ('n', 3)], key_dimensions=[dim])
+        self.assertEqual(ndmap._cached_index_values['strdim'], ['t', 'a', 'n'])
+        self.assertEqual(ndmap.keys(), ['t', 'a', 'n'])
+
+    def test_idxmapping_categorical_invalid_value(self):
+        dim = Dimension('strdim', values=['a', 'b'])
+        ndmap = MultiDimensionalMapping([('a', 1)], key_dimensions=[dim])
+        with self.assertRaises(KeyError):
+            ndmap['c'] = 2
+
+
+
+class LazyHoloMapTest(ComparisonTestCase):
+
+    def setUp(self):
+        self.calls = []
+        self.dims = [Dimension('a', values=list(range(100))),
+                     Dimension('b', values=list(range(100)))]
+
+    def callback(self, a, b):
+        self.calls.append((a, b))
+        return Image(np.full((5, 5), a*b, dtype=np.float64))
+
+    def test_lazy_holomap_key_space(self):
+        lazy = LazyHoloMap(callback=self.callback, key_dimensions=self.dims)
+        self.assertEqual(len(lazy.key_space), 10000)
+        self.assertEqual(len(lazy), 10000)
+        self.assertEqual(len(lazy.data), 0)
+        self.assertEqual(lazy.keys()[:2], [(0, 0), (0, 1)])
+        self.assertEqual(self.calls, [])
+
+    def test_lazy_holomap_getitem_cached(self):
+        lazy = LazyHoloMap(callback=self.callback, key_dimensions=self.dims)
+        self.assertEqual(lazy[3, 4].data[0, 0], 12)
+        lazy[3, 4]
+        self.assertEqual(self.calls, [(3, 4)])
+
+    def test_lazy_holomap_cache_size(self):
+        lazy = LazyHoloMap(callback=self.callback, key_dimensions=self.dims,
+                           cache_size=3)
+        for i in range(5):
+            lazy[i, i]
+        lazy[2, 2]
+        lazy[5, 5]
+        self.assertEqual(list(lazy.data.keys()), [(2, 2), (4, 4), (5, 5)])
+
+    def test_lazy_holomap_cache_bytes(self):
+        lazy = LazyHoloMap(callback=self.callback, key_dimensions=self.dims,
+                           cache_size=None, cache_bytes=450)
+        for i in range(5):
+            lazy[i, 0]
+        self.assertEqual(list(lazy.data.keys()), [(3, 0), (4, 0)])
+
+    def test_lazy_holomap_type(self):
+        lazy = LazyHoloMap(callback=self.callback, key_dimensions=self.dims)
+        self.assertEqual(lazy.type, Image)
+        self.assertEqual(self.calls, [(0, 0)])
+        self.assertEqual(len(lazy.values()), 1)
+        self.assertIn((99, 99), lazy)
+
+    def test_lazy_holomap_invalid_key(self):
+        lazy = LazyHoloMap(callback=self.callback, key_space=[(0, 0), (1, 1)],
+                           key_dimensions=['a', 'b'])
+        with self.assertRaises(KeyError):
+            lazy[0, 1]
+
+    def test_lazy_holomap_slice(self):
+        lazy = LazyHoloMap(callback=self.callback, key_dimensions=self.dims)
+        sliced = lazy[2:4, set([1, 2])]
+        self.assertEqual(sliced.key_space, [(2, 1), (2, 2), (3, 1), (3, 2)])
+        self.assertEqual(self.calls, [])
+        self.assertEqual(sliced.last.data[0, 0], 6)
+
+    def test_lazy_holomap_select(self):
+        lazy = LazyHoloMap(callback=self.callback, key_dimensions=self.dims)
+        self.assertEqual(lazy.select((HoloMap,), a=2, b=5).data[0, 0], 10)
+        selection = lazy.select(a=(0, 2), b=1)
+        self.assertEqual(selection.key_space, [(0, 1), (1, 1)])
+        self.assertEqual(self.calls, [(2, 5)])
+
+    def test_lazy_holomap_deep_select(self):
+        lazy = LazyHoloMap(callback=lambda x: Curve([(0, x), (1, x)]),
+                           key_space=[2, 0, 1], key_dimensions=['z'])
+        self.assertEqual(lazy.key_space, [(0,), (1,), (2,)])
+        selection = lazy.select(z=(1, 3), x=(0, 1))
+        self.assertEqual(selection[2].data, np.array([[0, 2]]))
+
+    def test_lazy_holomap_groupby(self):
+        lazy = LazyHoloMap(callback=self.callback, key_dimensions=self.dims[:1] + ['b'],
+                           key_space=[(a, b) for a in range(3) for b in range(4)])
+        grouped = lazy.groupby(['a'])
+        self.assertEqual(grouped.key_space, [(0,), (1,), (2,)])
+        self.assertEqual(grouped[2].key_space, [(0,), (1,), (2,), (3,)])
+        self.assertEqual(grouped[2][3].data[0, 0], 6)
+        self.assertEqual(grouped[2].constant_dimensions, OrderedDict())
+        self.assertEqual(self.calls, [(2, 3)])
+
+    def test_lazy_holomap_overlay(self):
+        lazy = LazyHoloMap(callback=self.callback, key_dimensions=['a', 'b'],
+                           key_space=[(a, b) for a in range(3) for b in range(4)])
+        overlay = lazy.overlay(['b'])
+        self.assertEqual(overlay[2].keys(), [0, 1, 2, 3])
+        self.assertEqual(overlay[2][3].data[0, 0], 6)
+
+    def test_lazy_holomap_relabel(self):
+        lazy = LazyHoloMap(callback=self.callback, key_dimensions=self.dims)
+        lazy[1, 1]
+        relabelled = lazy.relabel('Test')
+        self.assertEqual(relabelled.label, 'Test')
+        self.assertEqual(relabelled[1, 1].label, 'Test')
+        self.assertEqual(relabelled[2, 3].label, 'Test')
+        self.assertEqual(relabelled[2, 3].data[0, 0], 6)
+
+    def test_lazy_holomap_key_range(self):
+        lazy = LazyHoloMap(callback=self.callback, key_dimensions=self.dims)
+        lazy[1, 1]
+        self.assertEqual(lazy.range('a'), (0, 99))
+
+    def test_lazy_holomap_table(self):
+        lazy = LazyHoloMap(callback=lambda x: Curve([(0, x), (1, x)]),
+                           key_space=[0, 1, 2], key_dimensions=['z'])
+        self.assertEqual(len(lazy.table()), 6)
+
+
+
+class HoloMapSampleTest(ComparisonTestCase):
+
+    def setUp(self):
+        self.xs = np.linspace(0, 1, 5)
+        self.hmap = HoloMap([((t, c), Curve(np.column_stack([self.xs, self.xs*t+i])))
+                             for i, (t, c) in enumerate((t, c) for t in range(3) for c in 'ab')],
+                            key_dimensions=['t', 'c'])
+
+    def test_holomap_stacked_charts(self):
+        self.assertEqual(type(self.hmap._stacked()), ChartStack)
+
+    def test_holomap_stacked_ragged_charts(self):
+        hmap = HoloMap([(t, Curve(np.column_stack([self.xs[:t+2], self.xs[:t+2]])))
+                        for t in range(3)], key_dimensions=['t'])
+        self.assertEqual(hmap._stacked(), None)
+        table = hmap.sample([0.25])
+        self.assertEqual(list(table.data.items()),
+                         [((t, 0.25), (0.25,)) for t in range(3)])
+
+    def test_holomap_sample_charts(self):
+        table = self.hmap.sample([0.5, 0.25])
+        self.assertEqual([d.name for d in table.key_dimensions], ['t', 'c', 'x'])
+        self.assertEqual(list(table.data.keys())[:3],
+                         [(0, 'a', 0.25), (0, 'a', 0.5), (0, 'b', 0.25)])
+        self.assertEqual(table[2, 'b', 0.5], 2.*0.5+5)
+
+    def test_holomap_reduce_charts(self):
+        table = self.hmap.reduce(x=np.mean)
+        self.assertEqual([d.name for d in table.key_dimensions], ['t', 'c'])
+        self.assertEqual(table[1, 'a'], 0.5+2)
+
+    def test_holomap_reduce_images_to_points(self):
+        hmap = HoloMap([(t, Image(np.full((2, 3), t))) for t in range(3)],
+                       key_dimensions=['t'])
+        table = hmap.reduce(x=np.mean, y=np.sum)
+        self.assertEqual(list(table.data.items()),
+                         [((0,), (0.,)), ((1,), (2.,)), ((2,), (4.,))])
+
@@ -246,6 +246,24 @@ class TestStoreInheritance(ComparisonTestCase):
         # Check plot options works as expected
         self.assertEqual(Store.lookup_options(hist2, 'plot').options, self.default_plot)
 
+    def test_lookup_memoized(self):
+        self.assertIs(Store.lookup_options(self.hist, 'plot'),
+                      Store.lookup_options(self.hist, 'plot'))
+
+    def test_lookup_invalidated_by_setattr(self):
+        Store.lookup_options(self.hist, 'plot')
+        Store.options.Histogram = Options('plot', plot1='updated')
+        self.assertEqual(Store.lookup_options(self.hist, 'plot').options,
+                         dict(plot1='updated', plot2='plot2'))
+
+    def test_lookup_invalidated_by_store_replacement(self):
+        hist2 = self.hist(plot={'plot3':'plot3'})
+        Store.lookup_options(hist2, 'plot')
+        Store.options = OptionTree(groups={'plot':  Options(),
+                                           'style': Options()})
+        self.assertEqual(Store.lookup_options(hist2, 'plot').options,
+                         dict(plot3='plot3'))
+
 
 class TestOptionTreeFind(ComparisonTestCase):
 
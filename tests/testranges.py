@@ -0,0 +1,52 @@
+"""
+Unit tests of the ranges computed and cached on Elements
+"""
+import pickle
+
+import numpy as np
+from holoviews import Curve, Image, Table, Dimension
+from holoviews.element.comparison import ComparisonTestCase
+
+
+class ElementRangeTest(ComparisonTestCase):
+
+    def setUp(self):
+        self.curve = Curve(np.array([[0, 1.], [1, 3.], [2, np.NaN]]))
+
+    def test_curve_range(self):
+        self.assertEqual(self.curve.range('x'), (0, 2))
+        self.assertEqual(self.curve.range(1), (1, 3))
+
+    def test_curve_range_data_assignment(self):
+        self.assertEqual(self.curve.range('y'), (1, 3))
+        self.curve.data = np.array([[0, 5.], [1, 7.]])
+        self.assertEqual(self.curve.range('y'), (5, 7))
+
+    def test_curve_range_dimension_assignment(self):
+        self.assertEqual(self.curve.range('y'), (1, 3))
+        self.curve.value_dimensions = [Dimension('y', range=(0, 10))]
+        self.assertEqual(self.curve.range('y'), (0, 10))
+
+    def test_image_range(self):
+        image = Image(np.arange(4.).reshape(2, 2))
+        self.assertEqual(image.range('z'), (0, 3))
+        image.data = np.arange(9.).reshape(3, 3)
+        self.assertEqual(image.range('z'), (0, 8))
+
+    def test_table_range_setitem(self):
+        table = Table([(1, 2), (3, 4)], value_dimensions=['a', 'b'])
+        self.assertEqual(table.range('a'), (1, 3))
+        table[2] = (10, 1)
+        self.assertEqual(table.range('a'), (1, 10))
+
+    def test_range_cache_not_pickled(self):
+        self.assertEqual(self.curve.range('y'), (1, 3))
+        unpickled = pickle.loads(pickle.dumps(self.curve))
+        self.assertNotIn('_range_cache', unpickled.__dict__)
+        unpickled.data[0, 1] = -5.
+        self.assertEqual(unpickled.range('y'), (-5, 3))
+
+    def test_table_range_cache_not_pickled(self):
+        table = Table([(1, 2), (3, 4)], value_dimensions=['a', 'b'])
+        self.assertEqual(table.range('a'), (1, 3))
+        self.assertNotIn('_range_cache', pickle.loads(pickle.dumps(table)).__dict__)
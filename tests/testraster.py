@@ -3,7 +3,8 @@ Unit tests of Raster elements
 """
 
 import numpy as np
-from holoviews.element import Raster, Image
+from holoviews import HoloMap
+from holoviews.element import Raster, Image, RasterStack
 from holoviews.element.comparison import ComparisonTestCase
 
 class TestRaster(ComparisonTestCase):
@@ -36,3 +37,93 @@ class TestRaster(ComparisonTestCase):
         image = Image(self.array1)
         self.assertEqual(image.sample(y=0.25).data,
                          np.array([(-0.333333, 0), (0, 1), (0.333333, 2)]))
+
+
+    def test_raster_reduce(self):
+        raster = Raster(self.array1)
+        self.assertEqual(list(raster.reduce(x=np.mean).data.values()),
+                         [(1.,), (4.,)])
+
+
+
+class TestRasterStack(ComparisonTestCase):
+
+    def setUp(self):
+        np.random.seed(1)
+        self.hmap = HoloMap([((t, c), Image(np.random.rand(6, 8)*t - 0.3))
+                             for t in range(1, 4) for c in 'ab'],
+                            key_dimensions=['t', 'c'])
+        self.stack = RasterStack.from_holomap(self.hmap)
+
+    def assertTablesEqual(self, table1, table2):
+        self.assertEqual(list(table1.data.keys()), list(table2.data.keys()))
+        self.assertEqual(np.array(list(table1.data.values())),
+                         np.array(list(table2.data.values())))
+        self.assertEqual(table1.key_dimensions, table2.key_dimensions)
+
+    def test_stack_frames(self):
+        self.assertEqual(self.stack.stack.shape, (6, 6, 8))
+        self.assertEqual(self.stack[2, 'b'], self.hmap[2, 'b'])
+
+    def test_stack_key_space_order(self):
+        data = np.arange(3)[:, np.newaxis, np.newaxis] * np.ones((3, 2, 2))
+        stack = RasterStack(stack=data, template=Image(data[0]),
+                            key_space=[2, 0, 1], key_dimensions=['t'])
+        self.assertEqual(stack[0].data, data[1])
+
+    def test_stack_invalid_shape(self):
+        with self.assertRaises(ValueError):
+            RasterStack(stack=np.zeros((2, 3, 3)), template=Image(np.zeros((2, 2))),
+                        key_space=[0, 1], key_dimensions=['t'])
+
+    def test_stack_inhomogeneous_holomap(self):
+        hmap = HoloMap([(0, Image(np.zeros((2, 2)))), (1, Image(np.zeros((3, 3))))])
+        with self.assertRaises(ValueError):
+            RasterStack.from_holomap(hmap)
+
+    def test_stack_slice(self):
+        sliced = self.stack[1:3, :, 0:0.5, :]
+        self.assertEqual(type(sliced), RasterStack)
+        self.assertEqual(sliced.key_space, [(1, 'a'), (1, 'b'), (2, 'a'), (2, 'b')])
+        self.assertEqual(sliced[2, 'a'], self.hmap[2, 'a'][0:0.5, :])
+
+    def test_stack_select(self):
+        selection = self.stack.select(c='a', x=(0, 0.5))
+        self.assertEqual(type(selection), RasterStack)
+        self.assertEqual(selection[3, 'a'], self.hmap[3, 'a'].select(x=(0, 0.5)))
+
+    def test_stack_collapse(self):
+        collapsed = self.stack.collapse(['t'], np.mean)
+        expected = self.hmap.collapse(['t'], np.mean)
+        for key in expected.keys():
+            self.assertEqual(collapsed[key], expected[key])
+
+    def test_stack_collapse_unknown_dimension(self):
+        with self.assertRaises(Exception):
+            self.stack.collapse(['t', 'z'], np.mean)
+
+    def test_stack_range(self):
+        self.assertEqual(self.stack.range('z'), self.hmap.range('z'))
+        self.assertEqual(self.stack.range('t'), self.hmap.range('t'))
+        self.assertEqual(self.stack.range('x'), self.hmap.range('x'))
+
+    def test_stack_sample(self):
+        self.assertTablesEqual(self.stack.sample([(0, 0), (0.2, 0.1)]),
+                               self.hmap.sample([(0, 0), (0.2, 0.1)]))
+        self.assertTablesEqual(self.stack.sample(y=0), self.hmap.sample(y=0))
+
+    def test_stack_reduce(self):
+        self.assertTablesEqual(self.stack.reduce(x=np.mean),
+                               self.hmap.reduce(x=np.mean))
+        self.assertTablesEqual(self.stack.reduce(x=np.mean, y=np.max),
+                               self.hmap.reduce(x=np.mean, y=np.max))
+
+    def test_stack_hist(self):
+        for kwargs in [{}, {'bin_range': (0, 1)}, {'normed': False},
+                       {'individually': False, 'dimension': 'z'},
+                       {'style_prefix': 'Custom_'},
+                       {'style_prefix': 'Custom_', 'dimension': 'x'}]:
+            hists = self.stack.hist(adjoin=False, num_bins=7, **kwargs)
+            expected = self.hmap.hist(adjoin=False, num_bins=7, **kwargs)
+            for key in expected.keys():
+                self.assertEqual(hists[key], expected[key])
@@ -2,6 +2,8 @@
 Unit tests of the StoreOptions class used to control custom options on
 Store as used by the %opts magic.
 """
+import gc
+
 import numpy as np
 from holoviews import Overlay, Curve, Image
 from holoviews.core.options import Store, StoreOptions
@@ -94,3 +96,35 @@ class TestStoreOptionsCall(ComparisonTestCase):
             layout, 'plot').kwargs['hspace'], 10)
 
 
+
+
+class TestStoreOptionsGarbageCollection(ComparisonTestCase):
+
+    def test_custom_options_owner_counts(self):
+        curve = Curve(zip(range(10), range(10)))(dict(style={'Curve':{'color':'k'}}))
+        copy = curve.clone(id=curve.id)
+        self.assertEqual(Store.custom_option_counts()[curve.id], 2)
+        del copy
+        gc.collect()
+        self.assertEqual(Store.custom_option_counts()[curve.id], 1)
+
+    def test_garbage_collect_unreferenced_trees(self):
+        curve = Curve(zip(range(10), range(10)))(dict(style={'Curve':{'color':'k'}}))
+        tree_id = curve.id
+        del curve
+        gc.collect()
+        self.assertIn(tree_id, Store.garbage_collect())
+        self.assertNotIn(tree_id, Store.custom_options)
+
+    def test_garbage_collect_keeps_referenced_trees(self):
+        curve = Curve(zip(range(10), range(10)))(dict(style={'Curve':{'color':'k'}}))
+        Store.garbage_collect()
+        self.assertEqual(Store.lookup_options(curve, 'style').kwargs['color'], 'k')
+
+    def test_garbage_collect_after_dumps_loads(self):
+        curve = Curve(zip(range(10), range(10)))(dict(style={'Curve':{'color':'k'}}))
+        loaded = Store.loads(Store.dumps(curve))
+        del curve
+        gc.collect()
+        Store.garbage_collect()
+        self.assertEqual(Store.lookup_options(loaded, 'style').kwargs['color'], 'k')
@@ -2,7 +2,10 @@
 Unit tests of tabular elements
 """
 
+import pickle
 from collections import OrderedDict
+
+import numpy as np
 from holoviews import Table, ItemTable
 from holoviews.element.comparison import ComparisonTestCase
 
@@ -66,3 +69,137 @@ class TestTable(ComparisonTestCase):
                       value_dimensions = self.val_dims1)
         self.assertEquals(table['F', 12, 'Height'], 0.8)
 
+
+
+    def test_table_dimension_values_columns(self):
+        table =Table(zip(self.keys1, self.values1),
+                      key_dimensions = self.key_dims1,
+                      value_dimensions = self.val_dims1)
+        self.assertEqual(table.dimension_values('Weight'), np.array([10, 15, 18]))
+        self.assertEqual(table.dimension_values('Age'), np.array([12, 10, 16]))
+        self.assertEqual(list(table.dimension_values('Gender')), ['F', 'M', 'M'])
+
+    def test_table_setitem_after_init(self):
+        table =Table(zip(self.keys1, self.values1),
+                      key_dimensions = self.key_dims1,
+                      value_dimensions = self.val_dims1)
+        table['F', 11] = (12, 'tall')
+        table['M', 10] = (14.5, 0.7)
+        self.assertEqual(list(table.data.keys()),
+                         [('F', 11), ('F', 12), ('M', 10), ('M', 16)])
+        self.assertEqual(list(table.dimension_values('Height')), ['tall', 0.8, 0.7, 0.6])
+        self.assertEqual(table['M', 10, 'Weight'], 14.5)
+
+    def test_table_mixed_numeric_types(self):
+        table =Table(zip([(1,), (2.5,)], [(1,), (2,)]),
+                      key_dimensions = ['x'], value_dimensions = ['y'])
+        table[3] = 0.5
+        self.assertEqual([type(k) for k in table.keys()], [int, float, int])
+        self.assertEqual([type(v[0]) for v in table.values()], [int, int, float])
+        self.assertEqual(table[1], 1)
+        self.assertIs(type(table[1]), int)
+
+    def test_table_slice_indexed_rows(self):
+        table = Table([(1, 2), (3, 4), (5, 6)], value_dimensions=['a', 'b'])
+        self.assertEqual(table[1:3].data, OrderedDict([((1,), (3, 4)), ((2,), (5, 6))]))
+
+    def test_table_slice_after_extend(self):
+        table = Table(dict((i, i*2) for i in range(5)),
+                      key_dimensions=['x'], value_dimensions=['y'])
+        table[4:10]
+        table.extend([((5,), (10,)), ((6,), (12,))])
+        self.assertEqual(table[4:10].keys(), [4, 5, 6])
+
+    def test_table_slice_after_pop(self):
+        table = Table(dict((i, i*2) for i in range(5)),
+                      key_dimensions=['x'], value_dimensions=['y'])
+        table[1:4]
+        table.pop(2)
+        self.assertEqual(table[1:4].keys(), [1, 3])
+
+    def test_table_select_value_columns(self):
+        table =Table(zip(self.keys1, self.values1),
+                      key_dimensions = self.key_dims1,
+                      value_dimensions = self.val_dims1)
+        selected = table.select(value='Height')
+        self.assertEqual(selected.value_dimensions, table.value_dimensions[1:])
+        self.assertEqual(selected.data, OrderedDict([(('F', 12), (0.8,)), (('M', 10), (0.8,)),
+                                                     (('M', 16), (0.6,))]))
+
+    def test_table_pickle(self):
+        table =Table(zip(self.keys1, self.values1),
+                      key_dimensions = self.key_dims1,
+                      value_dimensions = self.val_dims1)
+        unpickled = pickle.loads(pickle.dumps(table))
+        self.assertEqual(unpickled, table)
+        self.assertEqual(unpickled['F', 12, 'Weight'], 10)
+
+    def test_table_reduce_mean(self):
+        table =Table(zip(self.keys1, self.values1),
+                      key_dimensions = self.key_dims1,
+                      value_dimensions = self.val_dims1)
+        reduced = table.reduce(['Age'], np.mean)
+        self.assertEqual(reduced.key_dimensions, table.key_dimensions[:1])
+        self.assertEqual(reduced.data, OrderedDict([(('F',), (10., 0.8)), (('M',), (16.5, 0.7))]))
+
+    def test_table_reduce_count(self):
+        table =Table(zip(self.keys1, self.values1),
+                      key_dimensions = self.key_dims1,
+                      value_dimensions = self.val_dims1)
+        reduced = table.reduce(Age=len)
+        self.assertEqual(reduced.data, OrderedDict([(('F',), (1, 1)), (('M',), (2, 2))]))
+
+    def test_table_reduce_callable(self):
+        table =Table(zip(self.keys1, self.values1),
+                      key_dimensions = self.key_dims1,
+                      value_dimensions = self.val_dims1)
+        reduced = table.reduce(['Age'], lambda x: x[-1])
+        self.assertEqual(reduced.data, OrderedDict([(('F',), (10, 0.8)), (('M',), (18, 0.6))]))
+
+    def test_table_reduce_multiple_functions(self):
+        table =Table(zip([k + (i,) for i, k in enumerate(self.keys1)], self.values1),
+                      key_dimensions = self.key_dims1 + ['Index'],
+                      value_dimensions = self.val_dims1)
+        reduced = table.reduce(Index=np.sum, Age=np.max)
+        self.assertEqual(reduced.data, OrderedDict([(('F',), (10, 0.8)), (('M',), (18, 0.8))]))
+
+    def test_table_to_curve_grouped(self):
+        table =Table(zip(self.keys1, self.values1),
+                      key_dimensions = self.key_dims1,
+                      value_dimensions = self.val_dims1)
+        curves = table.to.curve(['Age'], ['Weight'])
+        self.assertEqual(curves.keys(), ['F', 'M'])
+        self.assertEqual(curves['M'].data, np.array([[10., 15.], [16., 18.]]))
+        self.assertEqual(curves['M'].constant_dimensions, OrderedDict())
+
+    def test_table_to_points_dimension_order(self):
+        table =Table(zip([(1, 3), (2, 4)], [(5,), (6,)]),
+                      key_dimensions = ['a', 'b'],
+                      value_dimensions = ['c'])
+        points = table.to.points(['b', 'a'], ['c'])
+        self.assertEqual(points.data, np.array([[3., 1., 5.], [4., 2., 6.]]))
+
+    def test_table_to_points_sorted(self):
+        table =Table(zip([(a, c) for a in range(2) for c in range(3)], [(i,) for i in range(6)]),
+                      key_dimensions = ['a', 'c'],
+                      value_dimensions = ['v'])
+        points = table.to.points(['c', 'a'], ['v'])
+        self.assertEqual(points.data[:, 0], np.array([0., 0., 1., 1., 2., 2.]))
+        self.assertEqual(points.data[:2], np.array([[0., 0., 0.], [0., 1., 3.]]))
+
+    def test_table_to_points_grouped_sorted(self):
+        table =Table(zip([(a, b, c) for a in range(2) for b in range(2) for c in range(2)],
+                         [(i,) for i in range(8)]),
+                      key_dimensions = ['a', 'b', 'c'],
+                      value_dimensions = ['v'])
+        points = table.to.points(['c', 'a'], ['v'])
+        self.assertEqual(points[1].data, np.array([[0., 0., 2.], [0., 1., 6.],
+                                                   [1., 0., 3.], [1., 1., 7.]]))
+
+    def test_table_to_bars_ungrouped(self):
+        table =Table(zip(self.keys1, self.values1),
+                      key_dimensions = self.key_dims1,
+                      value_dimensions = self.val_dims1)
+        bars = table.to.bars(['Gender', 'Age'], ['Height'])
+        self.assertEqual(bars.data, OrderedDict([(('F', 12), (0.8,)), (('M', 10), (0.8,)),
+                                                 (('M', 16), (0.6,))]))
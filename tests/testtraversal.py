@@ -0,0 +1,45 @@
+"""
+Unit tests of the helper functions in core.traversal
+"""
+
+from holoviews.core import HoloMap
+from holoviews.core.traversal import unique_dimkeys, bijective
+from holoviews.element import Curve
+from holoviews.element.comparison import ComparisonTestCase
+
+
+class TestUniqueDimkeys(ComparisonTestCase):
+
+    def setUp(self):
+        self.curve = Curve([(0, 1)])
+
+    def test_unique_dimkeys_mixed_subsets(self):
+        hmap1 = HoloMap([((a, b), self.curve) for a in range(2) for b in range(2)],
+                        key_dimensions=['a', 'b'])
+        hmap2 = HoloMap([(a, self.curve) for a in range(3)], key_dimensions=['a'])
+        hmap3 = HoloMap([((b, a), self.curve) for a in range(2) for b in range(1, 3)],
+                        key_dimensions=['b', 'a'])
+        dims, keys = unique_dimkeys(hmap1 + hmap2 + hmap3)
+        self.assertEqual([d.name for d in dims], ['a', 'b'])
+        self.assertEqual(keys, [(0, 0), (0, 1), (0, 2), (1, 0), (1, 1),
+                                (1, 2), (2, None)])
+
+    def test_unique_dimkeys_mixed_subsets_large(self):
+        hmap1 = HoloMap([((a, b), self.curve) for a in range(250) for b in range(200)],
+                        key_dimensions=['a', 'b'])
+        hmap2 = HoloMap([(a, self.curve) for a in range(0, 255, 2)], key_dimensions=['a'])
+        hmap3 = HoloMap([((b, a), self.curve) for a in range(125) for b in range(203)],
+                        key_dimensions=['b', 'a'])
+        hmap4 = HoloMap([((a, b, z), self.curve) for a in range(0, 250, 3)
+                         for b in range(2) for z in range(3)],
+                        key_dimensions=['a', 'b', 'z'])
+        dims, keys = unique_dimkeys(hmap1 + hmap2 + hmap3 + hmap4)
+        self.assertEqual([d.name for d in dims], ['a', 'b', 'z'])
+        self.assertEqual(len(keys), 50714)
+        self.assertEqual(keys[-1], (254, None, None))
+
+    def test_bijective(self):
+        self.assertEqual(bijective([(i, i) for i in range(1000)]), True)
+
+    def test_not_bijective(self):
+        self.assertEqual(bijective([(0, 0), (0, 1)]), False)
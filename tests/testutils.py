@@ -8,7 +8,8 @@ from unittest import SkipTest
 
 import numpy as np
 
-from holoviews.core.util import sanitize_identifier, find_range, max_range
+from holoviews.core.util import (sanitize_identifier_fn, sanitize_identifier, find_range,
+                                 max_range, nanminmax, compile_spec)
 from holoviews.element.comparison import ComparisonTestCase
 
 py_version = sys.version_info.major
@@ -285,3 +286,82 @@ class TestMaxRange(unittest.TestCase):
         lower, upper = max_range(self.ranges2)
         self.assertTrue(math.isnan(lower))
         self.assertTrue(math.isnan(upper))
+
+
+class TestNanMinMax(unittest.TestCase):
+    """
+    Tests for nanminmax function.
+    """
+
+    def setUp(self):
+        self.array = np.array([[1, np.NaN], [-2, 3.], [5, -1.], [0, np.NaN]])
+
+    def test_nanminmax(self):
+        mins, maxs = nanminmax(self.array)
+        self.assertEqual(mins.tolist(), [-2, -1])
+        self.assertEqual(maxs.tolist(), [5, 3])
+
+    def test_nanminmax_blocks(self):
+        mins, maxs = nanminmax(self.array, blocksize=3)
+        self.assertEqual(mins.tolist(), [-2, -1])
+        self.assertEqual(maxs.tolist(), [5, 3])
+
+
+class TestCompileSpec(unittest.TestCase):
+    """
+    Tests for compile_spec function.
+    """
+
+    def setUp(self):
+        from holoviews import Curve
+        self.curve = Curve([(0, 1)], group='Some group', label='A label')
+
+    def test_type_spec(self):
+        self.assertTrue(compile_spec('Curve')(self.curve))
+
+    def test_unsanitized_spec(self):
+        self.assertTrue(compile_spec('Curve.Some group.A label')(self.curve))
+
+    def test_sanitized_spec(self):
+        self.assertTrue(compile_spec('Curve.Some_group.A_label')(self.curve))
+
+    def test_wildcard_tuple_spec(self):
+        self.assertTrue(compile_spec(('Curve', '*', 'A_label'))(self.curve))
+
+    def test_mismatched_spec(self):
+        self.assertFalse(compile_spec('Curve.Other_group')(self.curve))
+
+    def test_class_spec(self):
+        from holoviews import Curve, Image
+        self.assertTrue(compile_spec(Curve)(self.curve))
+        self.assertFalse(compile_spec(Image)(self.curve))
+
+    def test_spec_memoized(self):
+        self.assertIs(compile_spec('Curve.Some_group'), compile_spec('Curve.Some_group'))
+
+
+class TestSanitizationLookup(ComparisonTestCase):
+    """
+    Tests that memoized sanitized identifiers follow parameter changes.
+    """
+
+    def tearDown(self):
+        sanitize_identifier.capitalize = True
+        sanitize_identifier_fn.capitalize = True
+        sanitize_identifier.substitutions.pop('dollar', None)
+
+    def test_lookup_invalidated_by_parameter(self):
+        self.assertEqual(sanitize_identifier('a b'), 'A_b')
+        sanitize_identifier.capitalize = False
+        self.assertEqual(sanitize_identifier('a b'), 'a_b')
+
+    def test_lookup_invalidated_by_class_parameter(self):
+        fn = sanitize_identifier_fn.instance()
+        self.assertEqual(fn('c d'), 'C_d')
+        sanitize_identifier_fn.capitalize = False
+        self.assertEqual(fn('c d'), 'c_d')
+
+    def test_lookup_invalidated_by_inplace_edit(self):
+        self.assertEqual(sanitize_identifier('$', version=3), 'dollar')
+        sanitize_identifier.substitutions['dollar'] = 'usd'
+        self.assertEqual(sanitize_identifier('$', version=3), 'usd')